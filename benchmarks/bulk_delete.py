@@ -0,0 +1,68 @@
+"""
+Compares deleting files one by one (Filelink.delete) with Client.delete_many
+against a local stand-in of the file API with injected latency and transient failures.
+
+    python benchmarks/bulk_delete.py [num_files] [latency_ms] [failure_rate]
+
+A fraction of requests (failure_rate) is answered with 503 the first time, so delete_many
+has to retry them; sequential deletes are run without failures.
+"""
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.stand_in import StandInServer  # noqa: E402
+from filestack import Client, Filelink, Security  # noqa: E402
+from filestack.polling import Backoff  # noqa: E402
+
+
+def file_routes(failure_rate):
+    failed = set()
+    lock = threading.Lock()
+
+    def delete(handler, body):
+        handle = handler.path.split('?')[0].rsplit('/', 1)[1]
+        with lock:
+            if handle not in failed and random.random() < failure_rate:
+                failed.add(handle)
+                return 503, {}, b'unavailable'
+        return 200, {}, b''
+
+    return {('DELETE', '/api/file/'): delete}
+
+
+def main():
+    num_files = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    latency = (int(sys.argv[2]) if len(sys.argv) > 2 else 10) / 1000
+    failure_rate = float(sys.argv[3]) if len(sys.argv) > 3 else 0.01
+    security = Security({'expiry': int(time.time()) + 3600, 'call': ['remove']}, 'secret')
+    handles = ['HANDLE{}'.format(num) for num in range(num_files)]
+
+    with StandInServer(file_routes(0), latency=latency) as server:
+        transport = server.transport()
+        count = min(num_files, 200)
+        start = time.perf_counter()
+        for handle in handles[:count]:
+            Filelink(handle, apikey='APIKEY', security=security, transport=transport).delete()
+        elapsed = time.perf_counter() - start
+        print('{:<32} {:>8.0f} deletes/s'.format('Filelink.delete (sequential)', count / elapsed))
+
+    for max_requests in (8, 32, 64):
+        with StandInServer(file_routes(failure_rate), latency=latency) as server:
+            client = Client('APIKEY', security=security, pool_size=max_requests)
+            client.transport = server.transport(pool_size=max_requests)
+            start = time.perf_counter()
+            report = client.delete_many(handles, max_requests=max_requests, retry_backoff=Backoff(initial=0.01))
+            elapsed = time.perf_counter() - start
+            retried = sum(1 for result in report if result.attempts > 1)
+            print('{:<32} {:>8.0f} deletes/s  {} failed, {} retried'.format(
+                'delete_many (max_requests={})'.format(max_requests), num_files / elapsed, len(report.failed), retried
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Compares generating signed transformation URLs one object at a time with bulk generation.
+
+    python benchmarks/bulk_urls.py [num_handles]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from filestack import Filelink, Security, TransformationTemplate, urls  # noqa: E402
+
+SECURITY = Security({'expiry': 1893456000, 'call': ['read', 'convert']}, 'SECRET')
+
+
+def per_object(handles):
+    return [Filelink(handle).resize(width=400).flip().signed_url(SECURITY) for handle in handles]
+
+
+def bulk(handles):
+    return urls.build_many(handles, transformation=TransformationTemplate().resize(width=400).flip(), security=SECURITY)
+
+
+def main():
+    num_handles = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    handles = ['HANDLE{:014d}'.format(i) for i in range(num_handles)]
+
+    results = []
+    for name, generate in (('per-object', per_object), ('urls.build_many', bulk)):
+        start = time.perf_counter()
+        results.append(generate(handles))
+        elapsed = time.perf_counter() - start
+        print('{:<16} {:>9} urls  {:7.3f}s  {:6.2f}M urls/s'.format(
+            name, num_handles, elapsed, num_handles / elapsed / 1e6
+        ))
+
+    assert results[0] == results[1], 'URLs differ'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Measures MD5 throughput of upload chunks of a large local file as the number of cores grows,
+hashing memoryviews of the mapped file in threads (hashlib releases the GIL)
+and handing regions off to ProcessHasher workers.
+
+    python benchmarks/chunk_hashing.py [size_gb] [chunk_mb]
+
+A temporary file of the given size is created (and removed afterwards); the first pass
+over it warms the page cache, so the results measure hashing rather than disk reads.
+"""
+import os
+import sys
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from filestack.uploads.buffers import MappedFile  # noqa: E402
+from filestack.uploads.hashing import ProcessHasher, md5_b64  # noqa: E402
+
+MB = 1024 ** 2
+GB = 1024 ** 3
+
+
+def hash_chunks(path, chunk_size, workers, hasher=None):
+    with MappedFile(path) as mapped:
+        offsets = range(0, mapped.size, chunk_size)
+
+        def hash_chunk(offset):
+            view = mapped.slice(offset, chunk_size)
+            try:
+                if hasher is None:
+                    return md5_b64(view)
+                return hasher.md5(view, filepath=path, offset=offset)
+            finally:
+                view.release()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(hash_chunk, offsets))
+        return mapped.size / (time.perf_counter() - start)
+
+
+def main():
+    size = int(float(sys.argv[1]) * GB) if len(sys.argv) > 1 else 2 * GB
+    chunk_size = int(sys.argv[2]) * MB if len(sys.argv) > 2 else 8 * MB
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, cores} & set(range(1, cores + 1)))
+
+    with tempfile.NamedTemporaryFile() as f:
+        block = os.urandom(64 * MB)
+        for _ in range(0, size, len(block)):
+            f.write(block)
+        f.flush()
+
+        hash_chunks(f.name, chunk_size, 1)  # warm the page cache
+        print('{:.1f} GB file, {} MB chunks, {} CPUs'.format(size / GB, chunk_size // MB, cores))
+        print('{:>8}  {:>16}  {:>16}'.format('workers', 'threads', 'processes'))
+        for count in counts:
+            threaded = hash_chunks(f.name, chunk_size, count)
+            with ProcessHasher(workers=count) as hasher:
+                hasher.md5(b'\0' * MB, filepath=f.name, offset=0)  # start workers outside of measurement
+                processes = hash_chunks(f.name, chunk_size, count, hasher=hasher)
+            print('{:>8}  {:>11.2f} GB/s  {:>11.2f} GB/s'.format(count, threaded / GB, processes / GB))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Compares reading chunks of a local file the old way (chunk re-read from disk for size, md5 and body)
+with memory mapped chunks (each region paged in once, hashed and sent as memoryview slices).
+
+    python benchmarks/chunk_reading.py [size_mb]
+
+Reports bytes copied through read() syscalls (from /proc/self/io, Linux only; mapped pages
+are faulted in by the kernel once instead) and peak Python allocations per GB of uploaded data. Sending is simulated
+by reading request body in 64 KB blocks, the way http.client sends file-like bodies.
+"""
+import os
+import sys
+import time
+import hashlib
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from filestack import config  # noqa: E402
+from filestack.uploads.buffers import MappedFile, as_body  # noqa: E402
+
+MB = 1024 ** 2
+GB = 1024 ** 3
+BLOCK = 64 * 1024
+
+
+def read_chars():
+    try:
+        with open('/proc/self/io') as f:
+            return int(dict(line.split(': ') for line in f.read().splitlines())['rchar'])
+    except (OSError, KeyError):
+        return 0
+
+
+def send(body):
+    if hasattr(body, 'read'):
+        while body.read(BLOCK):
+            pass
+    else:
+        view = memoryview(body)
+        for offset in range(0, len(view), BLOCK):
+            view[offset:offset + BLOCK]
+
+
+def read_chunk(filepath, seek_point):
+    with open(filepath, 'rb') as f:
+        f.seek(seek_point)
+        return f.read(config.DEFAULT_CHUNK_SIZE)
+
+
+def legacy(filepath, filesize):
+    for seek_point in range(0, filesize, config.DEFAULT_CHUNK_SIZE):
+        len(read_chunk(filepath, seek_point))
+        hashlib.md5(read_chunk(filepath, seek_point)).digest()
+        send(read_chunk(filepath, seek_point))
+
+
+def mapped(filepath, filesize):
+    with MappedFile(filepath) as mapped_file:
+        for seek_point in range(0, filesize, config.DEFAULT_CHUNK_SIZE):
+            data = mapped_file.slice(seek_point, config.DEFAULT_CHUNK_SIZE)
+            len(data)
+            hashlib.md5(data).digest()
+            send(as_body(data))
+            data.release()
+
+
+def main():
+    size = (int(sys.argv[1]) if len(sys.argv) > 1 else 512) * MB
+    with tempfile.NamedTemporaryFile() as f:
+        block = os.urandom(MB)
+        for _ in range(size // MB):
+            f.write(block)
+        f.flush()
+
+        for name, func in (('re-read chunks', legacy), ('memory mapped', mapped)):
+            tracemalloc.start()
+            rchar = read_chars()
+            start = time.perf_counter()
+            func(f.name, size)
+            elapsed = time.perf_counter() - start
+            read_bytes = read_chars() - rchar
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print('{:<16} read {:8.1f} MB/GB  peak allocations {:6.1f} MB  {:6.0f} MB/s'.format(
+                name, read_bytes / MB * GB / size, peak / MB, size / MB / elapsed
+            ))
+
+
+if __name__ == '__main__':
+    main()
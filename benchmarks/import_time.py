@@ -0,0 +1,56 @@
+"""
+Tracks import time of the package, as reported by ``python -X importtime``.
+
+    python benchmarks/import_time.py [runs]
+
+Every scenario runs in a fresh interpreter; reported time is the median of
+cumulative times of all modules imported by the scenario (interpreter startup excluded).
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+SCENARIOS = [
+    ('import filestack', 'import filestack'),
+    ('Security', 'import filestack; filestack.Security({"expiry": 1}, "secret").as_url_string()'),
+    ('Filelink url', 'import filestack; filestack.Filelink("HANDLE").resize(width=100).url'),
+    ('Client', 'import filestack; filestack.Client("APIKEY")'),
+]
+
+
+def import_time(code):
+    """
+    Returns total import time (in microseconds) and imported third party modules of code run in a new interpreter
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, stderr=subprocess.PIPE, check=True,
+        universal_newlines=True
+    )
+    total, modules, started = 0, [], False
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if not started:
+            started = name.strip() == 'site'
+            continue
+        if not name.startswith('  '):  # top level imports, nested ones are included in their cumulative time
+            total += int(cumulative)
+        modules.append(name.strip())
+    return total, modules
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for name, code in SCENARIOS:
+        samples = [import_time(code) for _ in range(runs)]
+        median = statistics.median(total for total, _ in samples)
+        heavy = [module for module in ('requests', 'trafaret', 'concurrent.futures') if module in samples[-1][1]]
+        print('{:<18} {:8.1f} ms   loads: {}'.format(name, median / 1000, ', '.join(heavy) or '-'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Compares multipart upload throughput with and without pipelined chunk signing
+as the round-trip time to the API grows.
+
+    python benchmarks/pipelined_upload.py [size_mb] [chunk_kb] [rtt_ms ...]
+
+Every request to the local stand-in is delayed by the given RTT. Without pipelining
+each upload thread waits for the /multipart/upload round-trip before sending its chunk;
+with pipelining URLs of upcoming chunks are requested ahead while previous chunks are sent.
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.stand_in import StandInServer, multipart_routes  # noqa: E402
+from filestack import config  # noqa: E402
+from filestack.uploads.multipart import multipart_upload  # noqa: E402
+
+
+def run(server, data, pipelined):
+    transport = server.transport(pool_size=32)
+    start = time.perf_counter()
+    multipart_upload(
+        'APIKEY', None, io.BytesIO(data), 'S3', transport=transport, pipelined=pipelined, sign_workers=8
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    config.DEFAULT_CHUNK_SIZE = (int(sys.argv[2]) if len(sys.argv) > 2 else 256) * 1024
+    rtts = [int(rtt) for rtt in sys.argv[3:]] or [0, 10, 25, 50, 100]
+    data = os.urandom(size_mb * 1024 * 1024)
+
+    print('{:>8}  {:>18}  {:>18}'.format('RTT', 'sequential', 'pipelined'))
+    for rtt in rtts:
+        with StandInServer(multipart_routes(), latency=rtt / 1000, keep_bodies=False) as server:
+            results = [size_mb / run(server, data, pipelined) for pipelined in (False, True)]
+        print('{:>6}ms  {:>13.1f} MB/s  {:>13.1f} MB/s'.format(rtt, *results))
+
+
+if __name__ == '__main__':
+    main()
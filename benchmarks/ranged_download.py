@@ -0,0 +1,65 @@
+"""
+Compares a single streamed download with parallel range requests.
+
+    python benchmarks/ranged_download.py [size_mb] [stream_mbps] [workers]
+
+The stand-in caps the throughput of every response at ``stream_mbps`` to mimic
+per-connection limits of a CDN edge; parallel ranges add up those per-connection rates.
+"""
+import os
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.stand_in import StandInServer  # noqa: E402
+from filestack.downloads.ranged import parallel_download, stream_download  # noqa: E402
+
+MB = 1024 ** 2
+
+
+def file_routes(content, stream_rate):
+    def get(handler, body):
+        match = re.match(r'bytes=(\d+)-(\d+)', handler.headers.get('Range', ''))
+        if match:
+            start, end = map(int, match.groups())
+            status, data = 206, content[start:end + 1]
+        else:
+            status, data = 200, content
+        time.sleep(len(data) / stream_rate)
+        return status, {'Accept-Ranges': 'bytes', 'ETag': '"v1"'}, data
+
+    def head(handler, body):
+        return 200, {'Accept-Ranges': 'bytes', 'ETag': '"v1"'}, content
+
+    return {('GET', '/'): get, ('HEAD', '/'): head}
+
+
+def main():
+    size = int(sys.argv[1]) * MB if len(sys.argv) > 1 else 64 * MB
+    stream_rate = float(sys.argv[2]) * MB if len(sys.argv) > 2 else 50 * MB
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    content = os.urandom(size)
+
+    with StandInServer(file_routes(content, stream_rate)) as server, tempfile.TemporaryDirectory() as directory:
+        url = 'https://cdn.filestackcontent.com/HANDLE'
+        path = os.path.join(directory, 'file')
+        transport = server.transport(pool_size=workers)
+        for name, download in (
+            ('single stream', lambda: stream_download(url, path, transport=transport)),
+            ('parallel ranges', lambda: parallel_download(url, path, transport=transport, workers=workers)),
+        ):
+            start = time.perf_counter()
+            total_bytes = download()
+            elapsed = time.perf_counter() - start
+            with open(path, 'rb') as f:
+                assert f.read() == content
+            print('{:<16} {:>6} MB  {:7.3f}s  {:8.1f} MB/s'.format(
+                name, total_bytes // MB, elapsed, total_bytes / MB / elapsed
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Measures how many signed URLs per second can be generated.
+
+    python benchmarks/signed_urls.py [num_urls] [distinct_policies]
+
+Compares signing every URL from scratch (memoization disabled) with the memoized
+signing path, and with one Security object shared by many URLs.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from filestack import Filelink, Security  # noqa: E402
+from filestack.models import security as security_module  # noqa: E402
+
+EXPIRY = 1893456000
+
+
+def run(name, num_urls, make_url):
+    start = time.perf_counter()
+    for i in range(num_urls):
+        make_url(i)
+    elapsed = time.perf_counter() - start
+    print('{:<22} {:>8} urls  {:7.3f}s  {:10.0f} urls/s'.format(name, num_urls, elapsed, num_urls / elapsed))
+
+
+def main():
+    num_urls = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    filelinks = [Filelink('HANDLE{}'.format(i)) for i in range(distinct)]
+    policies = [{'expiry': EXPIRY, 'call': ['read', 'convert'], 'handle': f.handle} for f in filelinks]
+
+    def sign_each(i):
+        return filelinks[i % distinct].signed_url(Security(policies[i % distinct], 'SECRET'))
+
+    sign_policy = security_module.sign_policy
+    security_module.sign_policy = sign_policy.__wrapped__
+    try:
+        run('new Security, uncached', num_urls, sign_each)
+    finally:
+        security_module.sign_policy = sign_policy
+
+    run('new Security, cached', num_urls, sign_each)
+
+    shared = Security.sign_many(policies, 'SECRET')
+    run('shared Security', num_urls, lambda i: filelinks[i % distinct].signed_url(shared[i % distinct]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""
+Local stand-in for Filestack HTTP endpoints, used by benchmark scripts.
+
+Routes are registered as ``(method, path_prefix) -> handler`` where handler receives
+the request handler instance and the request body and returns ``(status, headers, body)``.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from filestack.utils import RequestsWrapper, DEFAULT_POOL_SIZE
+
+
+class RedirectAdapter(HTTPAdapter):
+    """
+    Sends every request to the stand-in server, keeping only path and query of the original url
+    """
+    def __init__(self, base_url, **kwargs):
+        self.base_url = urlsplit(base_url)
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        url = urlsplit(request.url)
+        request.url = urlunsplit((self.base_url.scheme, self.base_url.netloc, url.path, url.query, ''))
+        return super().send(request, **kwargs)
+
+
+def multipart_routes():
+    """
+    Routes faking multipart upload endpoints (start, upload, storage PUT, commit, complete)
+    """
+    def start(handler, body):
+        return 200, {}, {'uri': '/uri', 'region': 'us-east-1', 'upload_id': 'upload-id', 'location_url': 'upload.local'}
+
+    def upload(handler, body):
+        return 200, {}, {'url': 'https://storage.local/s3/part', 'headers': {}}
+
+    def put(handler, body):
+        return 200, {'ETag': '"etag"'}, b''
+
+    def commit(handler, body):
+        return 200, {}, b''
+
+    def complete(handler, body):
+        return 200, {}, {'handle': 'HANDLE', 'url': 'https://cdn.filestackcontent.com/HANDLE'}
+
+    return {
+        ('POST', '/multipart/start'): start,
+        ('POST', '/multipart/upload'): upload,
+        ('PUT', '/s3/'): put,
+        ('POST', '/multipart/commit'): commit,
+        ('POST', '/multipart/complete'): complete,
+    }
+
+
+class StandInServer:
+    def __init__(self, routes=None, latency=0, keep_bodies=True):
+        self.routes = routes or {}
+        self.latency = latency
+        self.keep_bodies = keep_bodies
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self._server.server_port)
+
+    def transport(self, pool_size=None):
+        """
+        Returns a RequestsWrapper that sends all SDK requests (https API and storage urls) to this server
+        """
+        session = requests.Session()
+        adapter = RedirectAdapter(self.url, pool_maxsize=pool_size or DEFAULT_POOL_SIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return RequestsWrapper(session=session)
+
+    def reset_counters(self):
+        with self._lock:
+            self.connections = 0
+            self.requests = 0
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            def _dispatch(self):
+                with server._lock:
+                    server.requests += 1
+                length = int(self.headers.get('Content-Length') or 0)
+                if server.keep_bodies:
+                    body = self.rfile.read(length) if length else b''
+                else:
+                    body = b''
+                    while length > 0:
+                        length -= len(self.rfile.read(min(length, 64 * 1024)))
+                if server.latency:
+                    time.sleep(server.latency)
+
+                route = None
+                for (method, prefix), handler in server.routes.items():
+                    if method == self.command and self.path.startswith(prefix):
+                        route = handler
+                        break
+
+                if route is None:
+                    status, headers, response_body = 404, {}, b''
+                else:
+                    status, headers, response_body = route(self, body)
+
+                if isinstance(response_body, (dict, list)):
+                    response_body = json.dumps(response_body).encode()
+                    headers = dict(headers, **{'Content-Type': 'application/json'})
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(response_body)))
+                self.end_headers()
+                if self.command != 'HEAD':
+                    self.wfile.write(response_body)
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _dispatch
+
+        return Handler
@@ -0,0 +1,45 @@
+"""
+Shows that peak memory of streaming multipart uploads does not depend on file size.
+
+    python benchmarks/streaming_memory.py [size_mb ...]
+
+Content is generated on the fly from a non-seekable iterable and uploaded
+to a local stand-in of the multipart endpoints.
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.stand_in import StandInServer, multipart_routes  # noqa: E402
+from filestack.uploads.multipart import multipart_upload  # noqa: E402
+
+MB = 1024 ** 2
+
+
+def generate(size, block=MB):
+    block_data = b'x' * block
+    for _ in range(size // block):
+        yield block_data
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [64, 256, 1024]
+    with StandInServer(multipart_routes(), keep_bodies=False) as server:
+        transport = server.transport()
+        for size_mb in sizes:
+            tracemalloc.start()
+            start = time.perf_counter()
+            multipart_upload(
+                'APIKEY', None, generate(size_mb * MB), 'S3', transport=transport, size=size_mb * MB
+            )
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print('{:>6} MB uploaded  peak allocations {:7.1f} MB  {:6.2f}s'.format(size_mb, peak / MB, elapsed))
+
+
+if __name__ == '__main__':
+    main()
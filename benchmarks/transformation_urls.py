@@ -0,0 +1,115 @@
+"""
+Compares throughput of the transformation URL builder with the previous implementation
+and checks that both produce identical URLs.
+
+    python benchmarks/transformation_urls.py [num_urls]
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import filestack.models  # noqa: E402
+from filestack import config, Filelink, Security, Transformation  # noqa: E402
+from filestack.mixins import ImageTransformationMixin  # noqa: E402
+
+SECURITY = Security({'expiry': 1893456000, 'call': ['read', 'convert']}, 'SECRET')
+WIDTHS = [64, 128, 256, 512, 1024]
+
+
+def legacy_return_transform_task(transformation, params):
+    transform_tasks = []
+
+    for key, value in params.items():
+        if isinstance(value, list):
+            value = str(value).replace("'", "").replace('"', '').replace(" ", "")
+        if isinstance(value, bool):
+            value = str(value).lower()
+
+        transform_tasks.append('{}:{}'.format(key, value))
+
+    transform_tasks = sorted(transform_tasks)
+
+    if len(transform_tasks) > 0:
+        transformation_url = '{}={}'.format(transformation, ','.join(transform_tasks))
+    else:
+        transformation_url = transformation
+
+    return transformation_url
+
+
+def legacy_add_transform_task(self, transformation, params):
+    if isinstance(self, filestack.models.Transformation):
+        instance = self
+    else:
+        instance = filestack.models.Transformation(
+            apikey=None, security=self.security, handle=self.handle, transport=self.transport
+        )
+
+    params.pop('self')
+    params = {k: v for k, v in params.items() if v is not None}
+
+    transformation_url = legacy_return_transform_task(transformation, params)
+    instance._transformation_tasks.append(transformation_url)
+
+    return instance
+
+
+def legacy_build_url(self, security=None):
+    url_elements = [config.CDN_URL, self.handle or self.external_url]
+
+    if self._transformation_tasks:
+        tasks_str = '/'.join(self._transformation_tasks)
+        url_elements.insert(1, tasks_str)
+
+    if self.external_url:
+        url_elements.insert(1, self.apikey)
+
+    if security is not None:
+        url_elements.insert(-1, security.as_url_string())
+    return '/'.join(url_elements)
+
+
+@contextmanager
+def legacy_builder():
+    add_transform_task, build_url = ImageTransformationMixin._add_transform_task, Transformation._build_url
+    ImageTransformationMixin._add_transform_task = legacy_add_transform_task
+    Transformation._build_url = legacy_build_url
+    try:
+        yield
+    finally:
+        ImageTransformationMixin._add_transform_task, Transformation._build_url = add_transform_task, build_url
+
+
+def thumbnail_urls(filelinks, num_urls):
+    urls = []
+    for i in range(num_urls):
+        transformation = filelinks[i % len(filelinks)].resize(width=WIDTHS[i % len(WIDTHS)], fit='crop')
+        transformation = transformation.sharpen(amount=2).filetype_conversion(format='webp', compress=True)
+        urls.append(transformation.url)
+        urls.append(transformation.signed_url(SECURITY))
+    return urls
+
+
+def main():
+    num_urls = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    filelinks = [Filelink('HANDLE{}'.format(i)) for i in range(1000)]
+
+    results = {}
+    for name, context in (('previous builder', legacy_builder), ('current builder', contextmanager(lambda: (yield)))):
+        with context():
+            start = time.perf_counter()
+            results[name] = thumbnail_urls(filelinks, num_urls)
+            elapsed = time.perf_counter() - start
+        print('{:<18} {:>8} urls  {:7.3f}s  {:10.0f} urls/s'.format(
+            name, len(results[name]), elapsed, len(results[name]) / elapsed
+        ))
+
+    assert results['previous builder'] == results['current builder'], 'builders produced different urls'
+    print('urls identical')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Compares webhook verifications per second of verify_webhook_signature
+with a shared WebhookVerifier (single and batch calls).
+
+    python benchmarks/webhook_verification.py [num_events] [body_size]
+"""
+import hashlib
+import hmac
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from filestack.helpers import WebhookVerifier, verify_webhook_signature  # noqa: E402
+
+SECRET = 'webhook-secret'
+
+
+def make_events(num_events, body_size):
+    events = []
+    for num in range(num_events):
+        body = b'{"id": %d, "text": "%s"}' % (num, b'x' * body_size)
+        timestamp = str(1558367878 + num)
+        signature = hmac.new(SECRET.encode(), timestamp.encode() + b'.' + body, hashlib.sha256).hexdigest()
+        events.append((body, {'FS-Signature': signature, 'FS-Timestamp': timestamp}))
+    return events
+
+
+def measure(name, func, events):
+    start = time.perf_counter()
+    results = func(events)
+    elapsed = time.perf_counter() - start
+    assert all(result for result, _ in results)
+    print('{:<28} {:>10.0f} verifications/s'.format(name, len(events) / elapsed))
+
+
+def main():
+    num_events = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    body_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1024
+    events = make_events(num_events, body_size)
+    verifier = WebhookVerifier(SECRET)
+    verify_webhook_signature(SECRET, *events[0])  # import trafaret outside of measurement
+
+    measure('verify_webhook_signature', lambda events: [
+        verify_webhook_signature(SECRET, body, headers) for body, headers in events
+    ], events)
+    measure('WebhookVerifier.verify', lambda events: [
+        verifier.verify(body, headers) for body, headers in events
+    ], events)
+    measure('WebhookVerifier.verify_many', verifier.verify_many, events)
+
+
+if __name__ == '__main__':
+    main()
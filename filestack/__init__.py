@@ -1,3 +1,5 @@
+import importlib
+
 __version__ = '4.0.0'
 
 
@@ -28,10 +30,34 @@ class CFG:
 config = CFG()
 
 
-from .models.client import Client
-from .models.filelink import Filelink
-from .models.security import Security
-from .models.transformation import Transformation
-from .models.audiovisual import AudioVisual
-from .mixins.common import CommonMixin
-from .mixins.imagetransformation import ImageTransformationMixin
+# Public classes are imported on first access (PEP 562), so importing the package
+# (e.g. only to build URLs or sign policies) doesn't load HTTP and upload machinery.
+_LAZY_ATTRIBUTES = {
+    'Client': 'filestack.models.client',
+    'Filelink': 'filestack.models.filelink',
+    'Security': 'filestack.models.security',
+    'SecurityFactory': 'filestack.models.security',
+    'Transformation': 'filestack.models.transformation',
+    'TransformationTemplate': 'filestack.models.template',
+    'AudioVisual': 'filestack.models.audiovisual',
+    'ConversionTracker': 'filestack.models.audiovisual',
+    'ContentCache': 'filestack.cache',
+    'MetadataCache': 'filestack.cache',
+    'CommonMixin': 'filestack.mixins.common',
+    'ImageTransformationMixin': 'filestack.mixins.imagetransformation',
+}
+
+__all__ = ['config'] + list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
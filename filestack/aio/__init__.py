@@ -0,0 +1,3 @@
+from .client import AsyncClient
+from .filelink import AsyncFilelink
+from .audiovisual import AsyncAudioVisual
@@ -0,0 +1,99 @@
+import asyncio
+import itertools
+
+import filestack.aio
+from filestack.models.audiovisual import CONVERSION_BACKOFF, ConversionFailed
+
+
+class AsyncAudioVisual:
+    """
+    Asyncio counterpart of :class:`filestack.AudioVisual`
+
+    >>> av_convert = await filelink.av_convert(width=100, height=100)
+    >>> filelink = await av_convert.wait()
+    """
+    def __init__(self, url, uuid, timestamp, apikey=None, security=None, transport=None):
+        self.url = url
+        self.apikey = apikey
+        self.security = security
+        self.uuid = uuid
+        self.timestamp = timestamp
+        self.transport = transport
+        self.last_response = None
+
+    async def refresh(self):
+        """
+        Fetches conversion status (makes a GET request) and stores the response in `last_response`
+
+        Returns:
+            dict: status response
+        """
+        self.last_response = await self.transport.json('GET', self.url)
+        return self.last_response
+
+    async def status(self):
+        """
+        Returns the status of the AV conversion (makes a GET request)
+
+        Returns:
+            str: conversion status
+        """
+        response = await self.refresh()
+        return response['status']
+
+    async def to_filelink(self):
+        """
+        Checks is the status of the conversion is complete and, if so, converts to a Filelink.
+        The status is checked again only if the last fetched response wasn't completed
+
+        Returns:
+            :class:`filestack.aio.AsyncFilelink`
+        """
+        response = self.last_response
+        if response is None or response['status'] != 'completed':
+            response = await self.refresh()
+        if response['status'] != 'completed':
+            raise Exception('Audio/video conversion not complete!')
+
+        return self._make_filelink(response)
+
+    def _make_filelink(self, response):
+        handle = response['data']['url'].split('/')[-1]
+        return filestack.aio.AsyncFilelink(
+            handle, apikey=self.apikey, security=self.security, transport=self.transport
+        )
+
+    async def wait(self, timeout=None, poll_strategy=None, *, interval=None):
+        """
+        Polls conversion status with exponential backoff without blocking the event loop
+        and returns converted file once the conversion is completed.
+        Many conversions can be awaited concurrently (e.g. with :func:`asyncio.gather`) on one event loop.
+
+        Args:
+            timeout (float): maximum number of seconds to wait, :class:`TimeoutError` is raised afterwards
+                (defaults to deadline of `poll_strategy`)
+            poll_strategy (:class:`filestack.polling.Backoff`): delays between status checks,
+                defaults to :data:`filestack.models.audiovisual.CONVERSION_BACKOFF`
+            interval (float): fixed number of seconds between status checks, used instead of backoff
+
+        Returns:
+            :class:`filestack.aio.AsyncFilelink`
+        """
+        poll_strategy = poll_strategy or CONVERSION_BACKOFF
+        if timeout is None:
+            timeout = poll_strategy.deadline
+
+        async def poll():
+            for attempt in itertools.count():
+                response = await self.refresh()
+                if response['status'] == 'completed':
+                    return response
+                if response['status'] == 'failed':
+                    raise ConversionFailed('Audio/video conversion {} failed'.format(self.uuid))
+                await asyncio.sleep(poll_strategy.delay(attempt) if interval is None else interval)
+
+        try:
+            response = await asyncio.wait_for(poll(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError('Audio/video conversion not completed within {}s'.format(timeout)) from None
+        return self._make_filelink(response)
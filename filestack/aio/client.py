@@ -0,0 +1,127 @@
+from filestack import config
+from filestack.trafarets import STORE_LOCATION_SCHEMA, STORE_SCHEMA
+from filestack.models.client import build_zip_url
+from filestack.uploads.external_url import make_process_payload
+from filestack.aio.utils import AsyncRequestsWrapper
+from filestack.aio.filelink import AsyncFilelink
+from filestack.aio.multipart import multipart_upload
+
+
+class AsyncClient:
+    """
+    Asyncio counterpart of :class:`filestack.Client`.
+
+    All uploads started from one client share a single connection pool,
+    so many of them can run concurrently on one event loop.
+    Requires `aiohttp <https://docs.aiohttp.org>`_ (``pip install filestack-python[async]``).
+
+    >>> from filestack.aio import AsyncClient
+    >>> async with AsyncClient('<FILESTACK_APIKEY>') as cli:
+    ...     filelink = await cli.upload(filepath='path/to/video.mp4')
+    """
+    def __init__(self, apikey, storage='S3', security=None, pool_size=None, max_concurrency=None):
+        """
+        Args:
+            apikey (str): your Filestack API key
+            storage (str): default storage to be used for uploads (one of S3, `gcs`, dropbox, azure)
+            security (:class:`filestack.Security`): Security object that will be used by default
+                for all API calls
+            pool_size (int): maximum number of connections open at the same time (shared by all uploads)
+            max_concurrency (int): maximum number of chunks uploaded concurrently for a single file.
+                Defaults to cpu count
+        """
+        self.apikey = apikey
+        self.security = security
+        STORE_LOCATION_SCHEMA.check(storage)
+        self.storage = storage
+        self.max_concurrency = max_concurrency
+        self.transport = AsyncRequestsWrapper(pool_size=pool_size)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes underlying HTTP session
+        """
+        await self.transport.close()
+
+    async def zip(self, destination_path, files, security=None):
+        """
+        Takes array of handles and downloads a compressed ZIP archive
+        to provided path
+
+        Args:
+            destination_path (str): path where the ZIP file should be stored
+            file (list): list of filelink handles and/or URLs
+            security (:class:`filestack.Security`): Security object that will be used
+                for this API call
+
+        Returns:
+            int: ZIP archive size in bytes
+        """
+        zip_url = build_zip_url(self.apikey, files, security=security or self.security)
+        return await self.transport.download(zip_url, destination_path)
+
+    async def upload_url(self, url, store_params=None, security=None):
+        """
+        Uploads file from external url
+
+        Args:
+            url (str): file URL
+            store_params (dict): store parameters to be used during upload
+            security (:class:`filestack.Security`): Security object that will be used for this API call
+
+        Returns:
+            :class:`filestack.aio.AsyncFilelink`: new AsyncFilelink object
+        """
+        sec = security or self.security
+        payload = make_process_payload(url, self.apikey, self.storage, store_params, security=sec)
+        upload_response = await self.transport.json('POST', '{}/process'.format(config.CDN_URL), json=payload)
+        return AsyncFilelink(
+            upload_response['handle'],
+            apikey=self.apikey,
+            security=sec,
+            upload_response=upload_response,
+            transport=self.transport
+        )
+
+    async def upload(self, *, filepath=None, file_obj=None, store_params=None, security=None,
+                     completion_backoff=None):
+        """
+        Uploads local file or file-like object.
+
+        Args:
+            filepath (str): path to file
+            file_obj (io.BytesIO or similar): file-like object
+            store_params (dict): store parameters to be used during upload
+            security (:class:`filestack.Security`): Security object that will be used for this API call
+            completion_backoff (:class:`filestack.polling.Backoff`): delays and deadline of polling
+                for completion, while the uploaded file is assembled
+
+        Returns:
+            :class:`filestack.aio.AsyncFilelink`: new AsyncFilelink object
+
+        Note:
+            This method accepts keyword arguments only.
+            Out of filepath and file_obj only one should be provided.
+        """
+        if store_params:  # Check the structure of parameters
+            STORE_SCHEMA.check(store_params)
+
+        response_json = await multipart_upload(
+            self.apikey, filepath, file_obj, self.storage, params=store_params,
+            security=security or self.security, transport=self.transport, max_concurrency=self.max_concurrency,
+            backoff=completion_backoff
+        )
+
+        return AsyncFilelink(
+            response_json['handle'],
+            apikey=self.apikey,
+            security=self.security,
+            upload_response=response_json,
+            transport=self.transport
+        )
@@ -0,0 +1,158 @@
+import filestack.models
+from filestack import config, utils
+from filestack.models.filelink import metadata_params, delete_params, overwrite_params
+from filestack.aio.utils import aiohttp, AsyncRequestsWrapper
+from filestack.aio.audiovisual import AsyncAudioVisual
+
+
+class AsyncFilelink:
+    """
+    Asyncio counterpart of :class:`filestack.Filelink`.
+    Network operations are coroutines, url building works the same as for Filelinks.
+
+    >>> from filestack.aio import AsyncFilelink
+    >>> async with AsyncFilelink('sm9IEXAMPLEQuzfJykmA') as flink:
+    ...     content = await flink.get_content()
+
+    A Filelink created without a transport opens its own HTTP session, which is closed by :meth:`close`
+    (or when leaving the ``async with`` block). Filelinks created by :class:`filestack.aio.AsyncClient`
+    share the client's session, which is closed with the client.
+    """
+    def __init__(self, handle, apikey=None, security=None, upload_response=None, transport=None):
+        """
+        Args:
+            handle (str): The path of the file to wrap
+            apikey (str): Filestack API key that may be required for some API calls
+            security (:class:`filestack.Security`): Security object that will be used by default
+               for all API calls
+            transport (:class:`filestack.aio.utils.AsyncRequestsWrapper`): wrapper (usually shared with
+               a :class:`filestack.aio.AsyncClient`) used to send API calls. If not provided,
+               the filelink opens its own session and has to be closed
+        """
+        self.apikey = apikey
+        self.handle = handle
+        self.security = security
+        self.upload_response = upload_response
+        self._owns_transport = transport is None
+        self.transport = transport or AsyncRequestsWrapper()
+
+    def __repr__(self):
+        return '<AsyncFilelink {}>'.format(self.handle)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes HTTP session opened by the filelink (a transport passed to the filelink is left open)
+        """
+        if self._owns_transport:
+            await self.transport.close()
+
+    _build_url = filestack.models.Filelink._build_url
+    url = filestack.models.Filelink.url
+    signed_url = filestack.models.Filelink.signed_url
+
+    async def download(self, path, security=None):
+        """
+        Downloads a file to the given local path and returns the size of the downloaded file if successful
+        """
+        return await self.transport.download(self._build_url(security=security or self.security), path)
+
+    async def get_content(self, security=None):
+        """
+        Returns the raw byte content of a given object
+
+        Returns:
+            `bytes`: file content
+        """
+        return await self.transport.read('GET', self._build_url(security=security or self.security))
+
+    async def metadata(self, attributes_list=None, security=None):
+        """
+        Retrieves filelink's metadata.
+
+        Args:
+            attributes_list (list): list of attributes that you wish to receive. When not provided,
+                default set of parameters will be returned (may differ depending on your storage settings)
+            security (:class:`filestack.Security`): Security object that will be used
+                to retrieve metadata
+
+        Returns:
+            `dict`: file metadata
+        """
+        params = metadata_params(attributes_list, security or self.security)
+        return await self.transport.json('GET', self.url + '/metadata', params=params)
+
+    async def delete(self, apikey=None, security=None):
+        """
+        Deletes filelink.
+
+        Args:
+            apikey (str): Filestack API key that will be used for this API call
+            security (:class:`filestack.Security`): Security object that will be used
+                to delete filelink
+        """
+        params = delete_params(apikey or self.apikey, security or self.security)
+        url = '{}/file/{}'.format(config.API_URL, self.handle)
+        response = await self.transport.request('DELETE', url, params=params)
+        response.release()
+
+    async def overwrite(self, *, filepath=None, url=None, file_obj=None, base64decode=False, security=None):
+        """
+        Overwrites filelink with new content
+
+        Args:
+            filepath (str): path to file
+            url (str): file URL
+            file_obj (io.BytesIO or similar): file-like object
+            base64decode (bool): indicates if content should be decoded before it is stored
+            security (:class:`filestack.Security`): Security object that will be used
+                to overwrite filelink
+
+        Note:
+            This method accepts keyword arguments only.
+            Out of filepath, url and file_obj only one should be provided.
+        """
+        req_params = overwrite_params(security or self.security, base64decode)
+        request_url = '{}/file/{}'.format(config.API_URL, self.handle)
+
+        if url:
+            data = {'url': url}
+        elif filepath or file_obj:
+            data = aiohttp.FormData()
+            content = open(filepath, 'rb') if filepath else file_obj
+            data.add_field('fileUpload', content, filename='filename', content_type='application/octet-stream')
+        else:
+            raise Exception('filepath, file_obj or url argument must be provided')
+
+        try:
+            response = await self.transport.request('POST', request_url, params=req_params, data=data)
+            response.release()
+        finally:
+            if filepath:
+                content.close()
+
+        return self
+
+    async def av_convert(self, **params):
+        """
+        Starts audio/video conversion. Accepts the same keyword arguments as
+        :meth:`filestack.Filelink.av_convert`
+
+        Returns:
+            :class:`filestack.aio.AsyncAudioVisual`
+        """
+        params = {k: v for k, v in params.items() if v is not None}
+        transformation = filestack.models.Transformation(handle=self.handle, security=self.security)
+        transformation._append_task(utils.return_transform_task('video_convert', params))
+        url = transformation.url
+
+        response = await self.transport.json('GET', url)
+        return AsyncAudioVisual(
+            url, response['uuid'], response['timestamp'], apikey=self.apikey, security=self.security,
+            transport=self.transport
+        )
@@ -0,0 +1,92 @@
+import asyncio
+import multiprocessing
+
+from filestack import config
+from filestack.polling import DEFAULT_BACKOFF
+from filestack.uploads.multipart import (
+    get_file_info, add_store_params, make_chunk_payload, make_complete_payload
+)
+
+
+def read_chunk(filepath, seek_point):
+    with open(filepath, 'rb') as f:
+        f.seek(seek_point)
+        return f.read(config.DEFAULT_CHUNK_SIZE)
+
+
+async def upload_chunk(transport, apikey, storage, start_response, num, data):
+    payload = make_chunk_payload(apikey, storage, start_response, num, data)
+    fs_resp = await transport.json(
+        'POST', 'https://{}/multipart/upload'.format(start_response['location_url']), json=payload
+    )
+
+    response = await transport.request('PUT', fs_resp['url'], headers=fs_resp['headers'], data=data)
+    async with response:
+        return {'part_number': num, 'etag': response.headers['ETag']}
+
+
+async def complete_upload(transport, complete_url, payload, backoff=None):
+    """
+    Asyncio version of :func:`filestack.uploads.multipart.complete_upload`.
+    While the server answers with 202, the request is repeated after delays defined by `backoff`;
+    waiting doesn't block the event loop, so one loop can await any number of completions.
+    """
+    backoff = backoff or DEFAULT_BACKOFF
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + backoff.deadline
+    attempt = 0
+    while True:
+        response = await transport.request('POST', complete_url, json=payload)
+        async with response:
+            if response.status != 202:
+                return await response.json(content_type=None)
+
+        delay = backoff.delay(attempt)
+        if loop.time() + delay > deadline:
+            raise TimeoutError('Operation not completed within {}s'.format(backoff.deadline))
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def multipart_upload(apikey, filepath, file_obj, storage, params=None, security=None,
+                           transport=None, max_concurrency=None, backoff=None):
+    """
+    Asyncio version of :func:`filestack.uploads.multipart.multipart_upload`.
+    At most `max_concurrency` chunks of this file are kept in memory and uploaded at the same time.
+    """
+    params = params or {}
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency or multiprocessing.cpu_count())
+
+    filename, mimetype, filesize = get_file_info(filepath, file_obj, params)
+
+    payload = {
+        'apikey': apikey,
+        'filename': filename,
+        'mimetype': mimetype,
+        'size': filesize,
+        'store': {
+            'location': storage
+        }
+    }
+
+    start_response = await transport.json(
+        'POST', config.MULTIPART_START_URL, json=add_store_params(payload, params, security)
+    )
+
+    async def upload_part(num, seek_point):
+        async with semaphore:
+            if filepath:
+                data = await loop.run_in_executor(None, read_chunk, filepath, seek_point)
+            else:
+                file_obj.seek(seek_point)
+                data = file_obj.read(config.DEFAULT_CHUNK_SIZE)
+            return await upload_chunk(transport, apikey, storage, start_response, num, data)
+
+    uploaded_parts = await asyncio.gather(*[
+        upload_part(num + 1, seek_point)
+        for num, seek_point in enumerate(range(0, filesize, config.DEFAULT_CHUNK_SIZE))
+    ])
+
+    complete_url, payload = make_complete_payload(payload, start_response, list(uploaded_parts), params)
+    return await complete_upload(transport, complete_url, add_store_params(payload, params, security), backoff=backoff)
@@ -0,0 +1,73 @@
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from filestack.exceptions import FilestackHTTPError
+from filestack.utils import default_headers
+
+DEFAULT_POOL_SIZE = 100
+
+
+class AsyncRequestsWrapper:
+    """
+    Asyncio counterpart of :class:`filestack.utils.RequestsWrapper`.
+
+    All coroutines using the same wrapper share one aiohttp session (created on first request),
+    so a single connection pool is used by every upload and download running on the event loop.
+    """
+    def __init__(self, pool_size=None):
+        """
+        Args:
+            pool_size (int): maximum number of simultaneously open connections
+        """
+        if aiohttp is None:
+            raise ImportError(
+                'aiohttp is required for asyncio support. Install it with: pip install filestack-python[async]'
+            )
+        self.pool_size = pool_size or DEFAULT_POOL_SIZE
+        self.session = None
+
+    def _get_session(self):
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def request(self, method, url, headers=None, **kwargs):
+        """
+        Sends request and returns aiohttp response, which should be released by the caller.
+        Raises :class:`filestack.exceptions.FilestackHTTPError` for error responses.
+        """
+        response = await self._get_session().request(method, url, headers=headers or default_headers(), **kwargs)
+        if response.status >= 400:
+            text = await response.text()
+            response.release()
+            raise FilestackHTTPError(text)
+        return response
+
+    async def json(self, method, url, **kwargs):
+        response = await self.request(method, url, **kwargs)
+        async with response:
+            return await response.json(content_type=None)
+
+    async def read(self, method, url, **kwargs):
+        response = await self.request(method, url, **kwargs)
+        async with response:
+            return await response.read()
+
+    async def download(self, url, path, chunk_size=5 * 1024 ** 2):
+        total_bytes = 0
+        response = await self.request('GET', url)
+        async with response:
+            with open(path, 'wb') as f:
+                async for data_chunk in response.content.iter_chunked(chunk_size):
+                    f.write(data_chunk)
+                    total_bytes += len(data_chunk)
+
+        return total_bytes
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
@@ -0,0 +1,263 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from filestack.utils import requests, default_headers
+
+MB = 1024 ** 2
+
+CacheEntry = namedtuple('CacheEntry', ['etag', 'expires', 'size', 'content'])
+
+
+def parse_max_age(cache_control):
+    """
+    Returns freshness lifetime in seconds defined by Cache-Control header value,
+    or None if the response must not be stored
+    """
+    directives = [directive.strip().lower() for directive in cache_control.split(',')]
+    if 'no-store' in directives:
+        return None
+    if 'no-cache' in directives:
+        return 0
+    for directive in directives:
+        match = re.match(r'(?:s-maxage|max-age)=(\d+)$', directive)
+        if match:
+            return int(match.group(1))
+    return 0
+
+
+class ContentCache:
+    """
+    Size-bounded LRU cache of file contents fetched from the CDN.
+
+    Entries are keyed by object URL without the security part, so signed and unsigned
+    requests for the same file (or transformation) share an entry. Responses are kept
+    for as long as their ``Cache-Control`` header allows; stale entries with an ETag are
+    revalidated with ``If-None-Match`` and reused when the CDN answers with 304 Not Modified.
+
+    If directory is provided, contents are stored on disk (and survive process restarts),
+    otherwise in memory.
+
+    >>> cache = ContentCache(max_size=256 * 1024 ** 2)
+    >>> filelink.resize(width=400).get_content(cache=cache)
+    >>> cache.hits, cache.misses
+    """
+    def __init__(self, max_size=64 * MB, directory=None):
+        self.max_size = max_size
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._load_directory()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """
+        Total size of cached contents in bytes
+        """
+        return self._size
+
+    def get_content(self, key, url, transport=None):
+        """
+        Returns content of the given key, fetching it from url if it's not cached or stale
+        """
+        entry = self._get(key)
+        if entry is not None and entry.expires > time.time():
+            content = self._read(key, entry)
+            if content is not None:
+                self._count_hit()
+                return content
+            entry = None
+
+        response = self._fetch(url, entry, transport)
+        max_age = parse_max_age(response.headers.get('Cache-Control', ''))
+
+        if response.status_code == 304 and entry is not None:
+            content = self._read(key, entry)
+            if content is not None:
+                self._count_hit()
+                if max_age is not None:
+                    self._put(key, content, entry.etag, max_age)
+                return content
+            # content is gone, so the 304 cannot be served, fetch it in full
+            response = self._fetch(url, None, transport)
+            max_age = parse_max_age(response.headers.get('Cache-Control', ''))
+
+        with self._lock:
+            self.misses += 1
+        content = response.content
+        etag = response.headers.get('ETag')
+        if max_age is None or (max_age == 0 and not etag):
+            self.discard(key)
+        else:
+            self._put(key, content, etag, max_age)
+        return content
+
+    def discard(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    @staticmethod
+    def _fetch(url, entry, transport):
+        headers = default_headers()
+        if entry is not None and entry.etag:
+            headers['If-None-Match'] = entry.etag
+        return (transport or requests).get(url, headers=headers)
+
+    def _count_hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _put(self, key, content, etag, max_age):
+        size = len(content)
+        if size > self.max_size:
+            self.discard(key)
+            return
+
+        expires = time.time() + max_age
+        if self.directory is not None:
+            self._write_file(key, content, etag, expires)
+            content = None
+
+        with self._lock:
+            self._remove(key, delete_file=False)
+            self._entries[key] = CacheEntry(etag, expires, size, content)
+            self._size += size
+            while self._size > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key, delete_file=True):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._size -= entry.size
+        if self.directory is not None and delete_file:
+            for path in self._paths(key):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    def _read(self, key, entry):
+        """
+        Returns cached content, or None if its file is gone (the entry is discarded then)
+        """
+        if entry.content is not None:
+            return entry.content
+        try:
+            with open(self._paths(key)[0], 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            # removed by another process sharing the directory, counts as a miss
+            self.discard(key)
+            return None
+
+    def _paths(self, key):
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, name), os.path.join(self.directory, name + '.json')
+
+    def _write_file(self, key, content, etag, expires):
+        content_path, meta_path = self._paths(key)
+        tmp_path = content_path + '.tmp{}'.format(threading.get_ident())
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, content_path)
+        with open(meta_path, 'w') as f:
+            json.dump({'key': key, 'etag': etag, 'expires': expires, 'size': len(content)}, f)
+
+    def _load_directory(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            meta_path = os.path.join(self.directory, name)
+            try:
+                with open(meta_path) as f:
+                    meta = json.load(f)
+                mtime = os.path.getmtime(meta_path[:-len('.json')])
+            except (OSError, ValueError):
+                continue
+            entries.append((mtime, meta))
+
+        for _, meta in sorted(entries, key=lambda item: item[0]):
+            self._entries[meta['key']] = CacheEntry(meta['etag'], meta['expires'], meta['size'], None)
+            self._size += meta['size']
+        while self._size > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+
+class MetadataCache:
+    """
+    TTL-bounded cache of file metadata, keyed by handle and requested attributes.
+
+    Entries expire `ttl` seconds after they were fetched, and the least recently used handles
+    are evicted once more than `max_entries` handles are cached. Entries of a handle are dropped
+    when the file is deleted or overwritten through a :class:`filestack.Filelink` using the cache.
+    """
+    def __init__(self, ttl=60, max_entries=100000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _attributes_key(attributes_list):
+        return tuple(sorted(attributes_list or []))
+
+    def get(self, handle, attributes_list=None):
+        """
+        Returns cached metadata or None if it's not cached or expired
+        """
+        attributes_key = self._attributes_key(attributes_list)
+        with self._lock:
+            expires, metadata = self._entries.get(handle, {}).get(attributes_key, (0, None))
+            if expires > time.time():
+                self._entries.move_to_end(handle)
+                self.hits += 1
+                return dict(metadata)
+            self.misses += 1
+            return None
+
+    def put(self, handle, attributes_list, metadata):
+        attributes_key = self._attributes_key(attributes_list)
+        with self._lock:
+            self._entries.setdefault(handle, {})[attributes_key] = (time.time() + self.ttl, dict(metadata))
+            self._entries.move_to_end(handle)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, handle):
+        with self._lock:
+            self._entries.pop(handle, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,180 @@
+import json
+import os
+import re
+import threading
+
+from filestack.exceptions import FilestackHTTPError
+from filestack.utils import requests, default_headers, DEFAULT_POOL_SIZE
+
+MB = 1024 ** 2
+DEFAULT_PART_SIZE = 8 * MB
+STREAM_CHUNK_SIZE = 5 * MB
+STATE_SUFFIX = '.download-state'
+
+
+def stream_download(url, path, transport=None):
+    """
+    Downloads url to path through a single streamed response, returns number of bytes written
+    """
+    total_bytes = 0
+    with open(path, 'wb') as f:
+        response = (transport or requests).get(url, stream=True)
+        for data_chunk in response.iter_content(STREAM_CHUNK_SIZE):
+            f.write(data_chunk)
+            total_bytes += len(data_chunk)
+
+    return total_bytes
+
+
+def read_state(state_path):
+    try:
+        with open(state_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_state(state_path, etag, size):
+    with open(state_path, 'w') as f:
+        json.dump({'etag': etag, 'size': size}, f)
+
+
+def response_size(response):
+    """
+    Returns total size of the remote file based on Content-Range or Content-Length of a response
+    """
+    match = re.match(r'bytes (\d+)-(\d+)/(\d+)', response.headers.get('Content-Range', ''))
+    if match:
+        return int(match.group(3))
+    content_length = response.headers.get('Content-Length')
+    return int(content_length) if content_length else None
+
+
+def resumable_download(url, path, transport=None):
+    """
+    Downloads url to path, continuing a previously interrupted download if possible.
+
+    Progress is tracked in a state file next to the target (``path + '.download-state'``),
+    which holds the ETag and size of the remote file and is removed once the download completes.
+    The remaining bytes are requested with ``Range: bytes=N-`` and ``If-Range: <etag>``, so if the remote
+    file changed in the meantime the server sends the whole new file and the download starts over.
+    Returns the size of the downloaded file.
+    """
+    state_path = path + STATE_SUFFIX
+    state = read_state(state_path)
+    offset = 0
+    if state and state.get('etag') and os.path.exists(path):
+        offset = os.path.getsize(path)
+        if state.get('size') is not None and offset >= state['size']:
+            # re-request the last byte, a range past the end would not be satisfiable
+            offset = max(state['size'] - 1, 0)
+            os.truncate(path, offset)
+
+    headers = default_headers()
+    if offset:
+        headers['Range'] = 'bytes={}-'.format(offset)
+        headers['If-Range'] = state['etag']
+
+    response = (transport or requests).get(url, headers=headers, stream=True)
+    if response.status_code == 206:
+        match = re.match(r'bytes (\d+)-', response.headers.get('Content-Range', ''))
+        if not match or int(match.group(1)) != offset:
+            response.close()
+            raise Exception('Unexpected Content-Range received: {}'.format(response.headers.get('Content-Range')))
+        mode = 'ab'
+    else:
+        offset, mode = 0, 'wb'
+
+    size = response_size(response)
+    write_state(state_path, response.headers.get('ETag'), size)
+
+    with open(path, mode) as f:
+        for data_chunk in response.iter_content(STREAM_CHUNK_SIZE):
+            f.write(data_chunk)
+            offset += len(data_chunk)
+
+    if size is not None and offset != size:
+        raise Exception('Download incomplete: received {} of {} bytes'.format(offset, size))
+
+    os.remove(state_path)
+    return offset
+
+
+class PositionalWriter:
+    """
+    Writes data at given offsets of a file from many threads.
+    Uses os.pwrite where available, otherwise a lock around seek and write.
+    """
+    def __init__(self, path, size):
+        self._file = open(path, 'wb')
+        self._file.truncate(size)  # preallocate, parts can be written in any order
+        self._lock = threading.Lock()
+
+    def write(self, data, offset):
+        if hasattr(os, 'pwrite'):
+            view = memoryview(data)
+            while view:
+                written = os.pwrite(self._file.fileno(), view, offset)
+                view = view[written:]
+                offset += written
+        else:
+            with self._lock:
+                self._file.seek(offset)
+                self._file.write(data)
+
+    def close(self):
+        self._file.close()
+
+
+def fetch_range(url, writer, start, end, etag=None, transport=None):
+    headers = default_headers()
+    headers['Range'] = 'bytes={}-{}'.format(start, end)
+    if etag:
+        headers['If-Range'] = etag
+
+    response = (transport or requests).get(url, headers=headers, stream=True)
+    if response.status_code != 206:
+        response.close()
+        raise Exception('Range request not satisfied, remote file may have changed during download')
+
+    offset = start
+    for data_chunk in response.iter_content(MB):
+        writer.write(data_chunk, offset)
+        offset += len(data_chunk)
+
+    if offset != end + 1:
+        raise Exception('Incomplete range received: bytes {}-{} of {}-{}'.format(start, offset - 1, start, end))
+
+    return offset - start
+
+
+def parallel_download(url, path, transport=None, workers=None, part_size=DEFAULT_PART_SIZE):
+    """
+    Downloads url to path fetching byte ranges on a pool of threads.
+    Falls back to a single stream if the server rejects HEAD requests, doesn't accept range requests
+    or the file is not larger than a single part. Returns number of bytes written.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    transport = transport or requests
+    try:
+        head = transport.head(url, allow_redirects=True)
+    except FilestackHTTPError:
+        # some CDNs and proxies answer HEAD with 403, 405 or 501, GET reports real errors
+        return stream_download(url, path, transport=transport)
+    size = int(head.headers.get('Content-Length') or 0)
+    if head.headers.get('Accept-Ranges', '').lower() != 'bytes' or size <= part_size:
+        return stream_download(url, path, transport=transport)
+
+    etag = head.headers.get('ETag')
+    writer = PositionalWriter(path, size)
+    try:
+        with ThreadPoolExecutor(max_workers=workers or DEFAULT_POOL_SIZE) as executor:
+            futures = [
+                executor.submit(
+                    fetch_range, url, writer, start, min(start + part_size, size) - 1, etag=etag, transport=transport
+                ) for start in range(0, size, part_size)
+            ]
+            return sum(future.result() for future in futures)
+    finally:
+        writer.close()
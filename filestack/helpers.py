@@ -1,16 +1,25 @@
 import hmac
+import time
 import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
-import trafaret as t
+DEFAULT_WEBHOOK_MAX_AGE = 300
+DEFAULT_SEEN_SIGNATURES = 100000
 
 
 def check_body(val):
+    import trafaret as t
+
     if isinstance(val, str) or isinstance(val, bytes):
         return val
     return t.DataError('Invalid webhook body. Expected: string or bytes')
 
 
 def check_headers(headers):
+    import trafaret as t
+
     if not isinstance(headers, dict):
         return t.DataError('value is not a dict')
 
@@ -21,11 +30,22 @@ def check_headers(headers):
     return headers
 
 
-VerificationArguments = t.Dict({
-    'secret': t.String,
-    'body': t.Call(check_body),
-    'headers': t.Call(check_headers)
-})
+@lru_cache(maxsize=None)
+def verification_arguments():
+    # trafaret is imported when the first webhook is verified, not with the module
+    import trafaret as t
+
+    return t.Dict({
+        'secret': t.String,
+        'body': t.Call(check_body),
+        'headers': t.Call(check_headers)
+    })
+
+
+def __getattr__(name):
+    if name == 'VerificationArguments':
+        return verification_arguments()
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
 
 
 def verify_webhook_signature(secret=None, body=None, headers=None):
@@ -45,22 +65,222 @@ def verify_webhook_signature(secret=None, body=None, headers=None):
     ```
     Positive verification result: True, {}
     Negative verification result: False, {'error': 'error details'}
+
+    To verify many webhooks signed with the same secret, use :class:`WebhookVerifier`.
     """
+    import trafaret as t
+
     try:
-        VerificationArguments.check({
+        verification_arguments().check({
             'secret': secret, 'body': body, 'headers': headers
         })
     except t.DataError as e:
         return False, {'error': str(e.as_dict())}
 
-    lowercase_headers = dict((k.lower(), v) for k, v in headers.items())
-    if isinstance(body, bytes):
-        body = body.decode('utf-8')
-
-    lowercase_headers = dict((k.lower(), v) for k, v in headers.items())
-    hmac_data = '{}.{}'.format(lowercase_headers['fs-timestamp'], body)
-    signature = hmac.new(secret.encode('utf-8'), hmac_data.encode('utf-8'), hashlib.sha256).hexdigest()
-    expected = lowercase_headers['fs-signature']
-    if signature != expected:
-        return False, {'error': 'Signature mismatch! Expected: {}. Got: {}'.format(expected, signature)}
-    return True, {}
+    return WebhookVerifier(secret).verify(body, headers)
+
+
+def find_header(headers, name):
+    """
+    Returns value of header `name` (given in lowercase) from a dict with headers in any case, or None
+    """
+    value = headers.get(name)
+    if value is not None:
+        return value
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+class MemorySignatureStore:
+    """
+    Bounded set of seen webhook signatures kept in memory, used by :class:`ReplayGuard`.
+
+    Signatures are dropped when they expire, and the oldest ones are dropped
+    when more than `max_entries` are stored.
+
+    Other backends (e.g. shared by many receiver processes) implement the same two methods:
+    ``add(signature, expires_at, now)`` atomically stores a signature and returns False
+    if it is already stored and not expired, ``discard(signature)`` removes it.
+    With Redis, ``add`` maps to ``SET signature 1 NX EXAT expires_at``.
+    """
+    def __init__(self, max_entries=DEFAULT_SEEN_SIGNATURES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, signature, expires_at, now):
+        with self._lock:
+            entries = self._entries
+            while entries:
+                oldest, oldest_expires_at = next(iter(entries.items()))
+                if oldest_expires_at > now:
+                    break
+                del entries[oldest]
+
+            expires = entries.get(signature)
+            if expires is not None and expires > now:
+                return False
+            entries[signature] = expires_at
+            entries.move_to_end(signature)
+            if len(entries) > self.max_entries:
+                entries.popitem(last=False)
+            return True
+
+    def discard(self, signature):
+        with self._lock:
+            self._entries.pop(signature, None)
+
+
+class ReplayGuard:
+    """
+    Rejects stale and redelivered webhooks.
+
+    Webhooks with FS-Timestamp more than `max_age` seconds away from the current time are rejected,
+    and signatures of accepted webhooks are remembered until they would be rejected as stale anyway,
+    so every signature is accepted only once. The check only reads headers,
+    so duplicates can be rejected before the body is read or parsed.
+
+    >>> guard = ReplayGuard(max_age=300)
+    >>> verifier = WebhookVerifier('<YOUR_WEBHOOK_SECRET>', replay_guard=guard)
+    >>> result, details = verifier.verify(request_body, request_headers)
+
+    Guards can also be used on their own, before the webhook is verified:
+
+    >>> result, details = guard.check(request_headers)
+    """
+    def __init__(self, max_age=DEFAULT_WEBHOOK_MAX_AGE, store=None):
+        """
+        Args:
+            max_age (int): maximum age of accepted webhooks in seconds
+            store: backend storing seen signatures, defaults to :class:`MemorySignatureStore`
+        """
+        self.max_age = max_age
+        self.store = store if store is not None else MemorySignatureStore()
+
+    def check(self, headers, now=None):
+        """
+        Checks freshness of a webhook and marks its signature as seen
+
+        Args:
+            headers (dict): request headers containing FS-Signature and FS-Timestamp (in any case)
+            now (float): current timestamp, defaults to :func:`time.time`
+
+        Returns:
+            tuple: :data:`(True, {})` or :data:`(False, {'error': 'error details'})`
+        """
+        signature = find_header(headers, 'fs-signature')
+        if signature is None:
+            return False, {'error': 'fs-signature header is missing'}
+        timestamp = find_header(headers, 'fs-timestamp')
+        if timestamp is None:
+            return False, {'error': 'fs-timestamp header is missing'}
+        return self.check_signature(signature, timestamp, now=now)
+
+    def check_signature(self, signature, timestamp, now=None):
+        """
+        Same as :meth:`check` for already extracted header values
+        """
+        now = time.time() if now is None else now
+        try:
+            timestamp = int(timestamp)
+        except (TypeError, ValueError):
+            return False, {'error': 'Invalid fs-timestamp header'}
+
+        if abs(now - timestamp) > self.max_age:
+            return False, {'error': 'Webhook expired, timestamp: {}'.format(timestamp)}
+        if not self.store.add(signature, timestamp + self.max_age, now):
+            return False, {'error': 'Webhook already received'}
+        return True, {}
+
+    def forget(self, signature):
+        """
+        Removes signature from seen signatures, e.g. when the webhook failed verification
+        or its processing failed and a redelivery should be accepted
+        """
+        self.store.discard(signature)
+
+
+class WebhookVerifier:
+    """
+    Verifies signatures of webhooks sent by Filestack.
+
+    HMAC key state is computed once per verifier and copied for every webhook,
+    bytes bodies are hashed as they are (without decoding) and signatures are compared in constant time,
+    so a single verifier can be shared by all threads of a busy webhook receiver.
+
+    >>> verifier = WebhookVerifier('<YOUR_WEBHOOK_SECRET>')
+    >>> result, details = verifier.verify(request_body, request_headers)
+    >>> results = verifier.verify_many([(body1, headers1), (body2, headers2)])
+
+    With a :class:`ReplayGuard`, stale and already received webhooks are rejected before their bodies are hashed.
+    """
+    def __init__(self, secret, replay_guard=None):
+        """
+        Args:
+            secret (str): secret of your webhook endpoint, generated in Filestack developer portal
+            replay_guard (:class:`ReplayGuard`): guard rejecting stale and redelivered webhooks
+        """
+        if not isinstance(secret, str):
+            raise TypeError('Webhook secret should be a string')
+        self._hmac = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+        self.replay_guard = replay_guard
+
+    def verify(self, body, headers):
+        """
+        Checks signature of one webhook
+
+        Args:
+            body (bytes): raw content of received webhook (str is accepted and encoded as UTF-8)
+            headers (dict): request headers containing FS-Signature and FS-Timestamp (in any case)
+
+        Returns:
+            tuple: :data:`(True, {})` or :data:`(False, {'error': 'error details'})`
+        """
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        elif not isinstance(body, (bytes, bytearray, memoryview)):
+            return False, {'error': 'Invalid webhook body. Expected: string or bytes'}
+
+        if not hasattr(headers, 'items'):
+            return False, {'error': 'Invalid webhook headers. Expected: dict'}
+        signature = find_header(headers, 'fs-signature')
+        timestamp = find_header(headers, 'fs-timestamp')
+        if signature is None:
+            return False, {'error': 'fs-signature header is missing'}
+        if timestamp is None:
+            return False, {'error': 'fs-timestamp header is missing'}
+
+        if self.replay_guard is not None:
+            result, details = self.replay_guard.check_signature(signature, timestamp)
+            if not result:
+                return result, details
+
+        mac = self._hmac.copy()
+        mac.update(str(timestamp).encode('utf-8'))
+        mac.update(b'.')
+        mac.update(body)
+        expected = signature.encode('utf-8') if isinstance(signature, str) else signature
+        if not hmac.compare_digest(mac.hexdigest().encode('ascii'), expected):
+            if self.replay_guard is not None:
+                # forged webhooks must not block delivery of the genuine one
+                self.replay_guard.forget(signature)
+            return False, {'error': 'Signature mismatch!'}
+        return True, {}
+
+    def verify_many(self, events):
+        """
+        Checks signatures of many webhooks
+
+        Args:
+            events (iterable): :data:`(body, headers)` pairs
+
+        Returns:
+            list: :data:`(result, details)` tuples, in the order of events
+        """
+        verify = self.verify
+        return [verify(body, headers) for body, headers in events]
@@ -1,11 +1,12 @@
 import filestack.models
-from filestack.utils import requests
+from filestack.downloads.ranged import stream_download, parallel_download, resumable_download
 
 
 class CommonMixin:
     """
     Contains all functions related to the manipulation of Filelink and Transformation objects
     """
+    __slots__ = ()
 
     @property
     def url(self):
@@ -67,33 +68,59 @@ class CommonMixin:
         if path:
             path = '"{}"'.format(path)
         instance = self._add_transform_task('store', locals())
-        response = requests.post(instance.url)
-        return filestack.models.Filelink(handle=response.json()['handle'])
+        response = self.transport.post(instance.url)
+        return filestack.models.Filelink(handle=response.json()['handle'], transport=self.transport)
 
-    def download(self, path, security=None):
+    def download(self, path, security=None, parallel=False, workers=None, resume=False, cache=None):
         """
         Downloads a file to the given local path and returns the size of the downloaded file if successful
+
+        Args:
+            path (str): local path where the file should be stored
+            security (:class:`filestack.Security`): Security object that will be used
+                for this API call
+            parallel (bool): fetch byte ranges of the file concurrently, if the server supports range requests
+            workers (int): number of concurrent range requests, defaults to number of CPUs
+            resume (bool): continue a previously interrupted download of the same file to the same path,
+                the download starts over if the remote file has changed
+            cache (:class:`filestack.ContentCache`): cache to serve the content from, if possible
+
+        Returns:
+            int: size of the downloaded file
         """
-        sec = security or self.security
-        total_bytes = 0
+        if sum((bool(parallel), bool(resume), cache is not None)) > 1:
+            raise ValueError('parallel, resume and cache options cannot be used together')
 
-        with open(path, 'wb') as f:
-            response = requests.get(self._build_url(security=sec), stream=True)
-            for data_chunk in response.iter_content(5 * 1024 ** 2):
-                f.write(data_chunk)
-                total_bytes += len(data_chunk)
+        if cache is not None:
+            content = self.get_content(security=security, cache=cache)
+            with open(path, 'wb') as f:
+                f.write(content)
+            return len(content)
 
-        return total_bytes
+        url = self._build_url(security=security or self.security)
+        if resume:
+            return resumable_download(url, path, transport=self.transport)
+        if parallel:
+            return parallel_download(url, path, transport=self.transport, workers=workers)
+        return stream_download(url, path, transport=self.transport)
 
-    def get_content(self, security=None):
+    def get_content(self, security=None, cache=None):
         """
         Returns the raw byte content of a given object
 
+        Args:
+            security (:class:`filestack.Security`): Security object that will be used
+                for this API call
+            cache (:class:`filestack.ContentCache`): cache to serve the content from, if possible.
+                Entries are keyed by object's URL without security
+
         Returns:
             `bytes`: file content
         """
-        sec = security or self.security
-        response = requests.get(self._build_url(security=sec))
+        url = self._build_url(security=security or self.security)
+        if cache is not None:
+            return cache.get_content(self._build_url(), url, transport=self.transport)
+        response = self.transport.get(url)
         return response.content
 
     def tags(self, security=None):
@@ -108,7 +135,7 @@ class CommonMixin:
             `dict`: dictionary containing image tags
         """
         obj = self._add_transform_task('tags', params={'self': None})
-        response = requests.get(obj.signed_url(security=security))
+        response = self.transport.get(obj.signed_url(security=security))
         return response.json()
 
     def sfw(self, security=None):
@@ -123,7 +150,7 @@ class CommonMixin:
             `dict`: dictionary containing SFW result
         """
         obj = self._add_transform_task('sfw', params={'self': None})
-        response = requests.get(obj.signed_url(security=security))
+        response = self.transport.get(obj.signed_url(security=security))
         return response.json()
 
     def ocr(self, security=None):
@@ -138,5 +165,5 @@ class CommonMixin:
             `dict`: dictionary containing OCR data
         """
         obj = self._add_transform_task('ocr', params={'self': None})
-        response = requests.get(obj.signed_url(security=security))
+        response = self.transport.get(obj.signed_url(security=security))
         return response.json()
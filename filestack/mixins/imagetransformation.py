@@ -7,6 +7,8 @@ class ImageTransformationMixin:
     All transformations and related/dependent tasks live here. They can
     be directly called by Transformation or Filelink objects.
     """
+    __slots__ = ()
+
     def resize(self, width=None, height=None, fit=None, align=None):
         return self._add_transform_task('resize', locals())
 
@@ -142,12 +144,13 @@ class ImageTransformationMixin:
                    audio_channels=None, clip_length=None, clip_offset=None):
 
         new_transform = self._add_transform_task('video_convert', locals())
-        response = utils.requests.get(new_transform.url).json()
+        response = self.transport.get(new_transform.url).json()
         uuid = response['uuid']
         timestamp = response['timestamp']
 
         return filestack.models.AudioVisual(
-            new_transform.url, uuid, timestamp, apikey=new_transform.apikey, security=new_transform.security
+            new_transform.url, uuid, timestamp, apikey=new_transform.apikey, security=new_transform.security,
+            transport=self.transport
         )
 
     def auto_image(self):
@@ -169,12 +172,11 @@ class ImageTransformationMixin:
         if isinstance(self, filestack.models.Transformation):
             instance = self
         else:
-            instance = filestack.models.Transformation(apikey=None, security=self.security, handle=self.handle)
+            instance = filestack.models.Transformation(
+                apikey=None, security=self.security, handle=self.handle, transport=self.transport
+            )
 
         params.pop('self')
-        params = {k: v for k, v in params.items() if v is not None}
-
-        transformation_url = utils.return_transform_task(transformation, params)
-        instance._transformation_tasks.append(transformation_url)
+        instance._append_task(utils.cached_transform_task(transformation, params))
 
         return instance
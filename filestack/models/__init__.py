@@ -1,5 +1,27 @@
-from .filelink import Filelink
-from .client import Client
-from .transformation import Transformation
-from .security import Security
-from .audiovisual import AudioVisual
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'Filelink': 'filestack.models.filelink',
+    'Client': 'filestack.models.client',
+    'Transformation': 'filestack.models.transformation',
+    'TransformationTemplate': 'filestack.models.template',
+    'Security': 'filestack.models.security',
+    'SecurityFactory': 'filestack.models.security',
+    'AudioVisual': 'filestack.models.audiovisual',
+    'ConversionTracker': 'filestack.models.audiovisual',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -1,10 +1,20 @@
+import threading
+
 import filestack.models
-from filestack.utils import requests
+from filestack.polling import Backoff, Poller
+from filestack.utils import requests, is_transient_error
+
+CONVERSION_BACKOFF = Backoff(initial=1, factor=1.5, max_delay=15, deadline=3600)
+STATUS_REQUEST_TIMEOUT = 30
+
+
+class ConversionFailed(Exception):
+    pass
 
 
 class AudioVisual:
 
-    def __init__(self, url, uuid, timestamp, apikey=None, security=None):
+    def __init__(self, url, uuid, timestamp, apikey=None, security=None, transport=None):
         """
         AudioVisual instances provide a bridge between transform and filelinks, and allow
         you to check the status of a conversion and convert to a Filelink once completed
@@ -15,10 +25,7 @@ class AudioVisual:
         client = Client("<API_KEY>")
         filelink = client.upload(filepath='path/to/file/doom.mp4')
         av_convert= filelink.av_convert(width=100, height=100)
-        while av_convert.status != 'completed':
-            print(av_convert.status)
-
-        filelink = av_convert.to_filelink()
+        filelink = av_convert.wait(timeout=600)
         print(filelink.url)
         ```
         """
@@ -27,10 +34,22 @@ class AudioVisual:
         self.security = security
         self.uuid = uuid
         self.timestamp = timestamp
+        self.transport = transport or requests
+        self.last_response = None
+
+    def refresh(self, timeout=None):
+        """
+        Fetches conversion status (makes a GET request) and stores the response in `last_response`
+
+        *returns* [Dict]
+        """
+        self.last_response = self.transport.get(self.url, timeout=timeout).json()
+        return self.last_response
 
     def to_filelink(self):
         """
-        Checks is the status of the conversion is complete and, if so, converts to a Filelink
+        Checks is the status of the conversion is complete and, if so, converts to a Filelink.
+        The status is checked again only if the last fetched response wasn't completed
 
         *returns* [Filestack.Filelink]
 
@@ -38,12 +57,17 @@ class AudioVisual:
         filelink = av_convert.to_filelink()
         ```
         """
-        if self.status != 'completed':
+        response = self.last_response
+        if response is None or response['status'] != 'completed':
+            response = self.refresh()
+        if response['status'] != 'completed':
             raise Exception('Audio/video conversion not complete!')
 
-        response = requests.get(self.url).json()
+        return self._make_filelink(response)
+
+    def _make_filelink(self, response):
         handle = response['data']['url'].split('/')[-1]
-        return filestack.models.Filelink(handle, apikey=self.apikey, security=self.security)
+        return filestack.models.Filelink(handle, apikey=self.apikey, security=self.security, transport=self.transport)
 
     @property
     def status(self):
@@ -54,8 +78,103 @@ class AudioVisual:
 
         ```python
         av_convert= filelink.av_convert(width=100, height=100)
-        while av_convert.status != 'completed':
-            print(av_convert.status)
+        print(av_convert.status)
         ```
         """
-        return requests.get(self.url).json()['status']
+        return self.refresh()['status']
+
+    def wait(self, timeout=None, poll_strategy=None):
+        """
+        Polls conversion status with exponential backoff and returns converted file once the conversion is completed
+
+        *returns* [Filestack.Filelink]
+
+        ```python
+        filelink = av_convert.wait(timeout=600, poll_strategy=Backoff(initial=2, max_delay=30))
+        ```
+
+        Args:
+            timeout (float): maximum number of seconds to wait, :class:`TimeoutError` is raised afterwards
+                (defaults to deadline of `poll_strategy`)
+            poll_strategy (:class:`filestack.polling.Backoff`): delays between status checks,
+                defaults to :data:`CONVERSION_BACKOFF`
+        """
+        return default_tracker().track(self, backoff=poll_strategy, timeout=timeout).result()
+
+
+class ConversionTracker:
+    """
+    Tracks many audio/video conversions on one background thread.
+
+    Status checks of all tracked conversions are scheduled by a single :class:`filestack.polling.Poller`
+    owned by the tracker (so long conversions never delay polling of upload completion),
+    every conversion is checked with its own backoff, and a future of its Filelink is resolved
+    when the conversion completes. Status requests time out after `request_timeout` seconds;
+    timeouts, connection errors and 5xx responses are retried with the next check.
+
+    >>> tracker = ConversionTracker()
+    >>> futures = [tracker.track(filelink.av_convert(preset='h264'), callback=on_converted) for filelink in filelinks]
+    >>> concurrent.futures.wait(futures)
+    """
+    def __init__(self, poller=None, backoff=None, request_timeout=STATUS_REQUEST_TIMEOUT):
+        """
+        Args:
+            poller (:class:`filestack.polling.Poller`): poller running status checks, a new one by default
+            backoff (:class:`filestack.polling.Backoff`): default delays between status checks
+            request_timeout (float): timeout of a single status request in seconds
+        """
+        self.poller = poller or Poller()
+        self.backoff = backoff or CONVERSION_BACKOFF
+        self.request_timeout = request_timeout
+
+    def track(self, audiovisual, callback=None, backoff=None, timeout=None):
+        """
+        Starts tracking a conversion
+
+        Args:
+            audiovisual (:class:`filestack.AudioVisual`): conversion to track
+            callback (callable): called with the future once the conversion completes or fails
+            backoff (:class:`filestack.polling.Backoff`): delays between status checks of this conversion
+            timeout (float): maximum number of seconds to wait (defaults to backoff deadline)
+
+        Returns:
+            :class:`concurrent.futures.Future` resolving to :class:`filestack.Filelink`.
+            It fails with :class:`ConversionFailed` if the conversion fails
+            and with :class:`TimeoutError` if it doesn't complete in time
+        """
+        backoff = backoff or self.backoff
+        if timeout is not None:
+            backoff = Backoff(backoff.initial, backoff.factor, backoff.max_delay, backoff.jitter, deadline=timeout)
+
+        def poll():
+            try:
+                response = audiovisual.refresh(timeout=self.request_timeout)
+            except Exception as e:
+                if is_transient_error(e):
+                    return False, None
+                raise
+            if response['status'] == 'completed':
+                return True, audiovisual._make_filelink(response)
+            if response['status'] == 'failed':
+                raise ConversionFailed('Audio/video conversion {} failed'.format(audiovisual.uuid))
+            return False, None
+
+        future = self.poller.submit(poll, backoff=backoff)
+        if callback is not None:
+            future.add_done_callback(callback)
+        return future
+
+
+_default_tracker = None
+_default_tracker_lock = threading.Lock()
+
+
+def default_tracker():
+    """
+    Returns tracker used by :meth:`AudioVisual.wait`, its poller is separate from upload completion polling
+    """
+    global _default_tracker
+    with _default_tracker_lock:
+        if _default_tracker is None:
+            _default_tracker = ConversionTracker()
+        return _default_tracker
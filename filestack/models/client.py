@@ -1,11 +1,68 @@
+import os
+import inspect
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import filestack.models
 from filestack import config
 from filestack.uploads.external_url import upload_external_url
 from filestack.trafarets import STORE_LOCATION_SCHEMA, STORE_SCHEMA
 from filestack import utils
-from filestack.utils import requests
+from filestack.utils import RequestsWrapper, make_session, run_many, call_with_retries, DEFAULT_POOL_SIZE
 from filestack.uploads import intelligent_ingestion
-from filestack.uploads.multipart import multipart_upload
+from filestack.uploads.multipart import multipart_upload, get_file_info, is_seekable
+from filestack.uploads.store import store_upload
+from filestack.downloads.ranged import stream_download
+from filestack.models.filelink import delete_params, overwrite_params
+from filestack.polling import Backoff, then
+
+UploadResult = namedtuple('UploadResult', ['source', 'filelink', 'error'])
+MetadataResult = namedtuple('MetadataResult', ['handle', 'metadata', 'error'])
+ConversionResult = namedtuple('ConversionResult', ['handle', 'params', 'audiovisual', 'error'])
+BulkResult = namedtuple('BulkResult', ['handle', 'error', 'attempts'])
+
+DEFAULT_RETRIES = 3
+RETRY_BACKOFF = Backoff(initial=0.5, factor=2, max_delay=10)
+
+
+class BulkReport:
+    """
+    Results of a bulk operation (:meth:`Client.delete_many`, :meth:`Client.overwrite_many`),
+    one :data:`BulkResult(handle, error, attempts)` per handle in the order operations completed.
+
+    >>> report = client.delete_many(handles)
+    >>> report.succeeded  # handles
+    >>> for result in report.failed:
+    ...     print(result.handle, result.error, result.attempts)
+    """
+    def __init__(self, results):
+        self.results = results
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self):
+        return len(self.results)
+
+    def __repr__(self):
+        return '<BulkReport {} succeeded, {} failed>'.format(len(self.succeeded), len(self.failed))
+
+    @property
+    def succeeded(self):
+        return [result.handle for result in self.results if result.error is None]
+
+    @property
+    def failed(self):
+        return [result for result in self.results if result.error is not None]
+
+
+def build_zip_url(apikey, files, security=None):
+    url_parts = [config.CDN_URL, apikey, 'zip', '[{}]'.format(','.join(files))]
+    if security is not None:
+        url_parts.insert(3, security.as_url_string())
+    return '/'.join(url_parts)
 
 
 class Client:
@@ -21,19 +78,29 @@ class Client:
     >>> from filestack import Client, Security
     >>> security = Security(policy={'expiry': 1594200833}, secret='YOUR APP SECRET')
     >>> cli = Client('<FILESTACK_APIKEY>', storage='gcs', security=security)
+
+    All API calls made by the client (and by Filelinks and Transformations it creates)
+    share one pooled HTTP session, so connections are kept alive between requests.
     """
-    def __init__(self, apikey, storage='S3', security=None):
+    def __init__(self, apikey, storage='S3', security=None, pool_size=None, metadata_cache=None):
         """
         Args:
             apikey (str): your Filestack API key
             storage (str): default storage to be used for uploads (one of S3, `gcs`, dropbox, azure)
             security (:class:`filestack.Security`): Security object that will be used by default
                 for all API calls
+            pool_size (int): maximum number of connections kept open per host.
+                Defaults to the number of upload threads
+            metadata_cache (:class:`filestack.MetadataCache`): cache shared by Filelinks created
+                by the client and used by :meth:`metadata_many`
         """
         self.apikey = apikey
         self.security = security
         STORE_LOCATION_SCHEMA.check(storage)
         self.storage = storage
+        self.pool_size = pool_size or DEFAULT_POOL_SIZE
+        self.transport = RequestsWrapper(session=make_session(self.pool_size))
+        self.metadata_cache = metadata_cache
 
     def transform_external(self, external_url):
         """
@@ -48,7 +115,9 @@ class Client:
         Returns:
             :class:`filestack.Transformation`
         """
-        return filestack.models.Transformation(apikey=self.apikey, security=self.security, external_url=external_url)
+        return filestack.models.Transformation(
+            apikey=self.apikey, security=self.security, external_url=external_url, transport=self.transport
+        )
 
     def urlscreenshot(self, url, agent=None, mode=None, width=None, height=None, delay=None):
         """
@@ -73,9 +142,9 @@ class Client:
         url_task = utils.return_transform_task('urlscreenshot', params)
 
         new_transform = filestack.models.Transformation(
-            self.apikey, security=self.security, external_url=url
+            self.apikey, security=self.security, external_url=url, transport=self.transport
         )
-        new_transform._transformation_tasks.append(url_task)
+        new_transform._append_task(url_task)
 
         return new_transform
 
@@ -93,19 +162,9 @@ class Client:
         Returns:
             int: ZIP archive size in bytes
         """
-        url_parts = [config.CDN_URL, self.apikey, 'zip', '[{}]'.format(','.join(files))]
-        sec = security or self.security
-        if sec is not None:
-            url_parts.insert(3, sec.as_url_string())
-        zip_url = '/'.join(url_parts)
-        total_bytes = 0
-        with open(destination_path, 'wb') as f:
-            response = requests.get(zip_url, stream=True)
-            for chunk in response.iter_content(5 * 1024 ** 2):
-                f.write(chunk)
-                total_bytes += len(chunk)
-
-        return total_bytes
+        zip_url = build_zip_url(self.apikey, files, security=security or self.security)
+        # archives are generated on request, so ranges of them can't be fetched separately
+        return stream_download(zip_url, destination_path, transport=self.transport)
 
     def upload_url(self, url, store_params=None, security=None):
         """
@@ -120,28 +179,51 @@ class Client:
             :class:`filestack.Filelink`: new Filelink object
         """
         sec = security or self.security
-        upload_response = upload_external_url(url, self.apikey, self.storage, store_params, security=sec)
+        upload_response = upload_external_url(
+            url, self.apikey, self.storage, store_params, security=sec, transport=self.transport
+        )
         return filestack.models.Filelink(
             handle=upload_response['handle'],
             apikey=self.apikey,
             security=sec,
-            upload_response=upload_response
+            upload_response=upload_response,
+            transport=self.transport,
+            metadata_cache=self.metadata_cache
         )
 
-    def upload(self, *, filepath=None, file_obj=None, store_params=None, intelligent=False, security=None):
+    def upload(self, *, filepath=None, file_obj=None, store_params=None, intelligent=False, security=None,
+               size=None, max_in_flight=None, journal=None, chunk_controller=None, wait=True,
+               completion_backoff=None, pipelined=False, hasher=None):
         """
         Uploads local file or file-like object.
 
         Args:
             filepath (str): path to file
-            file_obj (io.BytesIO or similar): file-like object
+            file_obj (io.BytesIO or similar): file-like object, non-seekable stream
+                (e.g. a pipe or a socket file) or an iterable of bytes
             store_params (dict): store parameters to be used during upload
             intelligent (bool): upload file using `Filestack Intelligent Ingestion
                 <https://www.filestack.com/products/file-upload/technology/>`_.
             security (:class:`filestack.Security`): Security object that will be used for this API call
+            size (int): size of uploaded content in bytes, required for non-seekable streams and iterables
+            max_in_flight (int): maximum number of chunks kept in memory during upload
+                (defaults to twice the number of upload threads)
+            journal (:class:`filestack.uploads.journal.UploadJournal`): journal used to save upload progress.
+                If the upload of the same local file was interrupted before, it is resumed
+            chunk_controller (:class:`filestack.uploads.intelligent_ingestion.ChunkSizeController`):
+                controller adapting chunk size of intelligent uploads, can be shared by uploads to the same
+                destination and inspected for monitoring. A new one is created for every upload by default
+            wait (bool): wait until the uploaded file is assembled. If False, returns as soon as all parts
+                are uploaded and the completion is polled in the background
+            completion_backoff (:class:`filestack.polling.Backoff`): delays and deadline of completion polling
+            pipelined (bool): request upload URLs of next chunks while previous chunks are being sent,
+                which hides the signing round-trip on high latency connections (regular uploads only)
+            hasher (:class:`filestack.uploads.hashing.ProcessHasher`): hashes chunks of local files
+                in other processes. By default chunks are hashed in upload threads
 
         Returns:
-            :class:`filestack.Filelink`: new Filelink object
+            :class:`filestack.Filelink`: new Filelink object, or a :class:`concurrent.futures.Future`
+            resolving to it if `wait` is False
 
         Note:
             This method accepts keyword arguments only.
@@ -150,18 +232,312 @@ class Client:
         if store_params:  # Check the structure of parameters
             STORE_SCHEMA.check(store_params)
 
-        upload_method = multipart_upload
+        sec = security or self.security
         if intelligent:
-            upload_method = intelligent_ingestion.upload
+            future = intelligent_ingestion.upload(
+                self.apikey, filepath, file_obj, self.storage, params=store_params,
+                security=sec, transport=self.transport, journal=journal, controller=chunk_controller,
+                wait=False, backoff=completion_backoff, hasher=hasher
+            )
+        else:
+            future = multipart_upload(
+                self.apikey, filepath, file_obj, self.storage, params=store_params,
+                security=sec, transport=self.transport, size=size, max_in_flight=max_in_flight,
+                journal=journal, wait=False, backoff=completion_backoff, pipelined=pipelined, hasher=hasher
+            )
+
+        def to_filelink(upload_response):
+            return filestack.models.Filelink(
+                upload_response['handle'],
+                apikey=self.apikey,
+                security=self.security,
+                upload_response=upload_response,
+                transport=self.transport,
+                metadata_cache=self.metadata_cache
+            )
+
+        future = then(future, to_filelink)
+        return future.result() if wait else future
+
+    def upload_many(self, sources, *, store_params=None, security=None, max_requests=None, max_files=None):
+        """
+        Uploads many local files and/or file-like objects and yields results as uploads complete.
 
-        response_json = upload_method(
-            self.apikey, filepath, file_obj, self.storage, params=store_params, security=security or self.security
+        All uploads share the client's connection pool and one scheduler: chunks of all multipart uploads
+        are sent by a single pool of `max_requests` threads, created once for the whole batch,
+        and at most `max_requests` HTTP requests are in flight at the same time across all files.
+        Up to `max_files` lightweight threads start and complete uploads, waiting for their chunks meanwhile.
+        Files that fit in a single chunk are uploaded with a single request,
+        larger files are uploaded using multipart uploads.
+
+        >>> for result in client.upload_many(['path/to/a.jpg', 'path/to/b.jpg']):
+        ...     if result.error:
+        ...         print('{} failed: {}'.format(result.source, result.error))
+        ...     else:
+        ...         print(result.filelink.url)
+
+        Args:
+            sources (iterable): paths to files and/or file-like objects
+            store_params (dict): store parameters to be used for all uploads
+            security (:class:`filestack.Security`): Security object that will be used for these API calls
+            max_requests (int): maximum number of HTTP requests in flight (defaults to client's pool size)
+            max_files (int): maximum number of files uploaded at the same time (defaults to max_requests)
+
+        Returns:
+            iterator of :data:`UploadResult(source, filelink, error)` namedtuples,
+            failed uploads have `filelink` set to None and the exception in `error`
+        """
+        if store_params:  # Check the structure of parameters
+            STORE_SCHEMA.check(store_params)
+
+        sec = security or self.security
+        max_requests = max_requests or self.pool_size
+        transport = RequestsWrapper(
+            session=self.transport.session, limiter=threading.BoundedSemaphore(max_requests)
         )
 
-        handle = response_json['handle']
-        return filestack.models.Filelink(
-            handle,
-            apikey=self.apikey,
-            security=self.security,
-            upload_response=response_json
+        def upload_one(source):
+            if hasattr(source, 'read'):
+                filepath, file_obj = None, source
+            else:
+                filepath, file_obj = os.fspath(source), None
+
+            params = dict(store_params or {})
+            filesize = get_file_info(filepath, file_obj, params)[2]
+            if filesize <= config.DEFAULT_CHUNK_SIZE and not ('workflows' in params or 'upload_tags' in params):
+                response_json = store_upload(
+                    self.apikey, filepath, file_obj, self.storage, params=params, security=sec, transport=transport
+                )
+            else:
+                response_json = multipart_upload(
+                    self.apikey, filepath, file_obj, self.storage, params=params, security=sec, transport=transport,
+                    executor=chunk_executor
+                )
+            return filestack.models.Filelink(
+                response_json['handle'],
+                apikey=self.apikey,
+                security=self.security,
+                upload_response=response_json,
+                transport=self.transport,
+                metadata_cache=self.metadata_cache
+            )
+
+        with ThreadPoolExecutor(max_workers=max_requests) as chunk_executor:
+            for source, filelink, error in run_many(upload_one, sources, max_workers=max_files or max_requests):
+                yield UploadResult(source, filelink, error)
+
+    def metadata_many(self, handles, attributes_list=None, security=None, max_requests=None):
+        """
+        Retrieves metadata of many files and yields results as they arrive.
+
+        Lookups run concurrently over the client's connection pool, with at most `max_requests`
+        requests in flight. If the client has a metadata cache, cached entries are served
+        without a request and fetched entries are added to the cache.
+
+        >>> for result in client.metadata_many(handles, attributes_list=['size', 'filename']):
+        ...     print(result.handle, result.metadata)
+
+        Args:
+            handles (iterable): filelink handles
+            attributes_list (list): list of attributes that you wish to receive
+            security (:class:`filestack.Security`): Security object that will be used for these API calls
+            max_requests (int): maximum number of HTTP requests in flight (defaults to client's pool size)
+
+        Returns:
+            iterator of :data:`MetadataResult(handle, metadata, error)` namedtuples,
+            failed lookups have `metadata` set to None and the exception in `error`
+        """
+        sec = security or self.security
+        max_requests = max_requests or self.pool_size
+        transport = RequestsWrapper(session=self.transport.session, limiter=threading.BoundedSemaphore(max_requests))
+
+        def fetch_metadata(handle):
+            filelink = filestack.models.Filelink(
+                handle, apikey=self.apikey, transport=transport, metadata_cache=self.metadata_cache
+            )
+            return filelink.metadata(attributes_list=attributes_list, security=sec)
+
+        for handle, metadata, error in run_many(fetch_metadata, handles, max_workers=max_requests):
+            yield MetadataResult(handle, metadata, error)
+
+    def av_convert_many(self, conversions, security=None, max_requests=None):
+        """
+        Starts many audio/video conversions.
+
+        Identical conversions (same handle or URL and same parameters, in any order) are requested only once,
+        and all of them get the same :class:`filestack.AudioVisual` object. Requests run concurrently
+        over the client's connection pool, with at most `max_requests` requests in flight.
+
+        >>> results = client.av_convert_many([('HANDLE1', {'preset': 'h264'}), ('HANDLE2', {'preset': 'h264'})])
+        >>> filelinks = [result.audiovisual.wait() for result in results if not result.error]
+
+        Args:
+            conversions (iterable): :data:`(handle, params)` pairs, where handle is a Filestack handle
+                or an external URL and params are keyword arguments of :meth:`filestack.Filelink.av_convert`
+            security (:class:`filestack.Security`): Security object that will be used for these API calls
+            max_requests (int): maximum number of HTTP requests in flight (defaults to client's pool size)
+
+        Returns:
+            list of :data:`ConversionResult(handle, params, audiovisual, error)` namedtuples in the order
+            of conversions, failed requests have `audiovisual` set to None and the exception in `error`
+        """
+        sec = security or self.security
+        max_requests = max_requests or self.pool_size
+        param_names = list(inspect.signature(filestack.models.Transformation.av_convert).parameters)[1:]
+
+        conversions = list(conversions)
+        urls = []
+        for handle, params in conversions:
+            unknown = set(params) - set(param_names)
+            if unknown:
+                raise TypeError('Unknown av_convert parameters: {}'.format(', '.join(sorted(unknown))))
+            # parameters are formatted in the order of av_convert arguments, like in single conversions
+            ordered_params = {name: params[name] for name in param_names if name in params}
+            if '://' in handle:
+                transformation = filestack.models.Transformation(self.apikey, external_url=handle, security=sec)
+            else:
+                transformation = filestack.models.Transformation(self.apikey, handle=handle, security=sec)
+            transformation._append_task(utils.cached_transform_task('video_convert', ordered_params))
+            urls.append(transformation.url)
+
+        def start_conversion(url):
+            response = self.transport.get(url).json()
+            return filestack.models.AudioVisual(
+                url, response['uuid'], response['timestamp'], apikey=self.apikey, security=sec,
+                transport=self.transport
+            )
+
+        started = {
+            url: (audiovisual, error)
+            for url, audiovisual, error in run_many(start_conversion, dict.fromkeys(urls), max_workers=max_requests)
+        }
+        return [
+            ConversionResult(handle, params, *started[url]) for (handle, params), url in zip(conversions, urls)
+        ]
+
+    def delete_many(self, handles, security=None, max_requests=None, retries=DEFAULT_RETRIES, retry_backoff=None):
+        """
+        Deletes many files.
+
+        Requests run concurrently over the client's connection pool, with at most `max_requests` in flight.
+        Request parameters are signed once for all files, and every request failing with a transient error
+        (connection error, timeout, 429 or 5xx response) is retried up to `retries` times.
+        Duplicate handles are deleted once.
+
+        Note:
+            Parameters are signed once for the whole run, so the policy of `security` has to stay valid
+            until the last request is sent. Requests sent after its expiry fail with 403 responses,
+            which are not retried.
+
+        >>> report = client.delete_many(handles, security=security)
+        >>> report
+        <BulkReport 998 succeeded, 2 failed>
+
+        Args:
+            handles (iterable): handles of files to delete
+            security (:class:`filestack.Security`): Security object that will be used for these API calls
+            max_requests (int): maximum number of HTTP requests in flight (defaults to client's pool size)
+            retries (int): maximum number of retries of every request
+            retry_backoff (:class:`filestack.polling.Backoff`): delays between retries
+
+        Returns:
+            :class:`BulkReport`
+        """
+        params = delete_params(self.apikey, security or self.security)
+        url_prefix = '{}/file/'.format(config.API_URL)
+
+        def delete(handle):
+            self.transport.delete(url_prefix + handle, params=params)
+
+        def unique(handles):
+            seen = set()
+            for handle in handles:
+                if handle not in seen:
+                    seen.add(handle)
+                    yield handle
+
+        results = self._run_bulk(
+            lambda handle: (handle, partial(delete, handle), True),
+            unique(handles), max_requests, retries, retry_backoff
         )
+        return BulkReport(results)
+
+    def overwrite_many(self, pairs, security=None, base64decode=False, max_requests=None, retries=DEFAULT_RETRIES,
+                       retry_backoff=None):
+        """
+        Overwrites many files with new content.
+
+        Works like :meth:`delete_many`. Content of every file is given as a URL (string containing `://`),
+        a path to a local file or a file-like object. File-like objects are sent from their beginning
+        and are retried only if they are seekable. Malformed pairs are reported as failed,
+        with `handle` set to the first element of the pair (or None).
+
+        Note:
+            Parameters are signed once for the whole run, so the policy of `security` has to stay valid
+            until the last request is sent. Requests sent after its expiry fail with 403 responses,
+            which are not retried.
+
+        >>> report = client.overwrite_many([('HANDLE1', 'https://new.content/url'), ('HANDLE2', 'path/to/file')])
+
+        Args:
+            pairs (iterable): :data:`(handle, content)` pairs
+            security (:class:`filestack.Security`): Security object that will be used for these API calls
+            base64decode (bool): indicates if content should be decoded before it is stored
+            max_requests (int): maximum number of HTTP requests in flight (defaults to client's pool size)
+            retries (int): maximum number of retries of every request
+            retry_backoff (:class:`filestack.polling.Backoff`): delays between retries
+
+        Returns:
+            :class:`BulkReport`
+        """
+        params = overwrite_params(security or self.security, base64decode)
+        url_prefix = '{}/file/'.format(config.API_URL)
+
+        def overwrite(handle, content):
+            url = url_prefix + handle
+            if isinstance(content, str) and '://' in content:
+                self.transport.post(url, params=params, data={'url': content})
+            elif hasattr(content, 'read'):
+                if is_seekable(content):
+                    content.seek(0)
+                files = {'fileUpload': ('filename', content, 'application/octet-stream')}
+                self.transport.post(url, params=params, files=files)
+            else:
+                with open(os.fspath(content), 'rb') as f:
+                    files = {'fileUpload': ('filename', f, 'application/octet-stream')}
+                    self.transport.post(url, params=params, files=files)
+
+        def make_call(pair):
+            handle, content = pair
+            can_retry = not hasattr(content, 'read') or is_seekable(content)
+            return handle, partial(overwrite, handle, content), can_retry
+
+        def handle_of(pair):
+            try:
+                return pair[0]
+            except (TypeError, IndexError, KeyError):
+                return None
+
+        return BulkReport(self._run_bulk(make_call, pairs, max_requests, retries, retry_backoff, handle_of))
+
+    def _run_bulk(self, make_call, items, max_requests, retries, retry_backoff, handle_of=None):
+        """
+        Runs `make_call(item) -> (handle, call, can_retry)` calls on a pool of threads
+        and returns their :data:`BulkResult` in the order they complete.
+        If `make_call` fails, the result is reported for `handle_of(item)` (the item itself by default)
+        """
+        retry_backoff = retry_backoff or RETRY_BACKOFF
+
+        def run(item):
+            handle, call, can_retry = make_call(item)
+            attempts, error = call_with_retries(call, retries if can_retry else 0, retry_backoff)
+            if error is None and self.metadata_cache is not None:
+                self.metadata_cache.invalidate(handle)
+            return BulkResult(handle, error, attempts)
+
+        results = []
+        for item, result, error in run_many(run, items, max_workers=max_requests or self.pool_size):
+            if error is not None:
+                result = BulkResult(handle_of(item) if handle_of else item, error, 0)
+            results.append(result)
+        return results
@@ -4,6 +4,36 @@ from filestack.mixins import CommonMixin
 from filestack.mixins import ImageTransformationMixin
 
 
+def metadata_params(attributes_list=None, security=None):
+    params = {}
+    for item in attributes_list or []:
+        params[item] = 'true'
+    if security is not None:
+        params.update(security.as_params())
+    return params
+
+
+def delete_params(apikey=None, security=None):
+    if security is None:
+        raise Exception('Security is required to delete filelink')
+
+    if apikey is None:
+        raise Exception('Apikey is required to delete filelink')
+
+    params = security.as_params()
+    params['key'] = apikey
+    return params
+
+
+def overwrite_params(security=None, base64decode=False):
+    if security is None:
+        raise Exception('Security is required to overwrite filelink')
+
+    params = security.as_params()
+    params['base64decode'] = str(base64decode).lower()
+    return params
+
+
 class Filelink(ImageTransformationMixin, CommonMixin):
     """
     Filelink object represents a file that whas uploaded to Filestack.
@@ -15,18 +45,24 @@ class Filelink(ImageTransformationMixin, CommonMixin):
     >>> flink.url
     'https://cdn.filestackcontent.com/sm9IEXAMPLEQuzfJykmA'
     """
-    def __init__(self, handle, apikey=None, security=None, upload_response=None):
+    def __init__(self, handle, apikey=None, security=None, upload_response=None, transport=None,
+                 metadata_cache=None):
         """
         Args:
             handle (str): The path of the file to wrap
             apikey (str): Filestack API key that may be required for some API calls
             security (:class:`filestack.Security`): Security object that will be used by default
                for all API calls
+            transport (:class:`filestack.utils.RequestsWrapper`): wrapper (usually shared with
+               a :class:`filestack.Client`) used to send API calls through a pooled session
+            metadata_cache (:class:`filestack.MetadataCache`): cache used to serve repeated metadata calls
         """
         self.apikey = apikey
         self.handle = handle
         self.security = security
         self.upload_response = upload_response
+        self.transport = transport or requests
+        self.metadata_cache = metadata_cache
 
     def __repr__(self):
         return '<Filelink {}>'.format(self.handle)
@@ -53,14 +89,16 @@ class Filelink(ImageTransformationMixin, CommonMixin):
         Returns:
             `dict`: A buffered writable file descriptor
         """
-        attributes_list = attributes_list or []
-        params = {}
-        for item in attributes_list:
-            params[item] = 'true'
-        sec = security or self.security
-        if sec is not None:
-            params.update({'policy': sec.policy_b64, 'signature': sec.signature})
-        return requests.get(self.url + '/metadata', params=params).json()
+        if self.metadata_cache is not None:
+            metadata = self.metadata_cache.get(self.handle, attributes_list)
+            if metadata is not None:
+                return metadata
+
+        params = metadata_params(attributes_list, security or self.security)
+        metadata = self.transport.get(self.url + '/metadata', params=params).json()
+        if self.metadata_cache is not None:
+            self.metadata_cache.put(self.handle, attributes_list, metadata)
+        return metadata
 
     def delete(self, apikey=None, security=None):
         """
@@ -74,22 +112,11 @@ class Filelink(ImageTransformationMixin, CommonMixin):
         Returns:
             None
         """
-        sec = security or self.security
-        apikey = apikey or self.apikey
-
-        if sec is None:
-            raise Exception('Security is required to delete filelink')
-
-        if apikey is None:
-            raise Exception('Apikey is required to delete filelink')
-
+        params = delete_params(apikey or self.apikey, security or self.security)
         url = '{}/file/{}'.format(config.API_URL, self.handle)
-        delete_params = {
-            'key': apikey,
-            'policy': sec.policy_b64,
-            'signature': sec.signature
-        }
-        requests.delete(url, params=delete_params)
+        self.transport.delete(url, params=params)
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(self.handle)
 
     def overwrite(self, *, filepath=None, url=None, file_obj=None, base64decode=False, security=None):
         """
@@ -107,26 +134,21 @@ class Filelink(ImageTransformationMixin, CommonMixin):
             This method accepts keyword arguments only.
             Out of filepath, url and file_obj only one should be provided.
         """
-        sec = security or self.security
-        if sec is None:
-            raise Exception('Security is required to overwrite filelink')
-        req_params = {
-            'policy': sec.policy_b64,
-            'signature': sec.signature,
-            'base64decode': str(base64decode).lower()
-        }
+        req_params = overwrite_params(security or self.security, base64decode)
 
         request_url = '{}/file/{}'.format(config.API_URL, self.handle)
         if url:
-            requests.post(request_url, params=req_params, data={'url': url})
+            self.transport.post(request_url, params=req_params, data={'url': url})
         elif filepath:
             with open(filepath, 'rb') as f:
                 files = {'fileUpload': ('filename', f, 'application/octet-stream')}
-                requests.post(request_url, params=req_params, files=files)
+                self.transport.post(request_url, params=req_params, files=files)
         elif file_obj:
             files = {'fileUpload': ('filename', file_obj, 'application/octet-stream')}
-            requests.post(request_url, params=req_params, files=files)
+            self.transport.post(request_url, params=req_params, files=files)
         else:
             raise Exception('filepath, file_obj or url argument must be provided')
 
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(self.handle)
         return self
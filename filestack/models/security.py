@@ -1,7 +1,28 @@
 import base64
+import copy
 import hashlib
 import hmac
 import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+SIGNING_CACHE_SIZE = 4096
+SECURITY_FACTORY_SIZE = 4096
+
+
+@lru_cache(maxsize=SIGNING_CACHE_SIZE)
+def sign_policy(policy_json, secret):
+    """
+    Returns `(policy_b64, signature)` for a JSON encoded policy.
+    Results are memoized, so signing the same policy with the same secret again
+    skips the base64 encoding and HMAC computation.
+    """
+    policy_b64 = base64.urlsafe_b64encode(policy_json.encode('utf-8')).decode('utf-8')
+    signature = hmac.new(secret.encode('utf-8'), policy_b64.encode('utf-8'), hashlib.sha256).hexdigest()
+    return policy_b64, signature
 
 
 class Security:
@@ -16,19 +37,79 @@ class Security:
     'eyJjYWxsIjogWyJyZWFkIl0sICJleHBpcnkiOiAxNTYyNzYzMTQ2fQ=='
     >>> sec.signature
     '89f1325dca54cfce976163fb692bb266f28129525b8c6bb0eeadf4b7d450e2f0'
+
+    Security objects are immutable, so they can be safely shared and reused for many API calls.
+    Signatures are memoized by policy and secret (up to :data:`SIGNING_CACHE_SIZE` entries).
     """
+    __slots__ = ('_policy', 'secret', 'policy_b64', 'signature', '_url_string', '_params')
+
     def __init__(self, policy, secret):
         """
         Args:
             policy (dict): policy to be used
             secret (str): your application secret
         """
-        self.policy = policy
-        self.secret = secret
-        self.policy_b64 = base64.urlsafe_b64encode(json.dumps(policy, sort_keys=True).encode('utf-8')).decode('utf-8')
-        self.signature = hmac.new(
-            secret.encode('utf-8'), self.policy_b64.encode('utf-8'), hashlib.sha256
-        ).hexdigest()
+        policy_b64, signature = sign_policy(json.dumps(policy, sort_keys=True), secret)
+        set_attribute = super().__setattr__
+        set_attribute('_policy', copy.deepcopy(policy))
+        set_attribute('secret', secret)
+        set_attribute('policy_b64', policy_b64)
+        set_attribute('signature', signature)
+        set_attribute('_url_string', 'security=p:{},s:{}'.format(policy_b64, signature))
+        set_attribute('_params', (('policy', policy_b64), ('signature', signature)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Security objects are immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('Security objects are immutable')
+
+    def __reduce__(self):
+        # slots can't be restored through the immutable __setattr__, so objects are re-created (and re-signed)
+        return Security, (self._policy, self.secret)
+
+    def __eq__(self, other):
+        if not isinstance(other, Security):
+            return NotImplemented
+        return self.signature == other.signature and self.policy_b64 == other.policy_b64
+
+    def __hash__(self):
+        return hash(self.signature)
+
+    def __repr__(self):
+        return '<Security {}>'.format(self._policy)
+
+    @property
+    def policy(self):
+        """
+        Returns a (deep) copy of the signed policy
+        """
+        return copy.deepcopy(self._policy)
+
+    @classmethod
+    def sign_many(cls, policies, secret):
+        """
+        Creates Security objects for many policies signed with the same secret.
+        Identical policies share one Security object.
+
+        >>> securities = Security.sign_many([{'expiry': 1562763146, 'handle': h} for h in handles], 'SECRET')
+
+        Args:
+            policies (iterable): policies (dicts) to be signed
+            secret (str): your application secret
+
+        Returns:
+            list: :class:`filestack.Security` objects, in the order of policies
+        """
+        signed = {}
+        result = []
+        for policy in policies:
+            policy_json = json.dumps(policy, sort_keys=True)
+            security = signed.get(policy_json)
+            if security is None:
+                security = signed[policy_json] = cls(policy, secret)
+            result.append(security)
+        return result
 
     def as_url_string(self):
         """
@@ -37,4 +118,95 @@ class Security:
         Returns:
             str: url part in the form of :data:`security=p:\\<encoded policy>,s:\\<signature>`
         """
-        return 'security=p:{},s:{}'.format(self.policy_b64, self.signature)
+        return self._url_string
+
+    def as_params(self):
+        """
+        Returns policy and signature as query parameters (or payload fields) of API calls
+
+        Returns:
+            dict: :data:`{'policy': <encoded policy>, 'signature': <signature>}`
+        """
+        return dict(self._params)
+
+
+class SecurityFactory:
+    """
+    Creates Security objects with expiry rounded up to time buckets.
+
+    All policies created within one bucket share the same expiry, so for a given handle
+    and call set the factory returns the same Security object (and signed URLs of a Transformation
+    stay byte-identical) until the bucket changes. This keeps signed URLs cacheable by CDNs and browsers.
+    At most `max_size` recently used Security objects are kept; evicted ones are signed again
+    with the same expiry, so their URLs don't change.
+
+    >>> factory = SecurityFactory('SECURITY-SECRET', bucket=3600, min_lifetime=900)
+    >>> filelink.resize(width=400).signed_url(factory.get(handle=filelink.handle, call=['read', 'convert']))
+    """
+    def __init__(self, secret, bucket=3600, min_lifetime=None, policy=None, max_size=SECURITY_FACTORY_SIZE):
+        """
+        Args:
+            secret (str): your application secret
+            bucket (int): length of expiry buckets in seconds
+            min_lifetime (int): minimal number of seconds policies stay valid after they are handed out,
+                defaults to bucket length
+            policy (dict): additional policy fields (e.g. :data:`{'path': '/avatars/'}`) included in all policies
+            max_size (int): maximum number of Security objects kept for reuse
+        """
+        self.secret = secret
+        self.bucket = bucket
+        self.min_lifetime = bucket if min_lifetime is None else min_lifetime
+        self.policy = dict(policy or {})
+        self.max_size = max_size
+        self._expiry = None
+        self._securities = OrderedDict()
+        self._lock = threading.Lock()
+
+    def expiry(self, now=None):
+        """
+        Returns expiry timestamp for policies created at `now` (defaults to current time)
+        """
+        now = time.time() if now is None else now
+        return int(math.ceil((now + self.min_lifetime) / self.bucket) * self.bucket)
+
+    def get(self, handle=None, call=None, **policy):
+        """
+        Returns Security for the current bucket
+
+        Args:
+            handle (str): handle the policy is restricted to
+            call (list): allowed calls, e.g. :data:`['read', 'convert']`
+            **policy: other policy fields (expiry is set by the factory and can't be passed)
+
+        Returns:
+            :class:`filestack.Security`
+        """
+        if 'expiry' in policy:
+            raise ValueError('expiry is set by SecurityFactory, use bucket and min_lifetime to control it')
+
+        expiry = self.expiry()
+        key = (handle, tuple(sorted(call)) if call is not None else None, json.dumps(policy, sort_keys=True))
+        with self._lock:
+            if self._expiry is None or expiry > self._expiry:
+                # securities of previous buckets are not handed out anymore
+                self._expiry = expiry
+                self._securities = OrderedDict()
+            security = self._securities.get(key) if expiry == self._expiry else None
+            if security is not None:
+                self._securities.move_to_end(key)
+
+        if security is None:
+            full_policy = dict(self.policy, expiry=expiry, **policy)
+            if handle is not None:
+                full_policy['handle'] = handle
+            if call is not None:
+                full_policy['call'] = sorted(call)
+            security = Security(full_policy, self.secret)
+            with self._lock:
+                if expiry == self._expiry:
+                    security = self._securities.setdefault(key, security)
+                    self._securities.move_to_end(key)
+                    if len(self._securities) > self.max_size:
+                        self._securities.popitem(last=False)
+
+        return security
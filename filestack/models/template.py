@@ -0,0 +1,124 @@
+from filestack import config
+from filestack import utils
+from filestack.mixins import ImageTransformationMixin
+
+
+class TransformationTemplate(ImageTransformationMixin):
+    """
+    Transformation templates are immutable chains of transformation tasks that are not bound
+    to any file. Tasks are formatted once, when the template is built, and binding a template
+    to a handle or an external URL only concatenates strings, so a single template can be shared
+    between threads and used for any number of files.
+
+    Chaining transformations on a template returns a new template and leaves the original unchanged.
+
+    >>> from filestack import TransformationTemplate
+    >>> thumbnail = TransformationTemplate().resize(width=800).quality(value=80).auto_image()
+    >>> thumbnail.url_for('sm9IEXAMPLEQuzfJykmA')
+    'https://cdn.filestackcontent.com/resize=width:800/quality=value:80/auto_image/sm9IEXAMPLEQuzfJykmA'
+    >>> thumbnail.urls_for(['HANDLE1', 'HANDLE2'], security=security)
+    """
+    __slots__ = ('apikey', 'tasks', '_tasks_prefix')
+
+    def __init__(self, apikey=None, tasks=()):
+        """
+        Args:
+            apikey (str): Filestack API key, required to bind the template to external URLs
+            tasks (iterable): formatted transformation tasks, e.g. :data:`['resize=width:800', 'flip']`
+        """
+        set_attribute = super().__setattr__
+        set_attribute('apikey', apikey)
+        set_attribute('tasks', tuple(tasks))
+        set_attribute('_tasks_prefix', ''.join(task + '/' for task in self.tasks))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('TransformationTemplate objects are immutable')
+
+    def __eq__(self, other):
+        if not isinstance(other, TransformationTemplate):
+            return NotImplemented
+        return (self.apikey, self.tasks) == (other.apikey, other.tasks)
+
+    def __hash__(self):
+        return hash((self.apikey, self.tasks))
+
+    def __repr__(self):
+        return '<TransformationTemplate {}>'.format(self._tasks_prefix.rstrip('/'))
+
+    @classmethod
+    def from_transformation(cls, transformation):
+        """
+        Creates a template with the tasks of a :class:`filestack.Transformation`
+
+        Args:
+            transformation (:class:`filestack.Transformation`): transformation to take tasks from
+
+        Returns:
+            :class:`filestack.TransformationTemplate`
+        """
+        return cls(apikey=transformation.apikey, tasks=transformation._transformation_tasks)
+
+    def prefix(self, security=None, external=False):
+        """
+        Returns the part of URLs preceding handle (or external URL)
+
+        Args:
+            security (:class:`filestack.Security`): Security object used to sign URLs
+            external (bool): if the template will be bound to external URLs
+
+        Returns:
+            str: URL prefix
+        """
+        prefix = config.CDN_URL + '/'
+        if external:
+            if self.apikey is None:
+                raise ValueError('Apikey is required to transform external urls')
+            prefix += self.apikey + '/'
+        prefix += self._tasks_prefix
+        if security is not None:
+            prefix += security.as_url_string() + '/'
+        return prefix
+
+    def url_for(self, handle_or_url, security=None):
+        """
+        Returns URL of the transformation applied to a file
+
+        Args:
+            handle_or_url (str): Filestack handle or external URL
+            security (:class:`filestack.Security`): Security object used to sign the URL
+
+        Returns:
+            str: transformation URL
+        """
+        return self.prefix(security=security, external='://' in handle_or_url) + handle_or_url
+
+    def urls_for(self, handles, security=None):
+        """
+        Returns URLs of the transformation applied to many files
+
+        Args:
+            handles (iterable): Filestack handles and/or external URLs
+            security (:class:`filestack.Security`): Security object used to sign all URLs
+
+        Returns:
+            list: transformation URLs, in the order of handles
+        """
+        prefix = self.prefix(security=security)
+        external_prefix = None
+        urls = []
+        for handle in handles:
+            if '://' in handle:
+                if external_prefix is None:
+                    external_prefix = self.prefix(security=security, external=True)
+                urls.append(external_prefix + handle)
+            else:
+                urls.append(prefix + handle)
+        return urls
+
+    def av_convert(self, **kwargs):
+        raise TypeError('av_convert starts a conversion and cannot be used in templates')
+
+    def _add_transform_task(self, transformation, params):
+        params.pop('self')
+        task = utils.cached_transform_task(transformation, params)
+        return TransformationTemplate(apikey=self.apikey, tasks=self.tasks + (task,))
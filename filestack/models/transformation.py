@@ -1,4 +1,5 @@
 from filestack import config
+from filestack.utils import requests
 
 from filestack.mixins import ImageTransformationMixin, CommonMixin
 
@@ -19,23 +20,31 @@ class Transformation(ImageTransformationMixin, CommonMixin):
     'https://cdn.filestackcontent.com/NEW_HANDLE'
     """
 
-    def __init__(self, apikey=None, handle=None, external_url=None, security=None):
+    __slots__ = ('apikey', 'handle', 'security', 'external_url', 'transport', '_transformation_tasks', '_tasks_str')
+
+    def __init__(self, apikey=None, handle=None, external_url=None, security=None, transport=None):
         self.apikey = apikey
         self.handle = handle
         self.security = security
         self.external_url = external_url
+        self.transport = transport or requests
         self._transformation_tasks = []
+        self._tasks_str = ''
 
-    def _build_url(self, security=None):
-        url_elements = [config.CDN_URL, self.handle or self.external_url]
-
-        if self._transformation_tasks:
-            tasks_str = '/'.join(self._transformation_tasks)
-            url_elements.insert(1, tasks_str)
+    def _append_task(self, task):
+        self._transformation_tasks.append(task)
+        self._tasks_str = None
 
-        if self.external_url:
-            url_elements.insert(1, self.apikey)
+    def _build_url(self, security=None):
+        tasks_str = self._tasks_str
+        if tasks_str is None:  # joined tasks are cached until the next task is added
+            tasks_str = self._tasks_str = '/'.join(self._transformation_tasks)
 
+        path = self.handle or self.external_url
         if security is not None:
-            url_elements.insert(-1, security.as_url_string())
-        return '/'.join(url_elements)
+            path = security.as_url_string() + '/' + path
+        if tasks_str:
+            path = tasks_str + '/' + path
+        if self.external_url:
+            path = self.apikey + '/' + path
+        return config.CDN_URL + '/' + path
@@ -0,0 +1,148 @@
+"""
+Polling of long running server-side operations (e.g. file assembly after ``/multipart/complete``).
+
+A single :class:`Poller` thread keeps all pending polls on a heap ordered by the time of their next
+attempt, so any number of operations can be awaited without blocking a thread per operation.
+Every poll is represented by a :class:`concurrent.futures.Future`.
+"""
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import Future
+
+
+class Backoff:
+    """
+    Delays between poll attempts: exponential, capped at `max_delay` and randomized by `jitter`
+    (a fraction of the delay, so concurrent polls don't synchronize), with a `deadline` (in seconds)
+    after which polling fails with :class:`TimeoutError`.
+    """
+    def __init__(self, initial=0.2, factor=2, max_delay=5, jitter=0.5, deadline=120):
+        self.initial = initial
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.deadline = deadline
+
+    def delay(self, attempt):
+        """
+        Returns delay before retry number `attempt` (starting from 0)
+        """
+        delay = min(self.initial * self.factor ** attempt, self.max_delay)
+        return delay * (1 - self.jitter * random.random())
+
+
+DEFAULT_BACKOFF = Backoff()
+
+
+def resolved(result):
+    """
+    Returns a completed future with the given result
+    """
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def then(future, func):
+    """
+    Returns a future resolving to `func(result)` of the given future (or to its exception)
+    """
+    chained = Future()
+
+    def callback(done):
+        try:
+            chained.set_result(func(done.result()))
+        except BaseException as e:
+            chained.set_exception(e)
+
+    future.add_done_callback(callback)
+    return chained
+
+
+class Poller:
+    """
+    Runs polls on one background thread.
+
+    A poll is a callable returning `(done, result)`. It is called until it reports `done`
+    (the future resolves to `result`), raises (the future fails with the exception)
+    or the backoff deadline passes (the future fails with :class:`TimeoutError`).
+    Polls run one at a time, so they should be short (e.g. a single HTTP request).
+    """
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def __len__(self):
+        return len(self._heap)
+
+    def submit(self, poll, backoff=None, first_attempt=0):
+        """
+        Schedules poll and returns a future of its result.
+
+        Args:
+            poll (callable): function returning `(done, result)`
+            backoff (:class:`Backoff`): delays between attempts and deadline
+            first_attempt (int): number of attempts already made, the first delay is
+                computed for this attempt (poll is scheduled immediately if 0)
+        """
+        backoff = backoff or DEFAULT_BACKOFF
+        future = Future()
+        now = time.monotonic()
+        due = now + backoff.delay(first_attempt - 1) if first_attempt else now
+        self._schedule(due, (poll, backoff, future, now + backoff.deadline, first_attempt))
+        return future
+
+    def _schedule(self, due, entry):
+        with self._condition:
+            heapq.heappush(self._heap, (due, next(self._counter), entry))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='filestack-poller', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._condition.wait(timeout)
+                _, _, entry = heapq.heappop(self._heap)
+
+            poll, backoff, future, deadline, attempt = entry
+            if future.cancelled():
+                continue
+            try:
+                done, result = poll()
+            except BaseException as e:
+                future.set_exception(e)
+                continue
+
+            if done:
+                future.set_result(result)
+                continue
+
+            due = time.monotonic() + backoff.delay(attempt)
+            if due > deadline:
+                future.set_exception(TimeoutError('Operation not completed within {}s'.format(backoff.deadline)))
+            else:
+                self._schedule(due, (poll, backoff, future, deadline, attempt + 1))
+
+
+_default_poller = None
+_default_poller_lock = threading.Lock()
+
+
+def default_poller():
+    """
+    Returns poller shared by all API calls that don't specify one
+    """
+    global _default_poller
+    with _default_poller_lock:
+        if _default_poller is None:
+            _default_poller = Poller()
+        return _default_poller
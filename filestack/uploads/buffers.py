@@ -0,0 +1,81 @@
+import os
+import mmap
+
+
+class MappedFile:
+    """
+    Read-only memory map of a local file.
+    Slices are memoryviews of the mapping, so file regions are read (paged in) only once,
+    and can be hashed and sent without copying them into new buffers.
+
+    >>> with MappedFile('path/to/file') as mapped:
+    ...     chunk = mapped.slice(0, 1024)
+    """
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self._file = open(filepath, 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        self._mmap = None
+        if self.size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+        else:  # empty files cannot be mapped
+            self._view = memoryview(b'')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def slice(self, offset, length):
+        return self._view[offset:offset + length]
+
+    def close(self):
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:  # slices are still referenced, mapping is closed when they are released
+                pass
+        self._file.close()
+
+
+class BufferReader:
+    """
+    File-like wrapper around a memoryview, used as request body.
+    Data is sent in slices of the original buffer instead of being copied into a bytes object.
+    """
+    def __init__(self, buffer):
+        self._view = memoryview(buffer)
+        self._position = 0
+
+    def __len__(self):
+        return len(self._view)
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = len(self._view) - self._position
+        data = self._view[self._position:self._position + size]
+        self._position += len(data)
+        return data
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += len(self._view)
+        self._position = max(0, min(offset, len(self._view)))
+        return self._position
+
+
+def as_body(data):
+    """
+    Returns request body for chunk data, memoryviews are wrapped so they are sent without copying
+    """
+    if isinstance(data, memoryview):
+        return BufferReader(data)
+    return data
@@ -2,7 +2,7 @@ from filestack import config
 from filestack.utils import requests
 
 
-def upload_external_url(url, apikey, storage, store_params=None, security=None):
+def make_process_payload(url, apikey, storage, store_params=None, security=None):
     store_params = store_params or {}
     if storage and not store_params.get('location'):
         store_params['location'] = storage
@@ -29,5 +29,10 @@ def upload_external_url(url, apikey, storage, store_params=None, security=None):
             }
         })
 
-    response = requests.post('{}/process'.format(config.CDN_URL), json=payload)
+    return payload
+
+
+def upload_external_url(url, apikey, storage, store_params=None, security=None, transport=None):
+    payload = make_process_payload(url, apikey, storage, store_params, security)
+    response = (transport or requests).post('{}/process'.format(config.CDN_URL), json=payload)
     return response.json()
@@ -0,0 +1,91 @@
+"""
+MD5 digests of uploaded chunks.
+
+hashlib releases the GIL while hashing buffers larger than 2 KB, so memoryviews of mapped files
+hashed in upload threads are already hashed in parallel with network I/O of other threads.
+:class:`ProcessHasher` moves hashing of local file regions to a pool of processes,
+for very large uploads where the interpreter running upload threads is the bottleneck.
+Regions are handed off as ``(filepath, offset, length)`` and every worker maps the file itself,
+so chunk data are never pickled or copied between processes.
+"""
+import hashlib
+import threading
+from base64 import b64encode
+
+from filestack.uploads.buffers import MappedFile
+
+MIN_PROCESS_HASH_SIZE = 1024 ** 2
+
+
+def md5_b64(data):
+    """
+    Returns base64 encoded MD5 digest of bytes-like object, as expected by upload endpoints
+    """
+    return b64encode(hashlib.md5(data).digest()).decode('utf-8')
+
+
+def md5_region(filepath, offset, length):
+    """
+    Returns base64 encoded MD5 digest of a region of a local file, runs in hashing processes
+    """
+    with MappedFile(filepath) as mapped:
+        region = mapped.slice(offset, length)
+        try:
+            return md5_b64(region)
+        finally:
+            region.release()
+
+
+class ProcessHasher:
+    """
+    Hashes chunks of local files in a pool of processes.
+
+    >>> with ProcessHasher(workers=4) as hasher:
+    ...     client.upload(filepath='path/to/large/file', hasher=hasher)
+
+    One hasher can be shared by many uploads. Chunks of streams (which have no file to map)
+    and chunks smaller than `min_size` are hashed in the calling thread,
+    as handing them off would cost more than hashing them.
+    """
+    def __init__(self, workers=None, min_size=MIN_PROCESS_HASH_SIZE):
+        """
+        Args:
+            workers (int): number of hashing processes, defaults to the number of CPUs
+            min_size (int): smallest chunk (in bytes) hashed in another process
+        """
+        self.workers = workers
+        self.min_size = min_size
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def md5(self, data, filepath=None, offset=0):
+        """
+        Returns base64 encoded MD5 digest of chunk data
+
+        Args:
+            data (bytes-like): chunk data
+            filepath (str): local file the chunk was read from
+            offset (int): position of the chunk in the file
+        """
+        if filepath is None or len(data) < self.min_size:
+            return md5_b64(data)
+        return self._get_executor().submit(md5_region, filepath, offset, len(data)).result()
+
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                from concurrent.futures import ProcessPoolExecutor
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
@@ -1,18 +1,18 @@
-import io
 import os
 import sys
 import mimetypes
 import multiprocessing
-import hashlib
 import logging
 import functools
+import time
 import threading
-from urllib3.util.retry import Retry
 from concurrent.futures import ThreadPoolExecutor
 
-from base64 import b64encode
-
 from filestack.utils import requests
+from filestack.uploads.buffers import MappedFile, as_body
+from filestack.uploads.hashing import md5_b64
+from filestack.uploads.multipart import complete_upload
+from filestack.polling import then
 
 from filestack import config
 
@@ -27,24 +27,115 @@ MB = 1024 ** 2
 DEFAULT_PART_SIZE = 8 * MB
 CHUNK_SIZE = 8 * MB
 MIN_CHUNK_SIZE = 32 * 1024
+CHUNK_SIZE_STEP = 1 * MB
 MAX_DELAY = 4
 NUM_THREADS = multiprocessing.cpu_count()
 
-lock = threading.Lock()
 
+class ChunkSizeController:
+    """
+    Controls size of chunks sent by Intelligent Ingestion uploads (AIMD).
+
+    Every failed chunk halves the chunk size (down to `min_size`, below which the upload fails),
+    every successful full-size chunk increases it by `step` (up to `max_size`),
+    so chunks grow back once the network recovers.
+    A controller should be created per upload (or per destination) and shared
+    by all threads uploading its parts.
+
+    >>> controller = ChunkSizeController()
+    >>> client.upload(filepath='path/to/file', intelligent=True, chunk_controller=controller)
+    >>> controller.chunk_size, controller.throughput  # can be read from another thread for monitoring
+    """
+    def __init__(self, initial_size=CHUNK_SIZE, min_size=MIN_CHUNK_SIZE, max_size=DEFAULT_PART_SIZE,
+                 step=CHUNK_SIZE_STEP, smoothing=0.2):
+        """
+        Args:
+            initial_size (int): chunk size used for the first chunks
+            min_size (int): smallest allowed chunk size
+            max_size (int): largest allowed chunk size
+            step (int): number of bytes added to chunk size after each successful chunk
+            smoothing (float): weight of the latest chunk in the throughput estimate
+        """
+        self.min_size = min_size
+        self.max_size = max_size
+        self.step = step
+        self.smoothing = smoothing
+        self.failures = 0
+        self._chunk_size = min(initial_size, max_size)
+        self._throughput = None
+        self._lock = threading.Lock()
+
+    @property
+    def chunk_size(self):
+        """
+        Returns current chunk size in bytes
+        """
+        return self._chunk_size
+
+    @property
+    def throughput(self):
+        """
+        Returns estimated upload throughput (bytes per second) or None before the first chunk is sent
+        """
+        return self._throughput
+
+    def success(self, size, elapsed):
+        """
+        Records successful upload of `size` bytes which took `elapsed` seconds
+        """
+        with self._lock:
+            if elapsed > 0:
+                current = size / elapsed
+                if self._throughput is None:
+                    self._throughput = current
+                else:
+                    self._throughput += self.smoothing * (current - self._throughput)
+
+            if size >= self._chunk_size:
+                self._chunk_size = min(self._chunk_size + self.step, self.max_size)
+
+    def failure(self, size):
+        """
+        Records failed upload of a chunk of `size` bytes.
+        Chunk size is halved only once for all chunks which failed with the same size,
+        e.g. by parallel threads, and never drops below `min_size`. If a chunk of minimal size fails,
+        an exception is raised and the chunk size stays at `min_size`, so a shared controller remains usable.
+        """
+        with self._lock:
+            self.failures += 1
+            if self._chunk_size >= size:
+                if self._chunk_size <= self.min_size:
+                    raise Exception('Minimal chunk size failed')
+                self._chunk_size = max(self._chunk_size // 2, self.min_size)
+
+
+def upload_part(apikey, filename, filepath, filesize, storage, start_response, part, transport=None,
+                controller=None, hasher=None):
+    transport = transport or requests
+    controller = controller or ChunkSizeController()
+
+    with MappedFile(filepath) as mapped:
+        part_data = mapped.slice(part['seek_point'], DEFAULT_PART_SIZE)
+        upload_part_data(
+            apikey, storage, start_response, part, part_data, transport, controller, hasher=hasher, filepath=filepath
+        )
 
-def decrease_chunk_size():
-    global CHUNK_SIZE
-    CHUNK_SIZE //= 2
-    if CHUNK_SIZE < MIN_CHUNK_SIZE:
-        raise Exception('Minimal chunk size failed')
+    payload = {
+        'apikey': apikey,
+        'uri': start_response['uri'],
+        'region': start_response['region'],
+        'upload_id': start_response['upload_id'],
+        'store': {'location': storage},
+        'part': part['num'],
+        'size': filesize
+    }
 
+    url = 'https://{}/multipart/commit'.format(start_response['location_url'])
+    transport.post(url, json=payload)
 
-def upload_part(apikey, filename, filepath, filesize, storage, start_response, part):
-    with open(filepath, 'rb') as f:
-        f.seek(part['seek_point'])
-        part_bytes = io.BytesIO(f.read(DEFAULT_PART_SIZE))
 
+def upload_part_data(apikey, storage, start_response, part, part_data, transport, controller, hasher=None,
+                     filepath=None):
     payload_base = {
         'apikey': apikey,
         'uri': start_response['uri'],
@@ -54,45 +145,62 @@ def upload_part(apikey, filename, filepath, filesize, storage, start_response, p
         'part': part['num']
     }
 
-    global CHUNK_SIZE
-    chunk_data = part_bytes.read(CHUNK_SIZE)
     offset = 0
+    chunk_data = part_data[offset:offset + controller.chunk_size]
 
     while chunk_data:
         payload = payload_base.copy()
         payload.update({
             'size': len(chunk_data),
-            'md5': b64encode(hashlib.md5(chunk_data).digest()).strip().decode('utf-8'),
+            'md5': md5_b64(chunk_data) if hasher is None else hasher.md5(
+                chunk_data, filepath=filepath, offset=part['seek_point'] + offset
+            ),
             'offset': offset,
             'fii': True
         })
 
         try:
+            started_at = time.monotonic()
             url = 'https://{}/multipart/upload'.format(start_response['location_url'])
-            api_resp = requests.post(url, json=payload).json()
-            s3_resp = requests.put(api_resp['url'], headers=api_resp['headers'], data=chunk_data)
+            api_resp = transport.post(url, json=payload).json()
+            s3_resp = transport.put(api_resp['url'], headers=api_resp['headers'], data=as_body(chunk_data))
             if not s3_resp.ok:
                 raise Exception('Incorrect S3 response')
+            controller.success(len(chunk_data), time.monotonic() - started_at)
             offset += len(chunk_data)
-            chunk_data = part_bytes.read(CHUNK_SIZE)
         except Exception as e:
             log.error('Upload failed: %s', str(e))
-            with lock:
-                if CHUNK_SIZE >= len(chunk_data):
-                    decrease_chunk_size()
+            controller.failure(len(chunk_data))
 
-            part_bytes.seek(offset)
-            chunk_data = part_bytes.read(CHUNK_SIZE)
+        chunk_data.release()
+        chunk_data = part_data[offset:offset + controller.chunk_size]
 
-    payload = payload_base.copy()
-    payload.update({'size': filesize})
+    chunk_data.release()
+    part_data.release()
 
-    url = 'https://{}/multipart/commit'.format(start_response['location_url'])
-    requests.post(url, json=payload)
 
+def journaled_upload_part(upload_func, journal, journal_key, part):
+    upload_func(part)
+    journal.add_part(journal_key, part['num'])
 
-def upload(apikey, filepath, file_obj, storage, params=None, security=None):
+
+def upload(apikey, filepath, file_obj, storage, params=None, security=None, transport=None, journal=None,
+           controller=None, wait=True, backoff=None, poller=None, hasher=None):
+    """
+    Uploads local file using Filestack Intelligent Ingestion.
+
+    Chunk size is adapted to network conditions by `controller` (:class:`ChunkSizeController`),
+    a new one is created for every upload unless provided.
+    Chunks are hashed by `hasher` (:class:`filestack.uploads.hashing.ProcessHasher`) if provided.
+
+    If `journal` (:class:`filestack.uploads.journal.UploadJournal`) is provided, committed parts
+    are saved and an interrupted upload of the same file skips them when restarted.
+
+    While the file is assembled completion is polled, see :func:`filestack.uploads.multipart.complete_upload`.
+    Returns the complete response, or its future if `wait` is False.
+    """
     params = params or {}
+    transport = transport or requests
 
     filename = params.get('filename') or os.path.split(filepath)[1]
     mimetype = params.get('mimetype') or mimetypes.guess_type(filepath)[0] or config.DEFAULT_UPLOAD_MIMETYPE
@@ -114,22 +222,36 @@ def upload(apikey, filepath, file_obj, storage, params=None, security=None):
             payload['store'][key] = params[key]
 
     if security:
-        payload.update({
-            'policy': security.policy_b64,
-            'signature': security.signature
-        })
+        payload.update(security.as_params())
+
+    state = None
+    if journal is not None:
+        journal_key = journal.make_key(filepath, apikey=apikey, storage=storage, params=params, engine='fii')
+        state = journal.load(journal_key)
+
+    if state:
+        start_response = state['start_response']
+        finished_parts = state['parts']
+    else:
+        start_response = transport.post(config.MULTIPART_START_URL, json=payload).json()
+        finished_parts = {}
+        if journal is not None:
+            journal.start(journal_key, start_response)
 
-    start_response = requests.post(config.MULTIPART_START_URL, json=payload).json()
     parts = [
         {
             'seek_point': seek_point,
             'num': num + 1
         } for num, seek_point in enumerate(range(0, filesize, DEFAULT_PART_SIZE))
+        if num + 1 not in finished_parts
     ]
 
     fii_upload = functools.partial(
-        upload_part, apikey, filename, filepath, filesize, storage, start_response
+        upload_part, apikey, filename, filepath, filesize, storage, start_response, transport=transport,
+        controller=controller or ChunkSizeController(), hasher=hasher
     )
+    if journal is not None:
+        fii_upload = functools.partial(journaled_upload_part, fii_upload, journal, journal_key)
 
     with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
         list(executor.map(fii_upload, parts))
@@ -147,12 +269,13 @@ def upload(apikey, filepath, file_obj, storage, params=None, security=None):
         payload['upload_tags'] = params.pop('upload_tags')
 
     complete_url = 'https://{}/multipart/complete'.format(start_response['location_url'])
-    session = requests.Session()
-    retries = Retry(total=7, backoff_factor=0.2, status_forcelist=[202], allowed_methods=frozenset(['POST']))
-    session.mount('http://', requests.adapters.HTTPAdapter(max_retries=retries))
-    response = session.post(complete_url, json=payload, headers=config.HEADERS)
-    if response.status_code != 200:
-        log.error('Did not receive a correct complete response: %s. Content %s', response, response.content)
-        raise Exception('Invalid complete response: {}'.format(response.content))
-
-    return response.json()
+    future = complete_upload(complete_url, payload, transport=transport, backoff=backoff, poller=poller)
+
+    if journal is not None:
+        def finish(complete_response):
+            journal.finish(journal_key)
+            return complete_response
+
+        future = then(future, finish)
+
+    return future.result() if wait else future
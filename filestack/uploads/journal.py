@@ -0,0 +1,97 @@
+import os
+import json
+import hashlib
+import threading
+
+
+class UploadJournal:
+    """
+    Persists the state of multipart uploads, so that uploads interrupted by a crash
+    or a restart can be resumed instead of being started over.
+
+    Every upload is journaled in a separate JSON-lines file in the given directory:
+    the first line holds the response of /multipart/start, every following line
+    describes one uploaded part. Files are keyed by file path, size and modification time
+    (and upload settings), so a modified file is never resumed.
+
+    >>> journal = UploadJournal('/var/lib/myapp/uploads')
+    >>> client.upload(filepath='path/to/huge/file', journal=journal)
+    """
+    def __init__(self, directory):
+        """
+        Args:
+            directory (str): directory where upload journals are stored (created if it doesn't exist)
+        """
+        self.directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(filepath, **settings):
+        """
+        Returns a key identifying upload of given file with given settings
+        """
+        stat = os.stat(filepath)
+        identity = {
+            'path': os.path.abspath(filepath),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'settings': settings,
+        }
+        return hashlib.sha256(json.dumps(identity, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, '{}.jsonl'.format(key))
+
+    def load(self, key):
+        """
+        Returns saved upload state: start response and a dict of finished parts
+        (part number -> part result), or None if there is nothing to resume
+        """
+        path = self._path(key)
+        with self._lock:
+            try:
+                with open(path) as f:
+                    content = f.read()
+            except FileNotFoundError:
+                return None
+
+            records = []
+            damaged = bool(content) and not content.endswith('\n')
+            for line in content.splitlines():
+                try:
+                    records.append(json.loads(line))
+                except ValueError:  # line cut off when the process was killed
+                    damaged = True
+
+            if not records or 'start' not in records[0]:
+                return None
+
+            if damaged:
+                # rewrite the journal without damaged lines, so new parts aren't appended to a partial line
+                temp_path = path + '.tmp'
+                with open(temp_path, 'w') as f:
+                    f.write(''.join(json.dumps(record) + '\n' for record in records))
+                os.replace(temp_path, path)
+
+        parts = {record['part']: record['result'] for record in records[1:] if 'part' in record}
+        return {'start_response': records[0]['start'], 'parts': parts}
+
+    def _append(self, key, record, mode='a'):
+        line = json.dumps(record) + '\n'
+        with self._lock:
+            with open(self._path(key), mode) as f:
+                f.write(line)
+
+    def start(self, key, start_response):
+        self._append(key, {'start': start_response}, mode='w')
+
+    def add_part(self, key, part_number, result=None):
+        self._append(key, {'part': part_number, 'result': result})
+
+    def finish(self, key):
+        with self._lock:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
@@ -1,13 +1,19 @@
 import os
-import hashlib
 import mimetypes
+import threading
 import multiprocessing
-from base64 import b64encode
 from functools import partial
-from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from filestack import config
+from filestack.polling import default_poller, resolved, then
 from filestack.utils import requests
+from filestack.uploads.buffers import MappedFile, as_body
+from filestack.uploads.hashing import md5_b64
+
+SignedChunk = namedtuple('SignedChunk', ['num', 'data', 'url', 'headers'])
 
 
 class Chunk:
@@ -22,7 +28,7 @@ class Chunk:
 
     @property
     def bytes(self):
-        if self.data:
+        if self.data is not None:
             return self.data
 
         with open(self.filepath, 'rb') as f:
@@ -32,41 +38,181 @@ class Chunk:
         return data
 
 
-def multipart_request(url, payload, params=None, security=None):
+def is_seekable(file_obj):
+    try:
+        return file_obj.seekable()
+    except AttributeError:
+        return hasattr(file_obj, 'seek') and hasattr(file_obj, 'tell')
+
+
+def get_file_info(filepath, file_obj, params, filesize=None):
+    """
+    Returns filename, mimetype and size of uploaded file.
+    Size of non-seekable streams and iterables cannot be determined and has to be provided.
+    """
+    if filepath:
+        filename = params.get('filename') or os.path.split(filepath)[1]
+        mimetype = params.get('mimetype') or mimetypes.guess_type(filepath)[0] or config.DEFAULT_UPLOAD_MIMETYPE
+        filesize = os.path.getsize(filepath)
+    else:
+        filename = params.get('filename', 'unnamed_file')
+        mimetype = params.get('mimetype') or config.DEFAULT_UPLOAD_MIMETYPE
+        if filesize is None:
+            if not is_seekable(file_obj):
+                raise ValueError('size is required to upload non-seekable streams and iterables')
+            file_obj.seek(0, os.SEEK_END)
+            filesize = file_obj.tell()
+
+    return filename, mimetype, filesize
+
+
+def add_store_params(payload, params=None, security=None):
     for key in ('path', 'location', 'region', 'container', 'access'):
         if key in params:
             payload['store'][key] = params[key]
 
     if security:
-        payload.update({
-            'policy': security.policy_b64,
-            'signature': security.signature
-        })
+        payload.update(security.as_params())
 
-    return requests.post(url, json=payload).json()
+    return payload
 
 
-def make_chunks(filepath=None, file_obj=None, filesize=None):
-    chunks = []
-    for num, seek_point in enumerate(range(0, filesize, config.DEFAULT_CHUNK_SIZE)):
-        if filepath:
-            chunks.append(Chunk(num + 1, seek_point, filepath=filepath))
-        else:  # file_obj
-            file_obj.seek(seek_point)
-            chunks.append(Chunk(num + 1, seek_point, data=file_obj.read(config.DEFAULT_CHUNK_SIZE)))
+def multipart_request(url, payload, params=None, security=None, transport=None):
+    payload = add_store_params(payload, params, security)
+    return (transport or requests).post(url, json=payload).json()
 
-    if file_obj:
-        del file_obj
 
-    return chunks
+def complete_upload(complete_url, payload, transport=None, backoff=None, poller=None):
+    """
+    Sends /multipart/complete request and returns a future of its response JSON.
 
+    The server answers with 202 while uploaded parts are still being assembled.
+    The request is then repeated by `poller` (:class:`filestack.polling.Poller`, shared one by default)
+    with delays defined by `backoff` (:class:`filestack.polling.Backoff`), without blocking the caller.
+    """
+    transport = transport or requests
 
-def upload_chunk(apikey, filename, storage, start_response, chunk):
-    payload = {
+    def attempt():
+        response = transport.post(complete_url, json=payload)
+        if response.status_code == 202:
+            return False, None
+        return True, response.json()
+
+    done, result = attempt()
+    if done:
+        return resolved(result)
+    return (poller or default_poller()).submit(attempt, backoff=backoff, first_attempt=1)
+
+
+def iter_blocks(file_obj, block_size):
+    """
+    Yields blocks of exactly `block_size` bytes (except for the last one)
+    read lazily from a file-like object or an iterable of bytes
+    """
+    if hasattr(file_obj, 'read'):
+        if is_seekable(file_obj):
+            file_obj.seek(0)
+        pieces = iter(partial(file_obj.read, block_size), b'')
+    else:
+        pieces = iter(file_obj)
+
+    buffer = bytearray()
+    for piece in pieces:
+        if not buffer and len(piece) == block_size:
+            yield piece
+            continue
+        buffer += piece
+        while len(buffer) >= block_size:
+            yield bytes(buffer[:block_size])
+            del buffer[:block_size]
+
+    if buffer:
+        yield bytes(buffer)
+
+
+def iter_mapped_chunks(mapped):
+    """
+    Yields chunks of memory mapped file, chunk data are memoryviews of the mapping
+    """
+    for num, seek_point in enumerate(range(0, mapped.size, config.DEFAULT_CHUNK_SIZE)):
+        yield Chunk(
+            num + 1, seek_point, data=mapped.slice(seek_point, config.DEFAULT_CHUNK_SIZE), filepath=mapped.filepath
+        )
+
+
+def iter_stream_chunks(file_obj):
+    """
+    Yields chunks lazily read from file-like object or iterable,
+    next chunk is read from file_obj only when it is requested
+    """
+    for num, data in enumerate(iter_blocks(file_obj, config.DEFAULT_CHUNK_SIZE)):
+        yield Chunk(num + 1, num * config.DEFAULT_CHUNK_SIZE, data=data)
+
+
+def run_prepared(upload_func, prepared):
+    return upload_func(prepared.result())
+
+
+def upload_chunks(upload_func, chunks, max_workers, max_in_flight=None, prepare_func=None, prepare_workers=None,
+                  executor=None):
+    """
+    Uploads chunks using a pool of threads and returns results in chunks order.
+
+    Next chunk is taken from the iterator only when less than `max_in_flight` chunks
+    are waiting for upload or being uploaded, so at most `max_in_flight` chunks are kept in memory
+    and the producer is blocked until upload workers catch up.
+
+    If `prepare_func` is provided, every chunk is passed through it on a separate pool
+    of `prepare_workers` threads (defaults to `max_workers`) as soon as it's taken from the iterator,
+    and `upload_func` receives its result. Preparation of upcoming chunks then overlaps
+    uploads of previous ones instead of delaying them.
+
+    If `executor` is provided, chunks are uploaded on it (e.g. a pool shared by many uploads)
+    instead of a new pool of `max_workers` threads.
+    """
+    max_in_flight = max_in_flight or max_workers * 2
+    slots = threading.BoundedSemaphore(max_in_flight)
+    failed = threading.Event()
+    futures = []
+
+    def on_done(future):
+        if future.exception() is not None:
+            failed.set()
+        slots.release()
+
+    chunks = iter(chunks)
+    with ExitStack() as stack:
+        if executor is None:
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+        if prepare_func is not None:
+            prepare_executor = stack.enter_context(ThreadPoolExecutor(max_workers=prepare_workers or max_workers))
+
+        while not failed.is_set():
+            slots.acquire()
+            chunk = next(chunks, None)
+            if chunk is None:
+                slots.release()
+                break
+            if prepare_func is None:
+                future = executor.submit(upload_func, chunk)
+            else:
+                future = executor.submit(run_prepared, upload_func, prepare_executor.submit(prepare_func, chunk))
+            del chunk
+            future.add_done_callback(on_done)
+            futures.append(future)
+
+        # a shared executor isn't shut down here, so chunks already submitted are awaited explicitly
+        wait(futures)
+
+    return [future.result() for future in futures]
+
+
+def make_chunk_payload(apikey, storage, start_response, num, data, md5=None):
+    return {
         'apikey': apikey,
-        'part': chunk.num,
-        'size': len(chunk.bytes),
-        'md5': b64encode(hashlib.md5(chunk.bytes).digest()).strip().decode('utf-8'),
+        'part': num,
+        'size': len(data),
+        'md5': md5 or md5_b64(data),
         'uri': start_response['uri'],
         'region': start_response['region'],
         'upload_id': start_response['upload_id'],
@@ -75,30 +221,93 @@ def upload_chunk(apikey, filename, storage, start_response, chunk):
         }
     }
 
-    fs_resp = requests.post(
+
+def make_complete_payload(payload, start_response, uploaded_parts, params):
+    """
+    Turns start request payload into /multipart/complete payload.
+    Returns complete url and payload
+    """
+    start_response = dict(start_response)
+    location_url = start_response.pop('location_url')
+    payload.update(start_response)
+    payload['parts'] = uploaded_parts
+
+    if 'workflows' in params:
+        payload['store']['workflows'] = params.pop('workflows')
+
+    if 'upload_tags' in params:
+        payload['upload_tags'] = params.pop('upload_tags')
+
+    return 'https://{}/multipart/complete'.format(location_url), payload
+
+
+def sign_chunk(apikey, storage, start_response, chunk, transport=None, hasher=None):
+    """
+    Reads and hashes chunk (using `hasher` if provided) and requests its upload URL.
+    Returns :data:`SignedChunk(num, data, url, headers)`
+    """
+    data = chunk.bytes
+    md5 = hasher.md5(data, filepath=chunk.filepath, offset=chunk.seek_point) if hasher is not None else None
+    payload = make_chunk_payload(apikey, storage, start_response, chunk.num, data, md5=md5)
+
+    fs_resp = (transport or requests).post(
         'https://{}/multipart/upload'.format(start_response['location_url']),
         json=payload
     ).json()
 
-    resp = requests.put(fs_resp['url'], headers=fs_resp['headers'], data=chunk.bytes)
+    return SignedChunk(chunk.num, data, fs_resp['url'], fs_resp['headers'])
+
+
+def put_chunk(signed_chunk, transport=None):
+    resp = (transport or requests).put(signed_chunk.url, headers=signed_chunk.headers, data=as_body(signed_chunk.data))
+    return {'part_number': signed_chunk.num, 'etag': resp.headers['ETag']}
+
+
+def upload_chunk(apikey, filename, storage, start_response, chunk, transport=None, hasher=None):
+    signed_chunk = sign_chunk(apikey, storage, start_response, chunk, transport=transport, hasher=hasher)
+    return put_chunk(signed_chunk, transport=transport)
+
+
+def journaled(upload_func, journal, journal_key, chunk):
+    result = upload_func(chunk)
+    journal.add_part(journal_key, chunk.num, result)
+    return result
+
+
+def multipart_upload(apikey, filepath, file_obj, storage, params=None, security=None, transport=None,
+                     size=None, max_in_flight=None, journal=None, wait=True, backoff=None, poller=None,
+                     pipelined=False, sign_workers=None, hasher=None, executor=None):
+    """
+    Uploads local file, file-like object or an iterable of bytes.
+
+    Local files are memory mapped, so every chunk is read from disk once and sent without copying.
+    Streams are read lazily, at most `max_in_flight` chunks (defaults to twice the number of upload threads)
+    are kept in memory at the same time. Streams don't have to be seekable,
+    but then `size` of uploaded content is required.
+
+    If `journal` (:class:`filestack.uploads.journal.UploadJournal`) is provided, upload progress
+    of local files is saved and an interrupted upload of the same file is resumed
+    from the first missing part.
+
+    In `pipelined` mode chunks are hashed and their upload URLs are requested on a separate pool
+    of `sign_workers` threads while previous chunks are being sent, so upload threads only send data
+    to storage and don't wait for the signing round-trip. The API signs one part per request,
+    so chunks are signed ahead individually (up to `max_in_flight` chunks ahead).
 
-    return {'part_number': chunk.num, 'etag': resp.headers['ETag']}
+    Chunks are hashed by `hasher` (e.g. :class:`filestack.uploads.hashing.ProcessHasher`) if provided,
+    otherwise in the thread that signs them.
 
+    Chunks are uploaded on `executor` if provided (so many uploads can share one pool of threads),
+    otherwise on a pool created for this upload.
 
-def multipart_upload(apikey, filepath, file_obj, storage, params=None, security=None):
+    If the file is still being assembled after upload, completion is polled (see :func:`complete_upload`).
+    Returns the complete response, or its future if `wait` is False.
+    """
     params = params or {}
 
     upload_processes = multiprocessing.cpu_count()
 
-    if filepath:
-        filename = params.get('filename') or os.path.split(filepath)[1]
-        mimetype = params.get('mimetype') or mimetypes.guess_type(filepath)[0] or config.DEFAULT_UPLOAD_MIMETYPE
-        filesize = os.path.getsize(filepath)
-    else:
-        filename = params.get('filename', 'unnamed_file')
-        mimetype = params.get('mimetype') or config.DEFAULT_UPLOAD_MIMETYPE
-        file_obj.seek(0, os.SEEK_END)
-        filesize = file_obj.tell()
+    filename, mimetype, filesize = get_file_info(filepath, file_obj, params, filesize=size)
 
     payload = {
         'apikey': apikey,
@@ -110,23 +319,58 @@ def multipart_upload(apikey, filepath, file_obj, storage, params=None, security=
         }
     }
 
-    chunks = make_chunks(filepath, file_obj, filesize)
-    start_response = multipart_request(config.MULTIPART_START_URL, payload, params, security)
-    upload_func = partial(upload_chunk, apikey, filename, storage, start_response)
+    state = None
+    if journal is not None:
+        if not filepath:
+            raise ValueError('Only uploads of local files can be resumed')
+        journal_key = journal.make_key(filepath, apikey=apikey, storage=storage, params=params, engine='multipart')
+        state = journal.load(journal_key)
 
-    with ThreadPoolExecutor(max_workers=upload_processes) as executor:
-        uploaded_parts = list(executor.map(upload_func, chunks))
+    if state:
+        start_response = state['start_response']
+        finished_parts = state['parts']
+    else:
+        start_response = multipart_request(
+            config.MULTIPART_START_URL, payload, params, security, transport=transport
+        )
+        finished_parts = {}
+        if journal is not None:
+            journal.start(journal_key, start_response)
 
-    location_url = start_response.pop('location_url')
-    payload.update(start_response)
-    payload['parts'] = uploaded_parts
+    prepare_func = None
+    if pipelined:
+        prepare_func = partial(sign_chunk, apikey, storage, start_response, transport=transport, hasher=hasher)
+        upload_func = partial(put_chunk, transport=transport)
+    else:
+        upload_func = partial(
+            upload_chunk, apikey, filename, storage, start_response, transport=transport, hasher=hasher
+        )
+    if journal is not None:
+        upload_func = partial(journaled, upload_func, journal, journal_key)
 
-    if 'workflows' in params:
-        payload['store']['workflows'] = params.pop('workflows')
+    if filepath:
+        with MappedFile(filepath) as mapped:
+            chunks = (chunk for chunk in iter_mapped_chunks(mapped) if chunk.num not in finished_parts)
+            uploaded_parts = upload_chunks(
+                upload_func, chunks, upload_processes, max_in_flight=max_in_flight,
+                prepare_func=prepare_func, prepare_workers=sign_workers, executor=executor
+            )
+    else:
+        uploaded_parts = upload_chunks(
+            upload_func, iter_stream_chunks(file_obj), upload_processes, max_in_flight=max_in_flight,
+            prepare_func=prepare_func, prepare_workers=sign_workers, executor=executor
+        )
 
-    if 'upload_tags' in params:
-        payload['upload_tags'] = params.pop('upload_tags')
+    uploaded_parts = sorted(list(finished_parts.values()) + uploaded_parts, key=lambda part: part['part_number'])
+    complete_url, payload = make_complete_payload(payload, start_response, uploaded_parts, params)
+    payload = add_store_params(payload, params, security)
+    future = complete_upload(complete_url, payload, transport=transport, backoff=backoff, poller=poller)
+
+    if journal is not None:
+        def finish(complete_response):
+            journal.finish(journal_key)
+            return complete_response
+
+        future = then(future, finish)
 
-    complete_url = 'https://{}/multipart/complete'.format(location_url)
-    complete_response = multipart_request(complete_url, payload, params, security)
-    return complete_response
+    return future.result() if wait else future
@@ -0,0 +1,37 @@
+from filestack import config
+from filestack.utils import requests, default_headers
+from filestack.uploads.multipart import get_file_info
+
+
+def store_upload(apikey, filepath, file_obj, storage, params=None, security=None, transport=None):
+    """
+    Uploads a small file in a single request (Store API), without multipart upload round-trips.
+    Returns upload response extended with file handle
+    """
+    params = params or {}
+    filename, mimetype, _ = get_file_info(filepath, file_obj, params)
+
+    query = {'key': apikey, 'filename': filename, 'mimetype': mimetype}
+    for key in ('path', 'container', 'region', 'access'):
+        if key in params:
+            query[key] = params[key]
+
+    if 'base64decode' in params:
+        query['base64decode'] = str(params['base64decode']).lower()
+
+    if security:
+        query.update(security.as_params())
+
+    if filepath:
+        with open(filepath, 'rb') as f:
+            data = f.read()
+    else:
+        file_obj.seek(0)
+        data = file_obj.read()
+
+    headers = default_headers()
+    headers['Content-Type'] = mimetype
+    url = '{}/store/{}'.format(config.API_URL, params.get('location') or storage)
+    response_json = (transport or requests).post(url, params=query, data=data, headers=headers).json()
+    response_json['handle'] = response_json['url'].split('/')[-1]
+    return response_json
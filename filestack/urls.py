@@ -0,0 +1,61 @@
+"""
+Bulk generation of CDN URLs for large sets of handles.
+
+URLs of all handles share one prefix (CDN address, transformation tasks and security part),
+which is built once; generating each URL is a single string concatenation and no objects
+are created per handle.
+
+>>> from filestack import urls, TransformationTemplate
+>>> thumbnail = TransformationTemplate().resize(width=400)
+>>> urls.build_many(['HANDLE1', 'HANDLE2'], transformation=thumbnail, security=security)
+"""
+from filestack.models.template import TransformationTemplate
+
+
+def url_prefix(transformation=None, security=None):
+    """
+    Returns the part of URLs preceding file handles
+
+    Args:
+        transformation (:class:`filestack.Transformation` or :class:`filestack.TransformationTemplate`):
+            transformation to apply, tasks of Transformation objects are used regardless of their handle
+        security (:class:`filestack.Security`): Security object used to sign URLs
+
+    Returns:
+        str: URL prefix
+    """
+    if transformation is None:
+        template = TransformationTemplate()
+    elif isinstance(transformation, TransformationTemplate):
+        template = transformation
+    else:
+        template = TransformationTemplate.from_transformation(transformation)
+    return template.prefix(security=security)
+
+
+def build_many(handles, transformation=None, security=None):
+    """
+    Returns URLs for many handles
+
+    Args:
+        handles (iterable): Filestack handles (use :meth:`filestack.TransformationTemplate.urls_for`
+            for external URLs)
+        transformation (:class:`filestack.Transformation` or :class:`filestack.TransformationTemplate`):
+            transformation to apply
+        security (:class:`filestack.Security`): Security object used to sign all URLs
+
+    Returns:
+        list: URLs, in the order of handles
+    """
+    return list(iter_many(handles, transformation=transformation, security=security))
+
+
+def iter_many(handles, transformation=None, security=None):
+    """
+    Same as :func:`build_many`, but returns a lazy iterator, so handles can be streamed
+    (e.g. from a database cursor or a file) without keeping all URLs in memory.
+
+    Returns:
+        iterator of URLs, in the order of handles
+    """
+    return map(url_prefix(transformation=transformation, security=security).__add__, handles)
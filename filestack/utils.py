@@ -1,40 +1,87 @@
+import os
 import time
 import string
 import random
-from functools import partial
-import requests as original_requests
-from requests.exceptions import HTTPError
+from functools import partial, lru_cache
+from contextlib import nullcontext
 
 from filestack import config
 from filestack.exceptions import FilestackHTTPError
 
+DEFAULT_POOL_SIZE = os.cpu_count() or 1
+TRANSFORM_TASK_CACHE_SIZE = 4096
+
 
 def unique_id(length=10):
     return ''.join(random.choice(string.ascii_letters + string.digits) for i in range(length))
 
 
+def default_headers():
+    """
+    Returns default headers with unique trace identifiers for a single API call
+    """
+    headers = dict(config.HEADERS)
+    headers['Filestack-Trace-Id'] = '{}-{}'.format(int(time.time()), unique_id())
+    headers['Filestack-Trace-Span'] = 'pythonsdk-{}'.format(unique_id())
+    return headers
+
+
+def make_session(pool_size=None):
+    """
+    Creates a requests session with keep-alive connection pools.
+
+    Args:
+        pool_size (int): maximum number of connections kept open per host.
+            Should match the number of threads sending requests concurrently,
+            defaults to the number of upload threads (cpu count)
+
+    Returns:
+        :class:`requests.Session`
+    """
+    import requests as original_requests
+
+    pool_size = pool_size or DEFAULT_POOL_SIZE
+    adapter = original_requests.adapters.HTTPAdapter(pool_maxsize=pool_size)
+    session = original_requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 class RequestsWrapper:
     """
     This class wraps selected methods from requests package and adds
     default headers if no headers were specified.
+
+    If a session is provided, all requests are sent through it, so connections
+    are reused between API calls instead of being opened for every request.
+    If a limiter (e.g. :class:`threading.BoundedSemaphore`) is provided, it is held
+    for the duration of every request, which caps the number of requests in flight.
     """
+    def __init__(self, session=None, limiter=None):
+        self.session = session
+        self.limiter = limiter
+
     def __getattr__(self, name):
-        if name in ('get', 'post', 'put', 'delete'):
+        if name in ('get', 'post', 'put', 'delete', 'head'):
             return partial(self.handle_request, name)
+        import requests as original_requests
         return original_requests.__getattribute__(name)
 
     def handle_request(self, name, *args, **kwargs):
+        # requests is imported on first API call rather than with the package
+        import requests as original_requests
+
         if 'headers' not in kwargs:
-            kwargs['headers'] = config.HEADERS
-            kwargs['headers']['Filestack-Trace-Id'] = '{}-{}'.format(int(time.time()), unique_id())
-            kwargs['headers']['Filestack-Trace-Span'] = 'pythonsdk-{}'.format(unique_id())
+            kwargs['headers'] = default_headers()
 
-        requests_method = getattr(original_requests, name)
-        response = requests_method(*args, **kwargs)
+        requests_method = getattr(self.session or original_requests, name)
+        with self.limiter or nullcontext():
+            response = requests_method(*args, **kwargs)
 
         try:
             response.raise_for_status()
-        except HTTPError as e:
+        except original_requests.HTTPError as e:
             raise FilestackHTTPError(response.text) from e
 
         return response
@@ -43,22 +90,100 @@ class RequestsWrapper:
 requests = RequestsWrapper()
 
 
+def run_many(func, items, max_workers, max_pending=None):
+    """
+    Calls func for every item on a shared pool of threads and yields
+    `(item, result, error)` tuples as calls complete. Exceptions are reported
+    per item instead of stopping the whole batch.
+
+    Items are consumed lazily, at most `max_pending` (defaults to twice the number of workers)
+    calls are submitted at the same time.
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+    max_pending = max_pending or max_workers * 2
+    items = iter(items)
+    pending = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            for item in items:
+                pending[executor.submit(func, item)] = item
+                if len(pending) >= max_pending:
+                    break
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                error = future.exception()
+                yield item, None if error else future.result(), error
+
+
+def is_transient_error(error):
+    """
+    Returns True for errors worth retrying: connection errors, timeouts,
+    429 and 5xx responses
+    """
+    import requests as original_requests
+
+    cause = error.__cause__ if isinstance(error, FilestackHTTPError) else error
+    response = getattr(cause, 'response', None)
+    if response is not None:
+        return response.status_code == 429 or response.status_code >= 500
+    return isinstance(error, (original_requests.ConnectionError, original_requests.Timeout))
+
+
+def call_with_retries(func, retries, backoff):
+    """
+    Calls func until it succeeds, raises a non-transient error or fails `retries` more times,
+    sleeping `backoff.delay(retry)` between attempts. Returns `(attempts, error)`
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            func()
+            return attempt, None
+        except Exception as e:
+            if attempt > retries or not is_transient_error(e):
+                return attempt, e
+        time.sleep(backoff.delay(attempt - 1))
+
+
+def format_task_value(value):
+    if isinstance(value, list):
+        return str(value).replace("'", "").replace('"', '').replace(" ", "")
+    if isinstance(value, bool):
+        return str(value).lower()
+    return value
+
+
 def return_transform_task(transformation, params):
-    transform_tasks = []
+    transform_tasks = sorted('{}:{}'.format(key, format_task_value(value)) for key, value in params.items())
+
+    if transform_tasks:
+        return '{}={}'.format(transformation, ','.join(transform_tasks))
 
-    for key, value in params.items():
-        if isinstance(value, list):
-            value = str(value).replace("'", "").replace('"', '').replace(" ", "")
-        if isinstance(value, bool):
-            value = str(value).lower()
+    return transformation
 
-        transform_tasks.append('{}:{}'.format(key, value))
 
-    transform_tasks = sorted(transform_tasks)
+@lru_cache(maxsize=TRANSFORM_TASK_CACHE_SIZE)
+def _compiled_transform_task(transformation, keys, values, types):
+    params = {key: value for key, value in zip(keys, values) if value is not None}
+    return return_transform_task(transformation, params)
 
-    if len(transform_tasks) > 0:
-        transformation_url = '{}={}'.format(transformation, ','.join(transform_tasks))
-    else:
-        transformation_url = transformation
 
-    return transformation_url
+def cached_transform_task(transformation, params):
+    """
+    Same as :func:`return_transform_task` (skipping params set to None), but memoizes task strings,
+    so repeated transformations with the same parameters skip formatting and sorting.
+    Parameter types are part of the cache key (``True`` and ``1`` are formatted differently).
+    """
+    values = tuple(params.values())
+    try:
+        return _compiled_transform_task(transformation, tuple(params), values, tuple(map(type, values)))
+    except TypeError:  # unhashable (e.g. list) values
+        return return_transform_task(transformation, {k: v for k, v in params.items() if v is not None})
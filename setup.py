@@ -26,6 +26,9 @@ setup(
         'requests>=2.31.0',
         'trafaret==2.0.2'
     ],
+    extras_require={
+        'async': ['aiohttp>=3.7'],
+    },
     classifiers=[
         'Development Status :: 4 - Beta',
         'Intended Audience :: Developers',
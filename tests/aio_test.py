@@ -0,0 +1,238 @@
+import io
+import re
+import asyncio
+
+import pytest
+
+from filestack import config, Security
+
+aioresponses = pytest.importorskip('aioresponses').aioresponses
+
+from yarl import URL  # noqa: E402
+
+from filestack.aio import AsyncClient, AsyncFilelink, AsyncAudioVisual  # noqa: E402
+from filestack.aio.utils import AsyncRequestsWrapper  # noqa: E402
+from filestack.polling import Backoff  # noqa: E402
+from filestack.models.audiovisual import CONVERSION_BACKOFF, ConversionFailed  # noqa: E402
+
+APIKEY = 'APIKEY'
+HANDLE = 'SOMEHANDLE'
+SECURITY = Security({'expiry': 123}, 'secret')
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def mock_multipart(m, parts=1):
+    m.post(config.MULTIPART_START_URL, payload={
+        'region': 'us-east-1', 'upload_id': 'someuuid', 'uri': 'someuri', 'location_url': 'fs-uploads.com'
+    })
+    for _ in range(parts):
+        m.post('https://fs-uploads.com/multipart/upload', payload={'url': 'http://s3.url', 'headers': {'a': 'b'}})
+        m.put('http://s3.url', headers={'ETag': 'etag'})
+    m.post('https://fs-uploads.com/multipart/complete', payload={'handle': HANDLE})
+
+
+def test_upload_file_obj():
+    async def upload():
+        async with AsyncClient(APIKEY) as client:
+            return await client.upload(file_obj=io.BytesIO(b'file bytes'), store_params={'workflows': ['wf']})
+
+    with aioresponses() as m:
+        mock_multipart(m)
+        filelink = run(upload())
+        complete_call = m.requests[('POST', URL('https://fs-uploads.com/multipart/complete'))][0]
+
+    assert isinstance(filelink, AsyncFilelink)
+    assert filelink.handle == HANDLE
+    assert complete_call.kwargs['json']['parts'] == [{'part_number': 1, 'etag': 'etag'}]
+    assert complete_call.kwargs['json']['store']['workflows'] == ['wf']
+
+
+def test_upload_bounded_concurrency(monkeypatch):
+    monkeypatch.setattr(config, 'DEFAULT_CHUNK_SIZE', 4)
+    in_flight = []
+    max_in_flight = []
+
+    async def upload():
+        async with AsyncClient(APIKEY, max_concurrency=2) as client:
+            return await client.upload(file_obj=io.BytesIO(b'a' * 40))
+
+    with aioresponses() as m:
+        mock_multipart(m, parts=10)
+        original_request = AsyncRequestsWrapper.request
+
+        async def client_request(self, method, url, **kwargs):
+            if method == 'PUT':
+                in_flight.append(url)
+                max_in_flight.append(len(in_flight))
+                await asyncio.sleep(0.01)
+                in_flight.pop()
+            return await original_request(self, method, url, **kwargs)
+
+        monkeypatch.setattr(AsyncRequestsWrapper, 'request', client_request)
+        filelink = run(upload())
+
+    assert filelink.handle == HANDLE
+    assert max(max_in_flight) == 2
+
+
+def test_upload_url():
+    async def upload():
+        async with AsyncClient(APIKEY, security=SECURITY) as client:
+            return await client.upload_url('https://just.some/url')
+
+    with aioresponses() as m:
+        m.post('https://cdn.filestackcontent.com/process', payload={'handle': HANDLE})
+        filelink = run(upload())
+
+    assert filelink.handle == HANDLE
+    assert filelink.security is SECURITY
+
+
+def test_zip(tmp_path):
+    async def download_zip():
+        async with AsyncClient(APIKEY) as client:
+            return await client.zip(str(tmp_path / 'test.zip'), ['handle1', 'handle2'])
+
+    with aioresponses() as m:
+        m.get(re.compile('https://cdn.filestackcontent.com/APIKEY/zip.*'), body=b'zip-bytes')
+        assert run(download_zip()) == 9
+
+    assert (tmp_path / 'test.zip').read_bytes() == b'zip-bytes'
+
+
+def test_filelink_operations(tmp_path):
+    async def operations():
+        async with AsyncClient(APIKEY) as client:
+            filelink = AsyncFilelink(HANDLE, apikey=APIKEY, security=SECURITY, transport=client.transport)
+            size = await filelink.download(str(tmp_path / 'file'))
+            metadata = await filelink.metadata(['size'])
+            await filelink.delete()
+            await filelink.overwrite(url='https://new.content/url')
+            return size, metadata
+
+    with aioresponses() as m:
+        m.get(re.compile(r'https://cdn.filestackcontent.com/security=.*/SOMEHANDLE$'), body=b'file-content')
+        m.get(re.compile('https://cdn.filestackcontent.com/SOMEHANDLE/metadata.*'), payload={'size': 12})
+        m.delete(re.compile('https://www.filestackapi.com/api/file/SOMEHANDLE.*'))
+        m.post(re.compile('https://www.filestackapi.com/api/file/SOMEHANDLE.*'))
+        size, metadata = run(operations())
+        overwrite_call = [call for key, call in m.requests.items() if key[0] == 'POST'][0][0]
+
+    assert size == 12
+    assert metadata == {'size': 12}
+    assert overwrite_call.kwargs['data'] == {'url': 'https://new.content/url'}
+    assert overwrite_call.kwargs['params']['policy'] == SECURITY.policy_b64
+
+
+def test_standalone_filelink_closes_its_session():
+    async def get_content():
+        async with AsyncFilelink(HANDLE) as filelink:
+            content = await filelink.get_content()
+        return filelink, content
+
+    with aioresponses() as m:
+        m.get('https://cdn.filestackcontent.com/SOMEHANDLE', body=b'file-content')
+        filelink, content = run(get_content())
+
+    assert content == b'file-content'
+    assert filelink.transport.session is None
+
+
+def test_filelink_leaves_shared_session_open():
+    async def close_filelink():
+        async with AsyncClient(APIKEY) as client:
+            session = client.transport._get_session()
+            await AsyncFilelink(HANDLE, transport=client.transport).close()
+            return session.closed
+
+    assert run(close_filelink()) is False
+
+
+def test_av_wait():
+    url = 'https://cdn.filestackcontent.com/video_convert=width:100/SOMEHANDLE'
+
+    async def convert():
+        async with AsyncClient(APIKEY) as client:
+            filelink = AsyncFilelink(HANDLE, apikey=APIKEY, transport=client.transport)
+            av = await filelink.av_convert(width=100)
+            assert isinstance(av, AsyncAudioVisual)
+            return await av.wait(interval=0)
+
+    with aioresponses() as m:
+        m.get(url, payload={'uuid': 'uuid', 'timestamp': 'ts'})
+        m.get(url, payload={'status': 'pending'})
+        m.get(url, payload={'status': 'completed', 'data': {'url': 'https://cdn.filestackcontent.com/NEW'}})
+        filelink = run(convert())
+
+    assert filelink.handle == 'NEW'
+
+
+def test_upload_completion_polled():
+    async def upload():
+        async with AsyncClient(APIKEY) as client:
+            return await client.upload(
+                file_obj=io.BytesIO(b'file bytes'), completion_backoff=Backoff(initial=0.001, deadline=5)
+            )
+
+    with aioresponses() as m:
+        m.post(config.MULTIPART_START_URL, payload={
+            'region': 'us-east-1', 'upload_id': 'someuuid', 'uri': 'someuri', 'location_url': 'fs-uploads.com'
+        })
+        m.post('https://fs-uploads.com/multipart/upload', payload={'url': 'http://s3.url', 'headers': {}})
+        m.put('http://s3.url', headers={'ETag': 'etag'})
+        m.post('https://fs-uploads.com/multipart/complete', status=202, payload={})
+        m.post('https://fs-uploads.com/multipart/complete', status=202, payload={})
+        m.post('https://fs-uploads.com/multipart/complete', payload={'handle': HANDLE})
+        filelink = run(upload())
+        complete_calls = m.requests[('POST', URL('https://fs-uploads.com/multipart/complete'))]
+
+    assert filelink.handle == HANDLE
+    assert len(complete_calls) == 3
+
+
+def test_av_wait_with_poll_strategy_fails_on_failed_conversion():
+    url = 'https://process.filestackapi.com/video_convert=width:100/{}'.format(HANDLE)
+    av = AsyncAudioVisual(url, 'uuid', 'ts', apikey=APIKEY)
+
+    async def wait():
+        async with AsyncClient(APIKEY) as client:
+            av.transport = client.transport
+            return await av.wait(poll_strategy=Backoff(initial=0.001, deadline=5))
+
+    with aioresponses() as m:
+        m.get(url, payload={'status': 'started'})
+        m.get(url, payload={'status': 'failed'})
+        with pytest.raises(ConversionFailed, match='uuid'):
+            run(wait())
+
+    assert av.last_response == {'status': 'failed'}
+
+
+def test_av_wait_timeout_is_first_argument(monkeypatch):
+    url = 'https://process.filestackapi.com/video_convert=width:100/{}'.format(HANDLE)
+    av = AsyncAudioVisual(url, 'uuid', 'ts', apikey=APIKEY)
+    delays = []
+    monkeypatch.setattr(CONVERSION_BACKOFF, 'jitter', 0)
+
+    original_sleep = asyncio.sleep
+
+    async def sleep(delay):
+        delays.append(delay)
+        await original_sleep(0.01)
+
+    monkeypatch.setattr(asyncio, 'sleep', sleep)
+
+    async def wait():
+        async with AsyncClient(APIKEY) as client:
+            av.transport = client.transport
+            return await av.wait(0.05)
+
+    with aioresponses() as m:
+        m.get(url, payload={'status': 'started'}, repeat=True)
+        with pytest.raises(TimeoutError):
+            run(wait())
+
+    assert delays[:2] == [CONVERSION_BACKOFF.delay(0), CONVERSION_BACKOFF.delay(1)]  # default backoff, not 1s
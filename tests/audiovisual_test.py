@@ -1,7 +1,9 @@
 import pytest
 import responses
 
-from filestack import AudioVisual, Filelink
+from filestack import AudioVisual, ConversionTracker, Filelink
+from filestack.models.audiovisual import ConversionFailed
+from filestack.polling import Backoff, Poller
 
 
 APIKEY = 'APIKEY'
@@ -30,3 +32,91 @@ def test_convert(av):
     filelink = av.to_filelink()
     assert isinstance(filelink, Filelink)
     assert filelink.handle == HANDLE
+
+
+FAST = Backoff(initial=0.001, max_delay=0.01, deadline=5)
+
+
+@responses.activate
+def test_to_filelink_reuses_completed_response(av):
+    responses.add(
+        responses.GET, PROCESS_URL, json={'status': 'completed', 'data': {'url': URL}}
+    )
+    assert av.status == 'completed'
+    assert av.to_filelink().handle == HANDLE
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_to_filelink_not_completed(av):
+    responses.add(responses.GET, PROCESS_URL, json={'status': 'started'})
+    with pytest.raises(Exception, match='not complete'):
+        av.to_filelink()
+
+
+@responses.activate
+def test_wait(av):
+    responses.add(responses.GET, PROCESS_URL, json={'status': 'pending'})
+    responses.add(responses.GET, PROCESS_URL, json={'status': 'started'})
+    responses.add(responses.GET, PROCESS_URL, json={'status': 'completed', 'data': {'url': URL}})
+
+    filelink = av.wait(poll_strategy=FAST)
+    assert filelink.handle == HANDLE
+    assert len(responses.calls) == 3
+    assert av.last_response['status'] == 'completed'
+
+
+@responses.activate
+def test_wait_timeout(av):
+    responses.add(responses.GET, PROCESS_URL, json={'status': 'pending'})
+    with pytest.raises(TimeoutError):
+        av.wait(timeout=0.05, poll_strategy=FAST)
+
+
+@responses.activate
+def test_tracker_resolves_many_conversions():
+    for num in range(20):
+        url = '{}{}'.format(PROCESS_URL, num)
+        responses.add(responses.GET, url, json={'status': 'started'})
+        responses.add(
+            responses.GET, url, json={'status': 'completed', 'data': {'url': '{}{}'.format(URL, num)}}
+        )
+    responses.add(responses.GET, PROCESS_URL + 'failed', json={'status': 'failed'})
+
+    completed = []
+    tracker = ConversionTracker(poller=Poller(), backoff=FAST)
+    futures = [
+        tracker.track(AudioVisual('{}{}'.format(PROCESS_URL, num), num, 'ts'), callback=completed.append)
+        for num in range(20)
+    ]
+    failed = tracker.track(AudioVisual(PROCESS_URL + 'failed', 'failed-uuid', 'ts'))
+
+    assert [future.result(timeout=5).handle for future in futures] == [HANDLE + str(num) for num in range(20)]
+    with pytest.raises(ConversionFailed, match='failed-uuid'):
+        failed.result(timeout=5)
+    assert len(completed) == 20
+
+
+@responses.activate
+def test_tracker_retries_timed_out_status_requests():
+    import requests as original_requests
+    from filestack.polling import default_poller
+
+    responses.add(responses.GET, PROCESS_URL, body=original_requests.Timeout('read timed out'))
+    responses.add(responses.GET, PROCESS_URL, json={'status': 'completed', 'data': {'url': URL}})
+
+    av = AudioVisual(PROCESS_URL, 'uuid', 'ts')
+    timeouts = []
+    refresh = av.refresh
+
+    def recording_refresh(timeout=None):
+        timeouts.append(timeout)
+        return refresh(timeout=timeout)
+
+    av.refresh = recording_refresh
+    tracker = ConversionTracker(backoff=FAST, request_timeout=7)
+    assert tracker.poller is not default_poller()
+    filelink = tracker.track(av).result(timeout=5)
+
+    assert filelink.handle == HANDLE
+    assert timeouts == [7, 7]
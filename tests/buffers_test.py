@@ -0,0 +1,40 @@
+import io
+
+from filestack.uploads.buffers import MappedFile, BufferReader, as_body
+
+
+def test_mapped_file_slices(tmp_path):
+    path = tmp_path / 'file.bin'
+    path.write_bytes(b'0123456789')
+
+    with MappedFile(str(path)) as mapped:
+        assert mapped.size == 10
+        chunk = mapped.slice(4, 4)
+        assert isinstance(chunk, memoryview)
+        assert chunk == b'4567'
+        assert mapped.slice(8, 4) == b'89'
+
+
+def test_mapped_empty_file(tmp_path):
+    path = tmp_path / 'empty.bin'
+    path.write_bytes(b'')
+
+    with MappedFile(str(path)) as mapped:
+        assert mapped.size == 0
+        assert mapped.slice(0, 10) == b''
+
+
+def test_buffer_reader():
+    reader = BufferReader(memoryview(b'abcdefgh'))
+    assert len(reader) == 8
+    assert reader.read(3) == b'abc'
+    assert reader.tell() == 3
+    assert reader.read() == b'defgh'
+    assert reader.read(3) == b''
+    reader.seek(-2, io.SEEK_END)
+    assert reader.read() == b'gh'
+
+
+def test_as_body():
+    assert as_body(b'bytes') == b'bytes'
+    assert isinstance(as_body(memoryview(b'bytes')), BufferReader)
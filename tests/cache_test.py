@@ -0,0 +1,182 @@
+import time
+
+import pytest
+import responses
+
+from filestack import ContentCache, MetadataCache, Filelink, Security
+from filestack.cache import parse_max_age
+
+HANDLE = 'SOMEHANDLE'
+URL = 'https://cdn.filestackcontent.com/{}'.format(HANDLE)
+
+
+@pytest.fixture(params=['memory', 'disk'])
+def cache(request, tmp_path):
+    directory = str(tmp_path / 'cache') if request.param == 'disk' else None
+    yield ContentCache(max_size=100, directory=directory)
+
+
+@pytest.mark.parametrize('cache_control, max_age', [
+    ('public, max-age=60', 60),
+    ('s-maxage=30', 30),
+    ('no-cache', 0),
+    ('', 0),
+    ('private, no-store', None),
+])
+def test_parse_max_age(cache_control, max_age):
+    assert parse_max_age(cache_control) == max_age
+
+
+@responses.activate
+def test_fresh_entry_served_from_cache(cache):
+    responses.add(responses.GET, URL, body=b'content', headers={'Cache-Control': 'max-age=60'})
+    filelink = Filelink(HANDLE)
+
+    assert filelink.get_content(cache=cache) == b'content'
+    assert filelink.get_content(cache=cache) == b'content'
+    assert len(responses.calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@responses.activate
+def test_key_ignores_security(cache):
+    responses.add(responses.GET, URL, body=b'content', headers={'Cache-Control': 'max-age=60'})
+    Filelink(HANDLE).get_content(cache=cache)
+
+    security = Security({'expiry': int(time.time()) + 60}, 'SECRET')
+    assert Filelink(HANDLE, security=security).get_content(cache=cache) == b'content'
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_stale_entry_revalidated(cache):
+    url = 'https://cdn.filestackcontent.com/resize=width:100/{}'.format(HANDLE)
+    responses.add(responses.GET, url, body=b'resized', headers={'Cache-Control': 'no-cache', 'ETag': '"v1"'})
+    responses.add(responses.GET, url, status=304)
+    transformation = Filelink(HANDLE).resize(width=100)
+
+    assert transformation.get_content(cache=cache) == b'resized'
+    assert transformation.get_content(cache=cache) == b'resized'
+    assert responses.calls[-1].request.headers['If-None-Match'] == '"v1"'
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@responses.activate
+def test_no_store_not_cached(cache):
+    responses.add(responses.GET, URL, body=b'content', headers={'Cache-Control': 'no-store', 'ETag': '"v1"'})
+    Filelink(HANDLE).get_content(cache=cache)
+    Filelink(HANDLE).get_content(cache=cache)
+
+    assert len(cache) == 0
+    assert 'If-None-Match' not in responses.calls[1].request.headers
+
+
+@responses.activate
+def test_lru_eviction(cache):
+    for handle in ('A', 'B', 'C'):
+        responses.add(
+            responses.GET, 'https://cdn.filestackcontent.com/{}'.format(handle),
+            body=handle.encode() * 40, headers={'Cache-Control': 'max-age=60'}
+        )
+
+    Filelink('A').get_content(cache=cache)
+    Filelink('B').get_content(cache=cache)
+    Filelink('A').get_content(cache=cache)
+    Filelink('C').get_content(cache=cache)
+
+    assert cache.size == 80
+    Filelink('A').get_content(cache=cache)
+    assert [call.request.url[-1] for call in responses.calls] == ['A', 'B', 'C']
+
+
+@responses.activate
+def test_disk_cache_reloaded(tmp_path):
+    responses.add(responses.GET, URL, body=b'content', headers={'Cache-Control': 'max-age=60'})
+    Filelink(HANDLE).get_content(cache=ContentCache(directory=str(tmp_path)))
+
+    cache = ContentCache(directory=str(tmp_path))
+    assert Filelink(HANDLE).get_content(cache=cache) == b'content'
+    assert len(responses.calls) == 1
+
+
+def remove_content_files(directory):
+    for path in directory.iterdir():
+        if path.suffix != '.json':
+            path.unlink()
+
+
+@responses.activate
+def test_missing_content_file_refetched(tmp_path):
+    responses.add(responses.GET, URL, body=b'content', headers={'Cache-Control': 'max-age=60'})
+    cache = ContentCache(directory=str(tmp_path))
+    Filelink(HANDLE).get_content(cache=cache)
+    remove_content_files(tmp_path)
+
+    assert Filelink(HANDLE).get_content(cache=cache) == b'content'
+    assert Filelink(HANDLE).get_content(cache=cache) == b'content'
+    assert len(responses.calls) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+@responses.activate
+def test_missing_content_file_refetched_after_not_modified(tmp_path):
+    responses.add(responses.GET, URL, body=b'content', headers={'Cache-Control': 'no-cache', 'ETag': '"v1"'})
+    responses.add(responses.GET, URL, status=304)
+    responses.add(responses.GET, URL, body=b'content', headers={'Cache-Control': 'no-cache', 'ETag': '"v1"'})
+    cache = ContentCache(directory=str(tmp_path))
+    Filelink(HANDLE).get_content(cache=cache)
+    remove_content_files(tmp_path)
+
+    assert Filelink(HANDLE).download(str(tmp_path / 'file'), cache=cache) == 7
+    assert len(responses.calls) == 3
+    assert 'If-None-Match' not in responses.calls[2].request.headers
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+@responses.activate
+def test_download_from_cache(cache, tmp_path):
+    responses.add(responses.GET, URL, body=b'content', headers={'Cache-Control': 'max-age=60'})
+    path = tmp_path / 'file'
+
+    assert Filelink(HANDLE).download(str(path), cache=cache) == 7
+    assert Filelink(HANDLE).download(str(path), cache=cache) == 7
+    assert path.read_bytes() == b'content'
+    assert len(responses.calls) == 1
+
+
+def test_metadata_cache_ttl(monkeypatch):
+    cache = MetadataCache(ttl=10)
+    cache.put(HANDLE, ['size', 'filename'], {'size': 1})
+    assert cache.get(HANDLE, ['filename', 'size']) == {'size': 1}
+    assert cache.get(HANDLE) is None
+
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 11)
+    assert cache.get(HANDLE, ['size', 'filename']) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_metadata_cache_eviction():
+    cache = MetadataCache(max_entries=2)
+    for handle in ('A', 'B', 'C'):
+        cache.put(handle, None, {'handle': handle})
+
+    assert len(cache) == 2
+    assert cache.get('A') is None
+    assert cache.get('C') == {'handle': 'C'}
+
+
+@responses.activate
+def test_filelink_metadata_cached():
+    responses.add(responses.GET, URL + '/metadata', json={'size': 1})
+    responses.add(responses.DELETE, 'https://www.filestackapi.com/api/file/{}'.format(HANDLE))
+    security = Security({'expiry': int(time.time()) + 60}, 'SECRET')
+    filelink = Filelink(HANDLE, apikey='APIKEY', security=security, metadata_cache=MetadataCache())
+
+    assert filelink.metadata() == {'size': 1}
+    assert filelink.metadata() == {'size': 1}
+    assert len(responses.calls) == 1
+
+    filelink.delete()
+    filelink.metadata()
+    assert len(responses.calls) == 3
@@ -1,3 +1,4 @@
+import io
 import re
 from unittest.mock import patch, mock_open
 
@@ -6,7 +7,9 @@ import responses
 from trafaret import DataError
 
 import filestack.models
-from filestack import Client, Filelink, Transformation, Security
+from filestack import Client, Filelink, Transformation, Security, MetadataCache
+from filestack import config
+from filestack.polling import Backoff, resolved
 
 
 APIKEY = 'APIKEY'
@@ -40,19 +43,23 @@ def test_store_external_url(client):
 
 @patch('filestack.models.client.multipart_upload')
 def test_store_filepath(upload_mock, client):
-    upload_mock.return_value = {'handle': HANDLE}
+    upload_mock.return_value = resolved({'handle': HANDLE})
     filelink = client.upload(filepath='path/to/image.jpg')
 
     assert isinstance(filelink, Filelink)
     assert filelink.handle == HANDLE
-    upload_mock.assert_called_once_with('APIKEY', 'path/to/image.jpg', None, 'S3', params=None, security=None)
+    upload_mock.assert_called_once_with(
+        'APIKEY', 'path/to/image.jpg', None, 'S3', params=None, security=None, transport=client.transport,
+        size=None, max_in_flight=None, journal=None, wait=False, backoff=None, pipelined=False, hasher=None
+    )
+    assert filelink.transport is client.transport
 
 
 @patch('filestack.models.client.multipart_upload')
 @patch('filestack.models.client.upload_external_url')
 def test_security_inheritance(upload_external_mock, multipart_mock):
     upload_external_mock.return_value = {'handle': 'URL_HANDLE'}
-    multipart_mock.return_value = {'handle': 'FILE_HANDLE'}
+    multipart_mock.return_value = resolved({'handle': 'FILE_HANDLE'})
 
     policy = {'expiry': 1900}
     cli = Client(APIKEY, security=Security(policy, 'SECRET'))
@@ -76,6 +83,14 @@ def test_url_screenshot(client):
 def test_transform_external(client):
     new_transform = client.transform_external('SOMEURL')
     assert isinstance(new_transform, Transformation)
+    assert new_transform.transport is client.transport
+    assert new_transform.resize(width=100).transport is client.transport
+
+
+def test_pool_size():
+    cli = Client(APIKEY, pool_size=32)
+    adapter = cli.transport.session.get_adapter('https://cdn.filestackcontent.com')
+    assert adapter._pool_maxsize == 32
 
 
 @responses.activate
@@ -85,8 +100,195 @@ def test_zip(client):
         body=b'zip-bytes'
     )
     m = mock_open()
-    with patch('filestack.models.client.open', m):
+    with patch('filestack.downloads.ranged.open', m):
         zip_size = client.zip('test.zip', ['handle1', 'handle2'])
 
     assert zip_size == 9
     m().write.assert_called_once_with(b'zip-bytes')
+
+
+@responses.activate
+def test_upload_many(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DEFAULT_CHUNK_SIZE', 8)
+    small = tmp_path / 'small.txt'
+    small.write_bytes(b'small')
+    large = tmp_path / 'large.txt'
+    large.write_bytes(b'large file content')
+
+    responses.add(
+        responses.POST, re.compile('https://www.filestackapi.com/api/store/S3.*'),
+        json={'url': 'https://cdn.filestackcontent.com/SMALL', 'size': 5}
+    )
+    responses.add(responses.POST, config.MULTIPART_START_URL, json={
+        'region': 'us-east-1', 'upload_id': 'someuuid', 'uri': 'someuri', 'location_url': 'fs-uploads.com'
+    })
+    responses.add(
+        responses.POST, 'https://fs-uploads.com/multipart/upload', json={'url': 'https://s3.url', 'headers': {}}
+    )
+    responses.add(responses.PUT, 'https://s3.url', headers={'ETag': 'etag'})
+    responses.add(responses.POST, 'https://fs-uploads.com/multipart/complete', json={'handle': 'LARGE'})
+
+    sources = [str(small), large, io.BytesIO(b'bytes'), str(tmp_path / 'missing.txt')]
+    results = {str(result.source): result for result in client.upload_many(sources, max_requests=2)}
+
+    assert results[str(small)].filelink.handle == 'SMALL'
+    assert results[str(large)].filelink.handle == 'LARGE'
+    assert results[str(sources[2])].filelink.handle == 'SMALL'
+    assert results[str(sources[2])].filelink.transport is client.transport
+    assert results[str(tmp_path / 'missing.txt')].filelink is None
+    assert isinstance(results[str(tmp_path / 'missing.txt')].error, FileNotFoundError)
+
+    store_calls = [call for call in responses.calls if '/store/' in call.request.url]
+    assert len(store_calls) == 2
+    assert 'filename=small.txt' in store_calls[0].request.url or 'filename=small.txt' in store_calls[1].request.url
+    assert len([call for call in responses.calls if call.request.method == 'PUT']) == 3
+
+
+@responses.activate
+def test_upload_many_shares_chunk_executor(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DEFAULT_CHUNK_SIZE', 4)
+    responses.add(responses.POST, config.MULTIPART_START_URL, json={
+        'region': 'us-east-1', 'upload_id': 'someuuid', 'uri': 'someuri', 'location_url': 'fs-uploads.com'
+    })
+    responses.add(
+        responses.POST, 'https://fs-uploads.com/multipart/upload', json={'url': 'https://s3.url', 'headers': {}}
+    )
+    responses.add(responses.PUT, 'https://s3.url', headers={'ETag': 'etag'})
+    responses.add(responses.POST, 'https://fs-uploads.com/multipart/complete', json={'handle': 'LARGE'})
+
+    def no_pool_per_file(*args, **kwargs):
+        raise AssertionError('multipart upload created its own pool')
+
+    monkeypatch.setattr('filestack.uploads.multipart.ThreadPoolExecutor', no_pool_per_file)
+    sources = []
+    for num in range(3):
+        path = tmp_path / 'large{}.txt'.format(num)
+        path.write_bytes(b'large file content')
+        sources.append(str(path))
+
+    results = list(client.upload_many(sources, max_requests=2))
+
+    assert [result.error for result in results] == [None] * 3
+    assert len([call for call in responses.calls if call.request.method == 'PUT']) == 15
+
+
+@responses.activate
+def test_metadata_many():
+    client = Client(APIKEY, metadata_cache=MetadataCache())
+    client.metadata_cache.put('CACHED', ['size'], {'size': 3})
+    responses.add(responses.GET, 'https://cdn.filestackcontent.com/A/metadata', json={'size': 1})
+    responses.add(responses.GET, 'https://cdn.filestackcontent.com/B/metadata', status=404, body='not found')
+
+    results = {result.handle: result for result in client.metadata_many(['A', 'B', 'CACHED'], ['size'])}
+
+    assert results['A'].metadata == {'size': 1}
+    assert results['CACHED'].metadata == {'size': 3}
+    assert results['B'].metadata is None
+    assert isinstance(results['B'].error, Exception)
+    assert len(responses.calls) == 2
+    assert client.metadata_cache.get('A', ['size']) == {'size': 1}
+
+
+@responses.activate
+def test_av_convert_many_deduplicates_requests(client):
+    url_a = 'https://cdn.filestackcontent.com/video_convert=preset:h264,width:100/A'
+    url_b = 'https://cdn.filestackcontent.com/video_convert=preset:h264/B'
+    url_external = 'https://cdn.filestackcontent.com/APIKEY/video_convert=preset:h264/https://some.url/v.mp4'
+    responses.add(responses.GET, url_a, json={'uuid': 'uuid-a', 'timestamp': 1})
+    responses.add(responses.GET, url_b, status=500, body='error')
+    responses.add(responses.GET, url_external, json={'uuid': 'uuid-ext', 'timestamp': 2})
+
+    results = client.av_convert_many([
+        ('A', {'preset': 'h264', 'width': 100}),
+        ('B', {'preset': 'h264'}),
+        ('A', {'width': 100, 'preset': 'h264'}),
+        ('https://some.url/v.mp4', {'preset': 'h264'}),
+    ])
+
+    assert [result.handle for result in results] == ['A', 'B', 'A', 'https://some.url/v.mp4']
+    assert results[0].audiovisual is results[2].audiovisual
+    assert results[0].audiovisual.uuid == 'uuid-a'
+    assert results[1].audiovisual is None and results[1].error is not None
+    assert results[3].audiovisual.uuid == 'uuid-ext'
+    assert len(responses.calls) == 3
+
+
+def test_av_convert_many_unknown_parameter(client):
+    with pytest.raises(TypeError, match='bitrate'):
+        client.av_convert_many([('A', {'bitrate': 100})])
+
+
+FAST_RETRY = Backoff(initial=0.001, max_delay=0.001)
+SECURITY = Security({'expiry': 123}, 'secret')
+
+
+@responses.activate
+def test_delete_many():
+    client = Client(APIKEY, security=SECURITY, metadata_cache=MetadataCache())
+    client.metadata_cache.put('A', None, {'size': 1})
+    file_url = 'https://www.filestackapi.com/api/file/{}'
+    responses.add(responses.DELETE, file_url.format('A'))
+    responses.add(responses.DELETE, file_url.format('B'), status=503, body='unavailable')
+    responses.add(responses.DELETE, file_url.format('B'))
+    responses.add(responses.DELETE, file_url.format('C'), status=404, body='not found')
+    responses.add(responses.DELETE, file_url.format('D'), status=500, body='error')
+
+    report = client.delete_many(['A', 'B', 'C', 'D', 'A'], retries=2, retry_backoff=FAST_RETRY)
+
+    assert sorted(report.succeeded) == ['A', 'B']
+    results = {result.handle: result for result in report}
+    assert len(report) == 4
+    assert results['B'].attempts == 2
+    assert results['C'].attempts == 1 and 'not found' in str(results['C'].error)
+    assert results['D'].attempts == 3
+    assert sorted(result.handle for result in report.failed) == ['C', 'D']
+    assert repr(report) == '<BulkReport 2 succeeded, 2 failed>'
+    assert client.metadata_cache.get('A', None) is None
+    for call in responses.calls:
+        assert 'key=APIKEY' in call.request.url and 'signature={}'.format(SECURITY.signature) in call.request.url
+
+
+def test_delete_many_requires_security(client):
+    with pytest.raises(Exception, match='Security is required'):
+        client.delete_many(['A'])
+
+
+@responses.activate
+def test_overwrite_many(tmp_path):
+    path = tmp_path / 'new.txt'
+    path.write_bytes(b'from file')
+
+    class Pipe:
+        def read(self, size=-1):
+            return b''
+
+    file_url = 'https://www.filestackapi.com/api/file/{}'
+    responses.add(responses.POST, file_url.format('URL'))
+    responses.add(responses.POST, file_url.format('PATH'))
+    responses.add(responses.POST, file_url.format('FILEOBJ'), status=502)
+    responses.add(responses.POST, file_url.format('FILEOBJ'))
+    responses.add(responses.POST, file_url.format('PIPE'), status=502)
+
+    report = Client(APIKEY, security=SECURITY).overwrite_many([
+        ('URL', 'https://new.content/url'),
+        ('PATH', str(path)),
+        ('FILEOBJ', io.BytesIO(b'from file object')),
+        ('PIPE', Pipe()),
+    ], base64decode=True, retry_backoff=FAST_RETRY)
+
+    results = {result.handle: result for result in report}
+    assert sorted(report.succeeded) == ['FILEOBJ', 'PATH', 'URL']
+    assert results['FILEOBJ'].attempts == 2
+    assert results['PIPE'].attempts == 1  # non-seekable content is not retried
+    bodies = {call.request.url.split('?')[0].rsplit('/', 1)[1]: call.request.body for call in responses.calls}
+    assert bodies['URL'] == 'url=https%3A%2F%2Fnew.content%2Furl'
+    assert b'from file' in bodies['PATH']
+    assert b'from file object' in bodies['FILEOBJ']
+    assert all('base64decode=true' in call.request.url for call in responses.calls)
+
+
+def test_overwrite_many_malformed_pairs():
+    report = Client(APIKEY, security=SECURITY).overwrite_many([('A',), ('B', 'c', 'd'), None])
+
+    assert sorted(str(result.handle) for result in report) == ['A', 'B', 'None']
+    assert all(isinstance(result.error, Exception) and result.attempts == 0 for result in report)
@@ -0,0 +1,129 @@
+import os
+import re
+from unittest.mock import patch
+
+import pytest
+import responses
+
+from filestack.downloads.ranged import (
+    parallel_download, resumable_download, read_state, write_state, STATE_SUFFIX
+)
+
+URL = 'https://cdn.filestackcontent.com/SOMEHANDLE'
+CONTENT = bytes(range(256)) * 4
+
+
+def range_callback(request):
+    start, end = map(int, re.match(r'bytes=(\d+)-(\d+)', request.headers['Range']).groups())
+    return 206, {'Content-Range': 'bytes {}-{}/{}'.format(start, end, len(CONTENT))}, CONTENT[start:end + 1]
+
+
+@responses.activate
+def test_parallel_download(tmp_path):
+    responses.add(
+        responses.HEAD, URL, body=CONTENT,
+        headers={'Accept-Ranges': 'bytes', 'Content-Length': str(len(CONTENT)), 'ETag': '"abc"'}
+    )
+    responses.add_callback(responses.GET, URL, callback=range_callback)
+    path = tmp_path / 'file'
+
+    assert parallel_download(URL, str(path), workers=3, part_size=100) == len(CONTENT)
+    assert path.read_bytes() == CONTENT
+    range_requests = [call.request for call in responses.calls[1:]]
+    assert len(range_requests) == 11
+    assert all(request.headers['If-Range'] == '"abc"' for request in range_requests)
+
+
+@responses.activate
+def test_parallel_download_without_range_support(tmp_path):
+    responses.add(responses.HEAD, URL, body=CONTENT, headers={'Content-Length': str(len(CONTENT))})
+    responses.add(responses.GET, URL, body=CONTENT)
+    path = tmp_path / 'file'
+
+    assert parallel_download(URL, str(path), part_size=100) == len(CONTENT)
+    assert path.read_bytes() == CONTENT
+    assert 'Range' not in responses.calls[1].request.headers
+
+
+@pytest.mark.parametrize('status', [403, 405, 501])
+@responses.activate
+def test_parallel_download_head_rejected(tmp_path, status):
+    responses.add(responses.HEAD, URL, status=status)
+    responses.add(responses.GET, URL, body=CONTENT)
+    path = tmp_path / 'file'
+
+    assert parallel_download(URL, str(path), part_size=100) == len(CONTENT)
+    assert path.read_bytes() == CONTENT
+    assert 'Range' not in responses.calls[1].request.headers
+
+
+@responses.activate
+def test_parallel_download_file_changed(tmp_path):
+    responses.add(
+        responses.HEAD, URL, body=CONTENT,
+        headers={'Accept-Ranges': 'bytes', 'Content-Length': str(len(CONTENT)), 'ETag': '"abc"'}
+    )
+    responses.add(responses.GET, URL, body=b'new content', status=200)
+
+    with pytest.raises(Exception, match=r'remote file may have changed'):
+        parallel_download(URL, str(tmp_path / 'file'), part_size=100)
+
+
+def write_partial(path, etag='"abc"'):
+    path.write_bytes(CONTENT[:300])
+    write_state(str(path) + STATE_SUFFIX, etag, len(CONTENT))
+
+
+def resume_callback(request):
+    if 'Range' not in request.headers or request.headers.get('If-Range') != '"abc"':
+        return 200, {'ETag': '"abc"', 'Content-Length': str(len(CONTENT))}, CONTENT
+    start = int(re.match(r'bytes=(\d+)-$', request.headers['Range']).group(1))
+    headers = {'ETag': '"abc"', 'Content-Range': 'bytes {}-{}/{}'.format(start, len(CONTENT) - 1, len(CONTENT))}
+    return 206, headers, CONTENT[start:]
+
+
+@responses.activate
+def test_resumable_download(tmp_path):
+    path = tmp_path / 'file'
+    write_partial(path)
+    responses.add_callback(responses.GET, URL, callback=resume_callback)
+
+    assert resumable_download(URL, str(path)) == len(CONTENT)
+    assert path.read_bytes() == CONTENT
+    assert responses.calls[0].request.headers['Range'] == 'bytes=300-'
+    assert responses.calls[0].request.headers['If-Range'] == '"abc"'
+    assert not os.path.exists(str(path) + STATE_SUFFIX)
+
+
+@responses.activate
+def test_resumable_download_already_complete(tmp_path):
+    path = tmp_path / 'file'
+    path.write_bytes(CONTENT)
+    write_state(str(path) + STATE_SUFFIX, '"abc"', len(CONTENT))
+    responses.add_callback(responses.GET, URL, callback=resume_callback)
+
+    assert resumable_download(URL, str(path)) == len(CONTENT)
+    assert path.read_bytes() == CONTENT
+    assert responses.calls[0].request.headers['Range'] == 'bytes=1023-'
+
+
+@responses.activate
+def test_resumable_download_remote_changed(tmp_path):
+    path = tmp_path / 'file'
+    write_partial(path, etag='"old"')
+    responses.add_callback(responses.GET, URL, callback=resume_callback)
+
+    assert resumable_download(URL, str(path)) == len(CONTENT)
+    assert path.read_bytes() == CONTENT
+
+
+@responses.activate
+def test_resumable_download_interrupted(tmp_path):
+    path = tmp_path / 'file'
+    responses.add(responses.GET, URL, body=CONTENT[:500], headers={'ETag': '"abc"'})
+    with patch('filestack.downloads.ranged.response_size', return_value=len(CONTENT)):
+        with pytest.raises(Exception, match=r'received 500 of 1024 bytes'):
+            resumable_download(URL, str(path))
+
+    assert read_state(str(path) + STATE_SUFFIX) == {'etag': '"abc"', 'size': len(CONTENT)}
+    assert path.read_bytes() == CONTENT[:500]
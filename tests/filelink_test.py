@@ -6,7 +6,7 @@ import pytest
 import responses
 
 from filestack import exceptions
-from filestack import Filelink, Security
+from filestack import ContentCache, Filelink, Security
 from filestack import config
 
 APIKEY = 'APIKEY'
@@ -110,12 +110,22 @@ def test_download(filelink):
         responses.GET, 'https://cdn.filestackcontent.com/{}'.format(HANDLE), body=b'file-content'
     )
     m = mock_open()
-    with patch('filestack.mixins.common.open', m):
+    with patch('filestack.downloads.ranged.open', m):
         file_size = filelink.download('tests/data/test_download.jpg')
         assert file_size == 12
     m().write.assert_called_once_with(b'file-content')
 
 
+def test_download_parallel_and_resume(filelink):
+    with pytest.raises(ValueError, match=r'cannot be used together'):
+        filelink.download('tests/data/test_download.jpg', parallel=True, resume=True)
+
+
+def test_download_empty_cache_and_resume(filelink):
+    with pytest.raises(ValueError, match=r'cannot be used together'):
+        filelink.download('tests/data/test_download.jpg', resume=True, cache=ContentCache())
+
+
 def test_tags_without_security(filelink):
     with pytest.raises(Exception, match=r'Security is required'):
         filelink.tags()
@@ -1,5 +1,5 @@
 import pytest
-from filestack.helpers import verify_webhook_signature
+from filestack.helpers import verify_webhook_signature, WebhookVerifier, ReplayGuard, MemorySignatureStore
 
 
 @pytest.mark.parametrize('signature, expected_result', [
@@ -30,3 +30,83 @@ def test_agrument_validation(secret, body, headers, err_msg):
     result, details = verify_webhook_signature(secret, body, headers)
     assert result is False
     assert err_msg in details['error']
+
+
+BODY = b'{"text": {"filename": "filename.jpg", "key": "kGaeljnga9wkysK6Z_filename.jpg"}}'
+SIGNATURE = '57cbb25386c3d6ff758a7a75cf52ba02cf2b0a1a2d6d5dfb9c886553ca6011cb'
+
+
+@pytest.mark.parametrize('body, headers', [
+    (BODY, {'FS-Signature': SIGNATURE, 'FS-Timestamp': 123456789999}),
+    (BODY.decode(), {'fs-signature': SIGNATURE, 'fs-timestamp': '123456789999'}),
+    (memoryview(BODY), {'Fs-Signature': SIGNATURE.encode(), 'FS-TIMESTAMP': '123456789999'}),
+])
+def test_webhook_verifier(body, headers):
+    assert WebhookVerifier('webhook-secret').verify(body, headers) == (True, {})
+
+
+@pytest.mark.parametrize('body, headers, err_msg', [
+    (BODY, {'FS-Signature': 'incorrect-signature', 'FS-Timestamp': 123456789999}, 'Signature mismatch'),
+    (BODY, {'FS-Signature': SIGNATURE, 'FS-Timestamp': 1}, 'Signature mismatch'),
+    (BODY, {'FS-Signature': 'ąę', 'FS-Timestamp': 1}, 'Signature mismatch'),
+    (BODY, {'FS-Timestamp': 123}, 'fs-signature header is missing'),
+    (BODY, 'should be a dict', 'Expected: dict'),
+    (['incorrect'], {'FS-Signature': SIGNATURE, 'FS-Timestamp': 123}, 'Invalid webhook body'),
+])
+def test_webhook_verifier_rejects(body, headers, err_msg):
+    result, details = WebhookVerifier('webhook-secret').verify(body, headers)
+    assert result is False
+    assert err_msg in details['error']
+
+
+def test_webhook_verifier_verify_many():
+    verifier = WebhookVerifier('webhook-secret')
+    results = verifier.verify_many([
+        (BODY, {'FS-Signature': SIGNATURE, 'FS-Timestamp': 123456789999}),
+        (BODY, {'FS-Signature': SIGNATURE, 'FS-Timestamp': 123}),
+        (BODY, {'FS-Signature': SIGNATURE, 'FS-Timestamp': 123456789999}),
+    ])
+    assert [result for result, _ in results] == [True, False, True]
+
+
+def test_webhook_verifier_requires_string_secret():
+    with pytest.raises(TypeError):
+        WebhookVerifier(b'secret')
+
+
+def test_replay_guard_rejects_duplicates_and_stale_webhooks():
+    guard = ReplayGuard(max_age=300)
+    headers = {'FS-Signature': 'sig', 'FS-Timestamp': '1000'}
+
+    assert guard.check(headers, now=1100) == (True, {})
+    assert guard.check(headers, now=1101) == (False, {'error': 'Webhook already received'})
+    assert 'expired' in guard.check({'FS-Signature': 'other', 'FS-Timestamp': '1000'}, now=1301)[1]['error']
+    assert 'expired' in guard.check({'FS-Signature': 'other', 'FS-Timestamp': '2000'}, now=1000)[1]['error']
+    assert 'Invalid fs-timestamp' in guard.check({'FS-Signature': 'x', 'FS-Timestamp': 'abc'}, now=1000)[1]['error']
+    assert 'missing' in guard.check({'FS-Signature': 'x'})[1]['error']
+
+
+def test_memory_signature_store_is_bounded_and_evicts_expired():
+    store = MemorySignatureStore(max_entries=3)
+    for num in range(5):
+        assert store.add(num, expires_at=100, now=0)
+    assert len(store) == 3
+    assert store.add(0, expires_at=100, now=0)  # evicted as the oldest entry
+    assert not store.add(4, expires_at=100, now=0)
+
+    assert store.add('late', expires_at=200, now=150)
+    assert len(store) == 1  # entries expired at 100 are dropped
+    store.discard('late')
+    assert len(store) == 0
+
+
+def test_webhook_verifier_with_replay_guard(monkeypatch):
+    monkeypatch.setattr('time.time', lambda: 123456789999 + 10)
+    guard = ReplayGuard(max_age=60)
+    verifier = WebhookVerifier('webhook-secret', replay_guard=guard)
+    headers = {'FS-Signature': SIGNATURE, 'FS-Timestamp': 123456789999}
+
+    # forged body with a genuine signature doesn't block the genuine webhook
+    assert verifier.verify(b'forged', headers)[0] is False
+    assert verifier.verify(BODY, headers) == (True, {})
+    assert verifier.verify(BODY, headers) == (False, {'error': 'Webhook already received'})
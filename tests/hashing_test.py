@@ -0,0 +1,48 @@
+import hashlib
+from base64 import b64encode
+
+import pytest
+
+from filestack.uploads.buffers import MappedFile
+from filestack.uploads.hashing import ProcessHasher, md5_b64, md5_region
+
+DATA = bytes(range(256)) * 64
+
+
+def expected_md5(data):
+    return b64encode(hashlib.md5(data).digest()).decode()
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(DATA)
+    return str(path)
+
+
+def test_md5_b64_of_memoryview(data_file):
+    with MappedFile(data_file) as mapped:
+        view = mapped.slice(100, 1000)
+        assert md5_b64(view) == expected_md5(DATA[100:1100])
+        view.release()
+
+
+def test_md5_region(data_file):
+    assert md5_region(data_file, 4096, 5000) == expected_md5(DATA[4096:9096])
+
+
+def test_process_hasher_hashes_file_regions(data_file):
+    with ProcessHasher(workers=2, min_size=1) as hasher:
+        with MappedFile(data_file) as mapped:
+            view = mapped.slice(1000, 3000)
+            assert hasher.md5(view, filepath=data_file, offset=1000) == expected_md5(DATA[1000:4000])
+            view.release()
+        assert hasher._executor is not None
+    assert hasher._executor is None
+
+
+def test_process_hasher_hashes_small_chunks_and_streams_inline():
+    hasher = ProcessHasher(min_size=1024)
+    assert hasher.md5(b'x' * 10, filepath='missing/file', offset=0) == expected_md5(b'x' * 10)
+    assert hasher.md5(b'y' * 2048) == expected_md5(b'y' * 2048)
+    assert hasher._executor is None
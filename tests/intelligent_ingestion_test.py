@@ -3,7 +3,7 @@ import json
 import pytest
 import responses
 
-from filestack.uploads.intelligent_ingestion import upload_part
+from filestack.uploads.intelligent_ingestion import upload_part, ChunkSizeController, MB
 
 
 @responses.activate
@@ -27,7 +27,7 @@ def test_upload_part_success():
         'part': 1, 'size': 5415034, 'md5': 'IuNjhgPo2wbzGFo6f7WhUA==', 'offset': 0, 'fii': True
     }
     with open('tests/data/doom.mp4', 'rb') as f:
-        assert responses.calls[1].request.body == f.read()
+        assert bytes(responses.calls[1].request.body.read()) == f.read()
     multipart_commit_payload = json.loads(responses.calls[2].request.body.decode())
     assert multipart_commit_payload == {
         'apikey': 'Aaaaapikey', 'uri': 'fs-upload.com', 'region': 'region',
@@ -76,3 +76,74 @@ def test_min_chunk_size_exception():
 
     chunk_sizes = [len(call.request.body) for call in responses.calls if call.request.method == 'PUT']
     assert chunk_sizes[-1] == 32768  # check size of last attempt
+
+
+def test_chunk_size_controller_aimd():
+    controller = ChunkSizeController(initial_size=8 * MB, min_size=1 * MB, max_size=8 * MB, step=1 * MB)
+    controller.failure(8 * MB)
+    assert controller.chunk_size == 4 * MB
+    controller.failure(8 * MB)  # other thread failed with previous size, no further decrease
+    assert controller.chunk_size == 4 * MB
+
+    controller.success(4 * MB, elapsed=2)
+    assert controller.chunk_size == 5 * MB
+    assert controller.throughput == 2 * MB
+    controller.success(1 * MB, elapsed=1)  # last, partial chunk of a part does not grow chunks
+    assert controller.chunk_size == 5 * MB
+    assert 1 * MB < controller.throughput < 2 * MB
+
+    for _ in range(10):
+        controller.success(controller.chunk_size, elapsed=1)
+    assert controller.chunk_size == 8 * MB
+
+    for _ in range(3):
+        controller.failure(controller.chunk_size)
+    assert controller.chunk_size == 1 * MB
+    with pytest.raises(Exception, match='Minimal chunk size failed'):
+        controller.failure(controller.chunk_size)
+    assert controller.failures == 6
+
+
+def test_chunk_size_controller_stays_within_bounds_after_minimal_failure():
+    controller = ChunkSizeController(initial_size=48 * 1024, min_size=32 * 1024, max_size=64 * 1024, step=8 * 1024)
+    controller.failure(48 * 1024)
+    assert controller.chunk_size == 32 * 1024  # clamped, minimal size is still tried
+    with pytest.raises(Exception, match='Minimal chunk size failed'):
+        controller.failure(32 * 1024)
+    assert controller.chunk_size == 32 * 1024
+
+    # controller shared by the next upload starts within bounds and recovers
+    controller.success(32 * 1024, elapsed=1)
+    assert controller.chunk_size == 40 * 1024
+    controller.failure(40 * 1024)
+    assert controller.chunk_size == 32 * 1024
+
+
+@responses.activate
+def test_chunk_size_is_per_upload(tmp_path):
+    path = tmp_path / 'file.bin'
+    path.write_bytes(b'x' * 100)
+    responses.add(
+        responses.POST, 'https://fs-upload.com/multipart/upload',
+        json={'url': 'https://s3.url', 'headers': {}}
+    )
+    responses.add(responses.PUT, 'https://s3.url', status=400)
+    responses.add(responses.PUT, 'https://s3.url')
+    responses.add(responses.POST, 'https://fs-upload.com/multipart/commit')
+    start_response = {
+        'uri': 'fs-upload.com', 'location_url': 'fs-upload.com', 'region': 'region', 'upload_id': 'abc'
+    }
+
+    flaky = ChunkSizeController(initial_size=64, min_size=8, max_size=64, step=8)
+    upload_part('apikey', 'file.bin', str(path), 100, 's3', start_response, {'seek_point': 0, 'num': 1},
+                controller=flaky)
+    chunk_sizes = [len(call.request.body) for call in responses.calls if call.request.method == 'PUT']
+    assert chunk_sizes == [64, 32, 40, 28]
+    assert flaky.chunk_size == 48
+
+    responses.calls.reset()
+    healthy = ChunkSizeController(initial_size=64, min_size=8, max_size=64, step=8)
+    upload_part('apikey', 'file.bin', str(path), 100, 's3', start_response, {'seek_point': 0, 'num': 1},
+                controller=healthy)
+    chunk_sizes = [len(call.request.body) for call in responses.calls if call.request.method == 'PUT']
+    assert chunk_sizes == [64, 36]
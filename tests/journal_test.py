@@ -0,0 +1,153 @@
+import os
+import json
+
+import pytest
+import responses
+
+from filestack import config
+from filestack.exceptions import FilestackHTTPError
+from filestack.uploads import intelligent_ingestion
+from filestack.uploads.journal import UploadJournal
+from filestack.uploads.multipart import multipart_upload
+
+START_RESPONSE = {'region': 'us-east-1', 'upload_id': 'someuuid', 'uri': 'someuri', 'location_url': 'fs-uploads.com'}
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return UploadJournal(str(tmp_path / 'journal'))
+
+
+@pytest.fixture
+def upload_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DEFAULT_CHUNK_SIZE', 4)
+    path = tmp_path / 'file.txt'
+    path.write_bytes(b'aaaabbbbcc')
+    return str(path)
+
+
+def test_journal_roundtrip(journal, upload_file):
+    key = journal.make_key(upload_file, storage='S3')
+    assert journal.load(key) is None
+
+    journal.start(key, START_RESPONSE)
+    journal.add_part(key, 1, {'part_number': 1, 'etag': 'a'})
+    journal.add_part(key, 2, {'part_number': 2, 'etag': 'b'})
+    with open(journal._path(key), 'a') as f:
+        f.write('{"part": 3, "res')  # process killed while writing
+
+    assert journal.load(key) == {
+        'start_response': START_RESPONSE,
+        'parts': {1: {'part_number': 1, 'etag': 'a'}, 2: {'part_number': 2, 'etag': 'b'}}
+    }
+
+    journal.finish(key)
+    assert journal.load(key) is None
+
+
+def test_journal_survives_repeated_crashes(journal, upload_file):
+    key = journal.make_key(upload_file, storage='S3')
+    journal.start(key, START_RESPONSE)
+    journal.add_part(key, 1, {'etag': 'a'})
+    with open(journal._path(key), 'a') as f:
+        f.write('{"part": 2, "res')  # first crash
+
+    assert journal.load(key)['parts'] == {1: {'etag': 'a'}}  # resumed
+    for part in (2, 3, 4):
+        journal.add_part(key, part, {'etag': str(part)})
+    with open(journal._path(key), 'a') as f:
+        f.write('{"part": 5')  # second crash
+
+    assert journal.load(key)['parts'] == {1: {'etag': 'a'}, 2: {'etag': '2'}, 3: {'etag': '3'}, 4: {'etag': '4'}}
+    journal.add_part(key, 5, {'etag': '5'})
+    assert sorted(journal.load(key)['parts']) == [1, 2, 3, 4, 5]
+
+
+def test_journal_skips_damaged_lines(journal, upload_file):
+    key = journal.make_key(upload_file, storage='S3')
+    journal.start(key, START_RESPONSE)
+    with open(journal._path(key), 'a') as f:
+        f.write('{"part": 1, "res{"part": 2, "result": {"etag": "b"}}\n{"part": 3, "result": {"etag": "c"}}\n')
+
+    assert journal.load(key)['parts'] == {3: {'etag': 'c'}}
+
+
+def test_journal_key_changes_with_file(journal, upload_file):
+    key = journal.make_key(upload_file, storage='S3')
+    assert key == journal.make_key(upload_file, storage='S3')
+    assert key != journal.make_key(upload_file, storage='gcs')
+
+    with open(upload_file, 'ab') as f:
+        f.write(b'more content')
+    assert key != journal.make_key(upload_file, storage='S3')
+
+
+def test_resume_multipart_upload(journal, upload_file):
+    put_bodies = []
+    failed = []
+
+    def put_callback(request):
+        body = bytes(request.body.read())
+        if body == b'bbbb' and not failed:
+            failed.append(body)
+            return 500, {}, 'connection reset'
+        put_bodies.append(body)
+        return 200, {'ETag': 'etag-{}'.format(body.decode())}, ''
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(responses.POST, config.MULTIPART_START_URL, json=START_RESPONSE)
+        rsps.add(
+            responses.POST, 'https://fs-uploads.com/multipart/upload',
+            json={'url': 'https://s3.url', 'headers': {}}
+        )
+        rsps.add_callback(responses.PUT, 'https://s3.url', callback=put_callback)
+        rsps.add(responses.POST, 'https://fs-uploads.com/multipart/complete', json={'handle': 'HANDLE'})
+
+        with pytest.raises(FilestackHTTPError):
+            multipart_upload('APIKEY', upload_file, None, 'S3', journal=journal)
+
+        uploaded_before_failure = list(put_bodies)
+        response = multipart_upload('APIKEY', upload_file, None, 'S3', journal=journal)
+
+        assert response == {'handle': 'HANDLE'}
+        start_calls = [call for call in rsps.calls if call.request.url == config.MULTIPART_START_URL]
+        assert len(start_calls) == 1
+        assert sorted(put_bodies) == [b'aaaa', b'bbbb', b'cc']  # every part uploaded exactly once
+        assert b'bbbb' not in uploaded_before_failure
+        complete_payload = json.loads(rsps.calls[-1].request.body)
+        assert complete_payload['parts'] == [
+            {'part_number': 1, 'etag': 'etag-aaaa'},
+            {'part_number': 2, 'etag': 'etag-bbbb'},
+            {'part_number': 3, 'etag': 'etag-cc'},
+        ]
+        assert complete_payload['upload_id'] == 'someuuid'
+
+    assert os.listdir(journal.directory) == []
+
+
+def test_resume_fii_upload(journal, upload_file, monkeypatch):
+    monkeypatch.setattr(intelligent_ingestion, 'DEFAULT_PART_SIZE', 4)
+    uploaded_parts = []
+    failed = []
+
+    def upload_part(apikey, filename, filepath, filesize, storage, start_response, part, **kwargs):
+        if part['num'] == 2 and not failed:
+            failed.append(part['num'])
+            raise Exception('network down')
+        uploaded_parts.append(part['num'])
+
+    monkeypatch.setattr(intelligent_ingestion, 'upload_part', upload_part)
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.POST, config.MULTIPART_START_URL, json=START_RESPONSE)
+        with pytest.raises(Exception, match='network down'):
+            intelligent_ingestion.upload('APIKEY', upload_file, None, 'S3', journal=journal)
+
+    assert sorted(uploaded_parts) == [1, 3]
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.POST, 'https://fs-uploads.com/multipart/complete', json={'handle': 'HANDLE'})
+        response = intelligent_ingestion.upload('APIKEY', upload_file, None, 'S3', journal=journal)
+
+    assert response == {'handle': 'HANDLE'}
+    assert sorted(uploaded_parts) == [1, 2, 3]
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+import pytest
+
+import filestack
+
+
+def run_python(code):
+    return subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, check=True).stdout.decode().split()
+
+
+def test_import_does_not_load_http_and_upload_modules():
+    loaded = run_python(
+        'import sys, filestack; filestack.Filelink("HANDLE").resize(width=1).signed_url(filestack.Security({}, "s")); '
+        'print(*[m for m in ("requests", "trafaret", "concurrent.futures", "filestack.uploads.multipart") '
+        'if m in sys.modules])'
+    )
+    assert loaded == []
+
+
+def test_lazy_attributes():
+    assert filestack.Client is filestack.models.client.Client
+    assert 'Client' in dir(filestack)
+    assert filestack.models.Filelink is filestack.Filelink
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match=r'Unknown'):
+        filestack.Unknown
@@ -1,5 +1,7 @@
 import io
 import json
+import time
+import threading
 from collections import defaultdict
 
 import responses
@@ -7,7 +9,9 @@ import pytest
 
 from filestack import Client
 from filestack import config
-from filestack.uploads.multipart import upload_chunk, Chunk
+from filestack.polling import Backoff
+from filestack.uploads.multipart import upload_chunk, upload_chunks, iter_blocks, Chunk
+from filestack.uploads.hashing import ProcessHasher
 
 APIKEY = 'APIKEY'
 HANDLE = 'SOMEHANDLE'
@@ -61,6 +65,20 @@ def test_upload_with_workflows(multipart_mock):
     assert multipart_complete_payload['store']['workflows'] == workflow_ids
 
 
+def test_upload_completion_polled(multipart_mock):
+    multipart_mock.replace(responses.POST, 'https://fs-uploads.com/multipart/complete', status=202, json={})
+    multipart_mock.add(
+        responses.POST, 'https://fs-uploads.com/multipart/complete', status=200,
+        json={'url': 'https://cdn.filestackcontent.com/{}'.format(HANDLE), 'handle': HANDLE}
+    )
+    backoff = Backoff(initial=0.001, deadline=5)
+
+    future = Client(APIKEY).upload(file_obj=io.BytesIO(b'file bytes'), wait=False, completion_backoff=backoff)
+
+    assert future.result(timeout=5).handle == HANDLE
+    assert len(multipart_mock.calls) == 5
+
+
 @responses.activate
 def test_upload_chunk():
     responses.add(
@@ -74,3 +92,155 @@ def test_upload_chunk():
     start_response['location_url'] = 'fsuploads.com'
     upload_result = upload_chunk('apikey', 'filename', 's3', start_response, chunk)
     assert upload_result == {'part_number': 123, 'etag': 'etagX'}
+
+
+def test_upload_iterable_requires_size():
+    with pytest.raises(ValueError, match='size is required'):
+        Client(APIKEY).upload(file_obj=iter([b'abc']))
+
+
+def test_upload_iterable(multipart_mock, monkeypatch):
+    monkeypatch.setattr(config, 'DEFAULT_CHUNK_SIZE', 4)
+    multipart_mock.add(responses.PUT, 'http://somewhere.on.s3', json={}, headers={'ETag': 'def'})
+
+    filelink = Client(APIKEY).upload(file_obj=(piece for piece in [b'ab', b'cdef', b'g']), size=7)
+    assert filelink.handle == HANDLE
+    put_bodies = sorted(call.request.body for call in multipart_mock.calls if call.request.method == 'PUT')
+    assert put_bodies == [b'abcd', b'efg']
+    complete_payload = json.loads(multipart_mock.calls[-1].request.body.decode())
+    assert complete_payload['size'] == 7
+    assert [part['part_number'] for part in complete_payload['parts']] == [1, 2]
+
+
+def test_iter_blocks_non_seekable_reader():
+    class Pipe:
+        def __init__(self, data):
+            self.stream = io.BytesIO(data)
+
+        def read(self, size):
+            return self.stream.read(min(size, 3))  # short reads
+
+    assert list(iter_blocks(Pipe(b'0123456789'), 4)) == [b'0123', b'4567', b'89']
+
+
+def test_upload_chunks_bounded_window():
+    lock = threading.Lock()
+    produced = []
+    in_memory = []
+
+    def chunks():
+        for num in range(20):
+            with lock:
+                produced.append(num)
+                in_memory.append(len(produced) - len(uploaded))
+            yield num
+
+    uploaded = []
+
+    def upload(chunk):
+        time.sleep(0.001)
+        with lock:
+            uploaded.append(chunk)
+        return chunk
+
+    assert upload_chunks(upload, chunks(), max_workers=2, max_in_flight=3) == list(range(20))
+    assert max(in_memory) <= 3
+
+
+def test_upload_chunks_stops_on_error():
+    produced = []
+
+    def chunks():
+        for num in range(100):
+            produced.append(num)
+            yield num
+
+    def upload(chunk):
+        raise RuntimeError('upload failed')
+
+    with pytest.raises(RuntimeError, match='upload failed'):
+        upload_chunks(upload, chunks(), max_workers=1, max_in_flight=1)
+    assert len(produced) < 100
+
+
+def test_upload_filepath_is_mapped(multipart_mock, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DEFAULT_CHUNK_SIZE', 4)
+    multipart_mock.add(responses.PUT, 'http://somewhere.on.s3', json={}, headers={'ETag': 'def'})
+    path = tmp_path / 'file.txt'
+    path.write_bytes(b'abcdefg')
+
+    filelink = Client(APIKEY).upload(filepath=str(path))
+    assert filelink.handle == HANDLE
+    put_bodies = sorted(
+        bytes(call.request.body.read()) for call in multipart_mock.calls if call.request.method == 'PUT'
+    )
+    assert put_bodies == [b'abcd', b'efg']
+    upload_payloads = [
+        json.loads(call.request.body) for call in multipart_mock.calls if call.request.url.endswith('/upload')
+    ]
+    assert sorted(payload['md5'] for payload in upload_payloads) == [
+        '4vxxTEcn7pOV8yTNLn8zHw==', 'fQmJjhhRHPfAwYFdB3KNIw=='
+    ]
+
+
+def test_upload_chunks_prepared_ahead():
+    lock = threading.Lock()
+    prepared = []
+    first_upload_started = threading.Event()
+    release_uploads = threading.Event()
+
+    def prepare(chunk):
+        with lock:
+            prepared.append(chunk)
+        return chunk * 10
+
+    def upload(prepared_chunk):
+        first_upload_started.set()
+        release_uploads.wait(5)
+        return prepared_chunk
+
+    def release():
+        first_upload_started.wait(5)
+        # let signing run ahead of the blocked upload
+        deadline = time.monotonic() + 5
+        while len(prepared) < 4 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release_uploads.set()
+
+    releaser = threading.Thread(target=release)
+    releaser.start()
+    result = upload_chunks(upload, range(6), max_workers=1, max_in_flight=4, prepare_func=prepare, prepare_workers=2)
+    releaser.join()
+
+    assert result == [0, 10, 20, 30, 40, 50]
+    assert len(prepared) == 6
+
+
+def test_upload_pipelined(multipart_mock, monkeypatch):
+    monkeypatch.setattr(config, 'DEFAULT_CHUNK_SIZE', 4)
+    multipart_mock.add(responses.PUT, 'http://somewhere.on.s3', json={}, headers={'ETag': 'def'})
+
+    filelink = Client(APIKEY).upload(file_obj=io.BytesIO(b'abcdefg'), pipelined=True)
+    assert filelink.handle == HANDLE
+    put_bodies = sorted(call.request.body for call in multipart_mock.calls if call.request.method == 'PUT')
+    assert put_bodies == [b'abcd', b'efg']
+    complete_payload = json.loads(multipart_mock.calls[-1].request.body.decode())
+    assert sorted(part['etag'] for part in complete_payload['parts']) == ['abc', 'def']
+
+
+def test_upload_filepath_with_process_hasher(multipart_mock, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DEFAULT_CHUNK_SIZE', 4)
+    multipart_mock.add(responses.PUT, 'http://somewhere.on.s3', json={}, headers={'ETag': 'def'})
+    path = tmp_path / 'file.txt'
+    path.write_bytes(b'abcdefg')
+
+    with ProcessHasher(workers=1, min_size=1) as hasher:
+        filelink = Client(APIKEY).upload(filepath=str(path), hasher=hasher)
+
+    assert filelink.handle == HANDLE
+    upload_payloads = [
+        json.loads(call.request.body) for call in multipart_mock.calls if call.request.url.endswith('/upload')
+    ]
+    assert sorted(payload['md5'] for payload in upload_payloads) == [
+        '4vxxTEcn7pOV8yTNLn8zHw==', 'fQmJjhhRHPfAwYFdB3KNIw=='
+    ]
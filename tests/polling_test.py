@@ -0,0 +1,57 @@
+import pytest
+
+from filestack.polling import Backoff, Poller, resolved, then
+
+FAST = Backoff(initial=0.001, max_delay=0.01, deadline=1)
+
+
+def make_poll(pending, result='done'):
+    calls = []
+
+    def poll():
+        calls.append(1)
+        return len(calls) > pending, result
+
+    return poll, calls
+
+
+def test_backoff_delays():
+    backoff = Backoff(initial=1, factor=2, max_delay=5, jitter=0.5)
+    for attempt, delay in enumerate([1, 2, 4, 5, 5]):
+        assert delay * 0.5 <= backoff.delay(attempt) <= delay
+
+    assert Backoff(initial=1, jitter=0).delay(1) == 2
+
+
+def test_poller_resolves_many():
+    poller = Poller()
+    polls = [make_poll(pending) for pending in range(5)]
+    futures = [poller.submit(poll, backoff=FAST) for poll, _ in polls]
+
+    assert [future.result(timeout=5) for future in futures] == ['done'] * 5
+    assert [len(calls) for _, calls in polls] == [1, 2, 3, 4, 5]
+    assert len(poller) == 0
+
+
+def test_poller_deadline():
+    poll, _ = make_poll(pending=10 ** 6)
+    future = Poller().submit(poll, backoff=Backoff(initial=0.01, jitter=0, deadline=0.05))
+
+    with pytest.raises(TimeoutError):
+        future.result(timeout=5)
+
+
+def test_poller_exception():
+    def poll():
+        raise ValueError('poll failed')
+
+    with pytest.raises(ValueError, match=r'poll failed'):
+        Poller().submit(poll, backoff=FAST).result(timeout=5)
+
+
+def test_then():
+    assert then(resolved(2), lambda value: value * 10).result() == 20
+
+    future = then(resolved(0), lambda value: 1 / value)
+    with pytest.raises(ZeroDivisionError):
+        future.result()
@@ -1,4 +1,11 @@
-from filestack import Security
+import copy
+import pickle
+import time
+
+import pytest
+
+from filestack import Filelink, Security, SecurityFactory
+from filestack.models.security import sign_policy
 
 
 def test_security():
@@ -17,3 +24,113 @@ def test_security_as_url_string():
         'security=p:eyJleHBpcmVzIjogOTk5OTk5OTk5OTk5fQ==,'
         's:8c75305f7615776a892ddd165111dba0fa24b45107024a55a7170a7d1d60157a'
     )
+
+
+def test_security_is_immutable():
+    policy = {'expiry': 123}
+    security_obj = Security(policy, 'secret')
+    policy['expiry'] = 456
+    security_obj.policy['expiry'] = 789
+
+    assert security_obj.policy == {'expiry': 123}
+    with pytest.raises(AttributeError):
+        security_obj.signature = 'other'
+
+
+def test_security_policy_is_deep_copied():
+    policy = {'expiry': 1, 'call': ['read']}
+    security_obj = Security(policy, 'secret')
+    policy['call'].append('store')
+    security_obj.policy['call'].append('write')
+
+    assert security_obj.policy == {'expiry': 1, 'call': ['read']}
+    assert security_obj == Security({'expiry': 1, 'call': ['read']}, 'secret')
+
+
+@pytest.mark.parametrize('clone', [lambda sec: pickle.loads(pickle.dumps(sec)), copy.deepcopy, copy.copy])
+def test_security_pickle_and_copy(clone):
+    security_obj = Security({'expiry': 1, 'call': ['read']}, 'secret')
+    cloned = clone(security_obj)
+
+    assert cloned == security_obj
+    assert cloned.policy == security_obj.policy
+    assert cloned.as_url_string() == security_obj.as_url_string()
+    with pytest.raises(AttributeError):
+        cloned.signature = 'other'
+
+
+def test_security_as_params():
+    security_obj = Security({'expires': 123}, 'secret')
+    params = security_obj.as_params()
+    params['key'] = 'APIKEY'
+
+    assert security_obj.as_params() == {
+        'policy': 'eyJleHBpcmVzIjogMTIzfQ==',
+        'signature': '379d2ba0d5be34eddf09f873b7f38643dc51599b0afcd564f52733b52d698748'
+    }
+
+
+def test_signing_cache():
+    sign_policy.cache_clear()
+    Security({'expires': 123, 'call': ['read']}, 'secret')
+    Security({'call': ['read'], 'expires': 123}, 'secret')
+    Security({'expires': 123, 'call': ['read']}, 'other-secret')
+
+    assert sign_policy.cache_info().hits == 1
+    assert sign_policy.cache_info().misses == 2
+
+
+def test_sign_many():
+    policies = [{'expires': 123, 'handle': handle} for handle in ('A', 'B', 'A')]
+    securities = Security.sign_many(policies, 'secret')
+
+    assert [security.policy for security in securities] == policies
+    assert securities[0] is securities[2]
+    assert securities[0] != securities[1]
+    assert securities[1] == Security(policies[1], 'secret')
+
+
+def test_security_factory_buckets(monkeypatch):
+    now = [1000000]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    factory = SecurityFactory('secret', bucket=3600, min_lifetime=900)
+
+    first = factory.get(handle='HANDLE', call=['read', 'convert'])
+    assert first.policy == {'expiry': 1004400, 'handle': 'HANDLE', 'call': ['convert', 'read']}
+
+    now[0] = 1003499
+    assert factory.get(handle='HANDLE', call=['convert', 'read']) is first
+    assert factory.get(handle='OTHER', call=['read', 'convert']) is not first
+
+    now[0] = 1003501
+    second = factory.get(handle='HANDLE', call=['read', 'convert'])
+    assert second.policy['expiry'] == 1008000
+    assert second.policy['expiry'] - now[0] >= 900
+
+
+def test_security_factory_signed_urls_identical():
+    factory = SecurityFactory('secret', policy={'path': '/avatars/'})
+    transformation = Filelink('HANDLE').resize(width=100)
+
+    first = transformation.signed_url(factory.get(handle='HANDLE', call=['read']))
+    assert transformation.signed_url(factory.get(handle='HANDLE', call=['read'])) == first
+    assert factory.get(handle='HANDLE').policy['path'] == '/avatars/'
+
+
+def test_security_factory_is_bounded():
+    factory = SecurityFactory('secret', max_size=2)
+    first = factory.get(handle='A')
+    factory.get(handle='B')
+    assert factory.get(handle='A') is first  # A becomes the most recently used
+    factory.get(handle='C')
+
+    assert len(factory._securities) == 2
+    assert factory.get(handle='A') is first
+    recreated = factory.get(handle='B')
+    assert recreated == Security(recreated.policy, 'secret')
+    assert recreated.policy['expiry'] == first.policy['expiry']
+
+
+def test_security_factory_rejects_expiry():
+    with pytest.raises(ValueError, match='expiry is set by SecurityFactory'):
+        SecurityFactory('secret').get(handle='A', expiry=123)
@@ -0,0 +1,62 @@
+import pytest
+
+from filestack import Filelink, Security, TransformationTemplate
+from filestack import config
+
+APIKEY = 'SOMEAPIKEY'
+HANDLE = 'SOMEHANDLE'
+EXTERNAL_URL = 'https://example.com/image.jpg'
+SECURITY = Security({'expiry': 10238239, 'call': ['read', 'convert']}, 'SECRET')
+
+
+@pytest.fixture
+def template():
+    return TransformationTemplate(apikey=APIKEY).resize(width=800).quality(value=80).auto_image()
+
+
+def test_url_for_handle(template):
+    assert template.url_for(HANDLE) == Filelink(HANDLE).resize(width=800).quality(value=80).auto_image().url
+
+
+def test_url_for_signed(template):
+    expected = Filelink(HANDLE).resize(width=800).quality(value=80).auto_image().signed_url(SECURITY)
+    assert template.url_for(HANDLE, security=SECURITY) == expected
+
+
+def test_url_for_external_url(template):
+    assert template.url_for(EXTERNAL_URL) == '{}/{}/resize=width:800/quality=value:80/auto_image/{}'.format(
+        config.CDN_URL, APIKEY, EXTERNAL_URL
+    )
+
+
+def test_external_url_requires_apikey():
+    with pytest.raises(ValueError, match=r'Apikey is required'):
+        TransformationTemplate().flip().url_for(EXTERNAL_URL)
+
+
+def test_urls_for(template):
+    urls = template.urls_for([HANDLE, EXTERNAL_URL, 'OTHER'], security=SECURITY)
+    assert urls == [template.url_for(h, security=SECURITY) for h in (HANDLE, EXTERNAL_URL, 'OTHER')]
+
+
+def test_chaining_does_not_modify_template(template):
+    rotated = template.rotate(deg=90)
+
+    assert template.tasks == ('resize=width:800', 'quality=value:80', 'auto_image')
+    assert rotated.tasks == template.tasks + ('rotate=deg:90',)
+    with pytest.raises(AttributeError):
+        template.tasks = ()
+
+
+def test_empty_template():
+    assert TransformationTemplate().url_for(HANDLE) == Filelink(HANDLE).url
+
+
+def test_from_transformation(template):
+    transformation = Filelink(HANDLE).resize(width=800).quality(value=80).auto_image()
+    assert TransformationTemplate.from_transformation(transformation).url_for('OTHER') == template.url_for('OTHER')
+
+
+def test_av_convert_not_supported(template):
+    with pytest.raises(TypeError):
+        template.av_convert(preset='h264')
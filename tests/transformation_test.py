@@ -338,3 +338,15 @@ def test_auto_image(transform):
     target_url = '{}/{}/auto_image/{}'.format(config.CDN_URL, APIKEY, EXTERNAL_URL)
     auto_image = transform.auto_image()
     assert auto_image.url == target_url
+
+
+def test_url_updated_after_chaining(transform):
+    transform.resize(width=100)
+    assert transform.url == '{}/{}/resize=width:100/{}'.format(config.CDN_URL, APIKEY, EXTERNAL_URL)
+    transform.flip()
+    assert transform.url == '{}/{}/resize=width:100/flip/{}'.format(config.CDN_URL, APIKEY, EXTERNAL_URL)
+
+
+def test_slots(transform):
+    with pytest.raises(AttributeError):
+        transform.unknown_attribute = 1
@@ -0,0 +1,29 @@
+import io
+
+import responses
+
+from filestack import Security
+from filestack.uploads.store import store_upload
+
+STORE_URL = 'https://www.filestackapi.com/api/store/gcs'
+
+
+@responses.activate
+def test_store_upload():
+    responses.add(responses.POST, STORE_URL, json={'url': 'https://cdn.filestackcontent.com/newHandle', 'size': 7})
+    security = Security({'expiry': 123}, 'secret')
+    response = store_upload(
+        'APIKEY', None, io.BytesIO(b'content'), 'S3',
+        params={'location': 'gcs', 'filename': 'a.txt', 'path': 'dir/', 'base64decode': False},
+        security=security
+    )
+
+    assert response['handle'] == 'newHandle'
+    request = responses.calls[0].request
+    assert request.body == b'content'
+    assert request.headers['Content-Type'] == 'application/octet-stream'
+    assert 'Filestack-Trace-Id' in request.headers
+    assert request.params == {
+        'key': 'APIKEY', 'filename': 'a.txt', 'mimetype': 'application/octet-stream', 'path': 'dir/',
+        'base64decode': 'false', 'policy': security.policy_b64, 'signature': security.signature
+    }
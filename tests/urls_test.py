@@ -0,0 +1,24 @@
+from filestack import Filelink, Security, TransformationTemplate
+from filestack import urls
+
+SECURITY = Security({'expiry': 10238239, 'call': ['read', 'convert']}, 'SECRET')
+HANDLES = ['HANDLE1', 'HANDLE2', 'HANDLE3']
+
+
+def test_build_many():
+    assert urls.build_many(HANDLES) == [Filelink(handle).url for handle in HANDLES]
+
+
+def test_build_many_signed_transformation():
+    transformation = Filelink('OTHER').resize(width=400).flip()
+    expected = [Filelink(handle).resize(width=400).flip().signed_url(SECURITY) for handle in HANDLES]
+
+    assert urls.build_many(HANDLES, transformation=transformation, security=SECURITY) == expected
+    template = TransformationTemplate().resize(width=400).flip()
+    assert urls.build_many(HANDLES, transformation=template, security=SECURITY) == expected
+
+
+def test_iter_many():
+    generated = urls.iter_many(iter(HANDLES), security=SECURITY)
+    assert next(generated) == Filelink('HANDLE1').signed_url(SECURITY)
+    assert list(generated) == [Filelink(handle).signed_url(SECURITY) for handle in HANDLES[1:]]
@@ -1,8 +1,12 @@
+import threading
+
 import pytest
 import responses
 
 from filestack import __version__
-from filestack.utils import requests
+from filestack.utils import (
+    requests, make_session, RequestsWrapper, run_many, return_transform_task, cached_transform_task
+)
 
 TEST_URL = 'http://just.some.url/'
 
@@ -34,3 +38,79 @@ def test_req_wrapper_raise_exception():
     responses.add(responses.POST, TEST_URL, status=500, body=b'oops!')
     with pytest.raises(Exception, match='oops!'):
         requests.post(TEST_URL)
+
+
+@responses.activate
+def test_req_wrapper_with_session():
+    responses.add(responses.GET, TEST_URL)
+    session = make_session(pool_size=4)
+    wrapper = RequestsWrapper(session=session)
+    wrapper.get(TEST_URL)
+    wrapper.get(TEST_URL)
+    assert len(responses.calls) == 2
+    assert session.get_adapter(TEST_URL)._pool_maxsize == 4
+    assert 'Filestack-Trace-Id' in responses.calls[0].request.headers
+    trace_ids = [call.request.headers['Filestack-Trace-Id'] for call in responses.calls]
+    assert trace_ids[0] != trace_ids[1]
+
+
+@responses.activate
+def test_req_wrapper_limiter():
+    responses.add(responses.GET, TEST_URL)
+    limiter = threading.BoundedSemaphore(1)
+    wrapper = RequestsWrapper(limiter=limiter)
+
+    limiter.acquire()
+    thread = threading.Thread(target=wrapper.get, args=(TEST_URL,))
+    thread.start()
+    thread.join(0.1)
+    assert len(responses.calls) == 0  # waits for the limiter
+
+    limiter.release()
+    thread.join()
+    assert len(responses.calls) == 1
+
+
+def test_run_many():
+    consumed = []
+
+    def items():
+        for item in range(10):
+            consumed.append(item)
+            yield item
+
+    def func(item):
+        if item == 3:
+            raise ValueError('bad item')
+        return item * 2
+
+    results = run_many(func, items(), max_workers=2, max_pending=2)
+    first = next(results)
+    assert len(consumed) <= 3
+    results = [first] + list(results)
+
+    assert sorted(item for item, _, _ in results) == list(range(10))
+    for item, result, error in results:
+        if item == 3:
+            assert result is None and isinstance(error, ValueError)
+        else:
+            assert result == item * 2 and error is None
+
+
+@pytest.mark.parametrize('params, expected', [
+    ({'width': 100, 'height': 50}, 'resize=height:50,width:100'),
+    ({'mirror': True}, 'resize=mirror:true'),
+    ({'mirror': 1}, 'resize=mirror:1'),
+    ({'dim': [10, 20, 'a b']}, 'resize=dim:[10,20,ab]'),
+    ({'dim': [[1, 2]]}, 'resize=dim:[[1,2]]'),
+    ({}, 'resize'),
+])
+def test_cached_transform_task(params, expected):
+    assert return_transform_task('resize', params) == expected
+    assert cached_transform_task('resize', params) == expected
+    assert cached_transform_task('resize', params) == expected
+
+
+def test_cached_transform_task_skips_none():
+    assert cached_transform_task('resize', {'width': 100, 'height': None}) == 'resize=width:100'
+    assert cached_transform_task('resize', {'width': None, 'dim': [1, 2]}) == 'resize=dim:[1,2]'